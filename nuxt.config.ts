@@ -88,6 +88,9 @@ export default defineNuxtConfig({
     // ── Cronitor ──
     cronitorApiKey: process.env.CRONITOR_API_KEY,
 
+    // ── Partner classifier (scripts/gdd-data serve) ──
+    partnerClassifierUrl: process.env.PARTNER_CLASSIFIER_URL || '',
+
     // ── Clockify ──
     clockifyApiKey: process.env.CLOCKIFY_API_KEY,
 
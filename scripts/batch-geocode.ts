@@ -1,8 +1,8 @@
 /**
  * Batch Geocode Script
  * =====================
- * Geocodes addresses for marketing events and referral partners
- * that don't have coordinates yet.
+ * Geocodes addresses for marketing events, referral partners and
+ * marketing partners that don't have coordinates yet.
  * 
  * Usage: npx tsx scripts/batch-geocode.ts
  */
@@ -161,6 +161,62 @@ async function geocodeReferralPartners() {
   console.log(`\n✅ Partners: ${success} geocoded, ${failed} failed`)
 }
 
+async function geocodeMarketingPartners() {
+  console.log('\n📍 Geocoding Marketing Partners...\n')
+
+  const { data: partners, error } = await supabase
+    .from('marketing_partners')
+    .select('id, name, address')
+    .not('address', 'is', null)
+    .is('latitude', null)
+
+  if (error) {
+    console.error('Failed to fetch partners:', error)
+    return
+  }
+
+  console.log(`Found ${partners?.length || 0} partners needing geocoding\n`)
+
+  let success = 0
+  let failed = 0
+
+  for (const partner of partners || []) {
+    if (!partner.address) continue
+
+    console.log(`Processing: ${partner.name}`)
+    console.log(`  Address: ${partner.address}`)
+
+    const result = await geocodeAddress(partner.address)
+    
+    if (result) {
+      const { error: updateError } = await supabase
+        .from('marketing_partners')
+        .update({
+          latitude: result.lat,
+          longitude: result.lng,
+          place_id: result.place_id,
+          geocoded_address: result.formatted_address
+        })
+        .eq('id', partner.id)
+
+      if (updateError) {
+        console.error(`  ❌ Failed to update: ${updateError.message}`)
+        failed++
+      } else {
+        console.log(`  ✅ Geocoded: ${result.lat}, ${result.lng}`)
+        success++
+      }
+    } else {
+      failed++
+    }
+
+    // Rate limiting
+    await new Promise(resolve => setTimeout(resolve, 100))
+  }
+
+  console.log(`\n✅ Marketing partners: ${success} geocoded, ${failed} failed`)
+}
+
 async function geocodeLocations() {
   console.log('\n📍 Geocoding Clinic Locations...\n')
 
@@ -223,6 +279,7 @@ async function main() {
   await geocodeLocations()
   await geocodeMarketingEvents()
   await geocodeReferralPartners()
+  await geocodeMarketingPartners()
 
   console.log('\n✅ Geocoding complete!')
 }
@@ -0,0 +1,17 @@
+"""
+Shared helpers for the GDD marketing data scripts in scripts/.
+
+The top-level *.py scripts put their own directory on sys.path when run, so
+they can import from this package directly:
+
+    from gdd_data.classify_cache import ClassificationCache
+
+The commands themselves live in this package too and run through one entry
+point, `scripts/gdd-data <command>` (or `python3 -m gdd_data` from scripts/);
+see gdd_data/cli.py. Importing any module here has no side effects - env vars
+are only checked when a command runs.
+
+Tests live in gdd_data/tests and need no Supabase or API keys (fake clients,
+local stand-ins, a temporary GDD_CACHE_DIR): `python -m pytest gdd_data/tests`
+from scripts/.
+"""
@@ -0,0 +1,5 @@
+import sys
+
+from gdd_data.cli import main
+
+sys.exit(main())
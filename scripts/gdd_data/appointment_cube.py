@@ -0,0 +1,347 @@
+"""
+Appointment rollup cube
+=======================
+Precomputed appointment counts and minutes for dashboards, at three
+granularities, each a dense array
+
+    period (day / week / month) x location x type x status
+
+stored as .npy files under $GDD_CACHE_DIR/appointment_cube and opened
+memory-mapped, so any slice - week x type x status for one location, a
+month's status mix - is a sum over precomputed cells, never a pass over rows:
+
+    scripts/gdd-data appointment-cube                           (update, weekly totals)
+    scripts/gdd-data appointment-cube --grain month --by type --location Venice
+    scripts/gdd-data appointment-cube --grain week --by type,status --since 2026-01-01
+    scripts/gdd-data appointment-cube --rebuild                 (start over from all exports)
+
+Facts come from the normalized exports of `gdd-data appointments`
+(gdd_data.appointments): every Appointment Status row is one appointment on
+its start day, typed UNTYPED and weighing round(time to complete / 60)
+minutes; every Appointment Type row is `count` appointments of that type on
+the report date with status 'booked' and its total minutes. Weeks start on
+Monday.
+
+Updates are incremental. The cube remembers which export files (by content
+hash) it holds, plus one fact per appointment key (the same keys
+appointments.merge dedupes on). Only exports it has not seen are read; each of
+their facts is added to every grain with np.add.at, and a fact that replaces
+one from an older export first subtracts the old one - so an export
+overlapping earlier windows moves cells instead of double counting them.
+Axes grow (new days, types, locations) by padding the arrays. Deleting an
+export file does not take its facts out again; --rebuild does.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+
+import numpy as np
+
+from gdd_data import appointments
+from gdd_data.appointments import STATUS, STATUSES, UNKNOWN_LOCATION, Vocabulary, location_name
+from gdd_data.parse_cache import DEFAULT_CACHE_DIR, file_digest
+
+CUBE_DIR = os.path.join(DEFAULT_CACHE_DIR, 'appointment_cube')
+# Bump whenever facts or the stored layout change; a cube of another version is rebuilt
+CUBE_VERSION = 1
+GRAINS = ('day', 'week', 'month')
+AXES = ('period', 'location', 'type', 'status')
+MEASURES = ('count', 'minutes')
+UNTYPED = '(untyped)'
+BOOKED = 'booked'
+CUBE_STATUSES = STATUSES + (BOOKED,)
+FACT_COLUMNS = {'key': 'S12', 'day': np.int32, 'location': np.int16, 'type': np.int16,
+                'status': np.int8, 'count': np.int32, 'minutes': np.int64, 'stamp': np.int64}
+
+
+# ============================================================
+# PERIODS
+# ============================================================
+def period_of(grain, days):
+    """Period numbers of day numbers (days since 1970-01-01)."""
+    days = np.asarray(days, dtype=np.int64)
+    if grain == 'day':
+        return days
+    if grain == 'week':
+        # 1970-01-05 was a Monday
+        return (days - 4) // 7
+    return days.astype('datetime64[D]').astype('datetime64[M]').astype(np.int64)
+
+
+def period_start(grain, period):
+    if grain == 'day':
+        return np.datetime64(int(period), 'D')
+    if grain == 'week':
+        return np.datetime64(int(period) * 7 + 4, 'D')
+    return np.datetime64(int(period), 'M').astype('datetime64[D]')
+
+
+# ============================================================
+# FACTS
+# ============================================================
+def _fact_keys(parts):
+    """12-byte digests of appointment keys, one per row of the `parts` columns."""
+    return np.array([hashlib.blake2b('\x1f'.join(map(str, key)).encode('utf-8'), digest_size=12).digest()
+                     for key in zip(*parts)], dtype='S12')
+
+
+def export_facts(export, locations, types):
+    """One fact per row of a normalized export, coded against the cube's axis vocabularies."""
+    c = export.columns
+    stamp = int(appointments.export_time(export.path).replace('-', '') or 0)
+    if export.kind == STATUS:
+        division = export.decode('division')
+        start = c['start'].astype(np.int64)
+        n = len(start)
+        where = np.array([location_name(d) or UNKNOWN_LOCATION for d in export.vocab['division']], dtype=object)
+        time_to_complete = c['timings'][appointments.TIMINGS.index('time to complete')].astype(np.int64)
+        return {
+            'key': _fact_keys((division, export.decode('animal'), export.decode('owner'), start)),
+            'day': (start // 1440).astype(np.int32),
+            'location': locations.encode(where)[c['division']].astype(np.int16),
+            'type': np.full(n, types.code(UNTYPED), dtype=np.int16),
+            'status': np.asarray(c['status'], dtype=np.int8),
+            'count': np.ones(n, dtype=np.int32),
+            'minutes': (time_to_complete + 30) // 60,
+            'stamp': np.full(n, stamp, dtype=np.int64),
+        }
+    type_names = export.decode('type')
+    n = len(type_names)
+    location = export.meta['location']
+    date = export.meta['report_start']
+    return {
+        'key': _fact_keys(([location] * n, [date] * n, type_names)),
+        'day': np.full(n, np.datetime64(date, 'D').astype(np.int64), dtype=np.int32),
+        'location': np.full(n, locations.code(location), dtype=np.int16),
+        'type': types.encode(export.vocab['type'])[c['type']].astype(np.int16),
+        'status': np.full(n, CUBE_STATUSES.index(BOOKED), dtype=np.int8),
+        'count': np.asarray(c['count'], dtype=np.int32),
+        'minutes': np.asarray(c['total_mins'], dtype=np.int64),
+        'stamp': np.full(n, stamp, dtype=np.int64),
+    }
+
+
+# ============================================================
+# CUBE
+# ============================================================
+class Cube:
+    """Facts plus the per-grain count/minutes arrays; `origin[grain]` is the period of index 0."""
+
+    def __init__(self, meta=None, facts=None, cells=None):
+        meta = meta or {}
+        self.exports = meta.get('exports', {})
+        self.locations = Vocabulary(meta.get('locations', ()))
+        self.types = Vocabulary(meta.get('types', ()))
+        self.origin = meta.get('origin', {})
+        self.facts = facts or {name: np.empty(0, dtype) for name, dtype in FACT_COLUMNS.items()}
+        self.cells = cells or {}
+
+    def __len__(self):
+        return len(self.facts['key'])
+
+    # -- updating ------------------------------------------------------
+    def _fit(self, grain, periods):
+        """Pad the grain's arrays so they cover `periods` and every axis value."""
+        shape = (0, len(self.locations.values), len(self.types.values), len(CUBE_STATUSES))
+        if grain not in self.cells:
+            self.origin[grain] = int(periods.min())
+            self.cells[grain] = {m: np.zeros(shape, np.int64) for m in MEASURES}
+        origin = self.origin[grain]
+        counts = self.cells[grain]['count']
+        before = max(0, origin - int(periods.min()))
+        after = max(0, int(periods.max()) + 1 - (origin + len(counts)))
+        pad = ((before, after),) + tuple((0, want - have) for want, have in zip(shape[1:], counts.shape[1:]))
+        if any(p != (0, 0) for p in pad):
+            for m in MEASURES:
+                self.cells[grain][m] = np.pad(self.cells[grain][m], pad)
+        self.origin[grain] = origin - before
+
+    def _apply(self, facts, sign):
+        if not len(facts['day']):
+            return
+        for grain in GRAINS:
+            periods = period_of(grain, facts['day'])
+            self._fit(grain, periods)
+            at = (periods - self.origin[grain], facts['location'], facts['type'], facts['status'])
+            np.add.at(self.cells[grain]['count'], at, sign * facts['count'].astype(np.int64))
+            np.add.at(self.cells[grain]['minutes'], at, sign * facts['minutes'])
+
+    def add_export(self, export):
+        """
+        Fold one export in. A fact whose key is already held replaces it when
+        this export is newer (first occurrence wins within an export, older
+        exports never replace newer facts). Returns (added, replaced, ignored).
+        """
+        new = export_facts(export, self.locations, self.types)
+        held = {key: i for i, key in enumerate(self.facts['key'].tolist())}
+        fresh, take, replace, ignored = [], {}, [], 0
+        for j, key in enumerate(new['key'].tolist()):
+            i = held.get(key)
+            if i is None:
+                held[key] = ('new', j)
+                fresh.append(j)
+            elif isinstance(i, tuple) or self.facts['stamp'][i] >= new['stamp'][j]:
+                ignored += 1
+            else:
+                take[i] = j
+                held[key] = ('new', j)
+        if take:
+            old = np.fromiter(take, dtype=np.int64, count=len(take))
+            replace = np.fromiter(take.values(), dtype=np.int64, count=len(take))
+            self._apply({k: v[old] for k, v in self.facts.items()}, -1)
+            for k in FACT_COLUMNS:
+                self.facts[k][old] = new[k][replace]
+            self._apply({k: v[replace] for k, v in new.items()}, 1)
+        fresh = np.array(fresh, dtype=np.int64)
+        added = {k: v[fresh] for k, v in new.items()}
+        self._apply(added, 1)
+        self.facts = {k: np.concatenate([self.facts[k], added[k].astype(dtype)]) for k, dtype in FACT_COLUMNS.items()}
+        return len(fresh), len(replace), ignored
+
+    # -- querying ------------------------------------------------------
+    def labels(self, axis, grain):
+        if axis == 'period':
+            n = len(self.cells[grain]['count'])
+            return [str(period_start(grain, self.origin[grain] + i)) for i in range(n)]
+        if axis == 'location':
+            return list(self.locations.values)
+        if axis == 'type':
+            return list(self.types.values)
+        return list(CUBE_STATUSES)
+
+    def slice(self, grain='week', by=('period',), measure='count', since=None, until=None, **filters):
+        """
+        Totals over the cells matching `filters` (location/type/status: a
+        value or list of values) and the since/until dates (inclusive, by
+        period start), kept along the `by` axes in AXES order and summed over
+        the rest. Returns ({axis: labels}, array).
+        """
+        cells = self.cells[grain][measure]
+        index = []
+        for axis in AXES:
+            labels = self.labels(axis, grain)
+            keep = np.arange(len(labels))
+            if axis == 'period':
+                starts = np.array(labels, dtype='datetime64[D]')
+                mask = np.ones(len(labels), dtype=bool)
+                if since:
+                    mask &= starts >= np.datetime64(since, 'D')
+                if until:
+                    mask &= starts <= np.datetime64(until, 'D')
+                keep = keep[mask]
+            elif filters.get(axis):
+                wanted = filters[axis]
+                wanted = {wanted} if isinstance(wanted, str) else set(wanted)
+                keep = np.array([i for i, v in enumerate(labels) if v in wanted], dtype=np.int64)
+            index.append(keep)
+        block = cells[np.ix_(*index)]
+        summed = tuple(i for i, axis in enumerate(AXES) if axis not in by)
+        totals = block.sum(axis=summed)
+        kept = [axis for axis in AXES if axis in by]
+        names = {axis: [self.labels(axis, grain)[i] for i in index[AXES.index(axis)]] for axis in kept}
+        return names, totals
+
+
+# ============================================================
+# STORAGE
+# ============================================================
+def load_cube(directory=CUBE_DIR, mmap_mode='r'):
+    """The stored cube (arrays memory-mapped by default), or None if absent, torn or outdated."""
+    try:
+        with open(os.path.join(directory, 'meta.json'), encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('version') != CUBE_VERSION:
+            return None
+        facts = {name: np.load(os.path.join(directory, f"fact_{name}.npy"), mmap_mode=mmap_mode)
+                 for name in FACT_COLUMNS}
+        cells = {grain: {m: np.load(os.path.join(directory, f"{grain}_{m}.npy"), mmap_mode=mmap_mode)
+                         for m in MEASURES}
+                 for grain in meta['origin']}
+    except (OSError, ValueError, KeyError):
+        return None
+    return Cube(meta, facts, cells)
+
+
+def save_cube(cube, directory=CUBE_DIR):
+    """Write the cube to a fresh directory and swap it in, so readers never see a half-written cube."""
+    tmp = f"{directory}.{os.getpid()}.tmp"
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+    for name, values in cube.facts.items():
+        np.save(os.path.join(tmp, f"fact_{name}.npy"), np.ascontiguousarray(values))
+    for grain, measures in cube.cells.items():
+        for m, values in measures.items():
+            np.save(os.path.join(tmp, f"{grain}_{m}.npy"), _compact(values))
+    with open(os.path.join(tmp, 'meta.json'), 'w', encoding='utf-8') as f:
+        json.dump({'version': CUBE_VERSION, 'exports': cube.exports, 'locations': cube.locations.values,
+                   'types': cube.types.values, 'origin': cube.origin}, f, ensure_ascii=False, indent=1)
+    old = f"{directory}.{os.getpid()}.old"
+    if os.path.exists(directory):
+        os.replace(directory, old)
+    os.replace(tmp, directory)
+    shutil.rmtree(old, ignore_errors=True)
+
+
+def _compact(values):
+    """int32 on disk unless a cell outgrows it."""
+    info = np.iinfo(np.int32)
+    if values.size and (values.min() < info.min or values.max() > info.max):
+        return values
+    return values.astype(np.int32)
+
+
+def update(paths=None, rebuild=False, use_cache=True):
+    """
+    Fold exports the cube has not seen into it and save it. Returns
+    (cube, [(path, added, replaced, ignored)]).
+    """
+    stored = None if rebuild else load_cube(mmap_mode=None)
+    cube = stored if stored is not None else Cube()
+    # Updated in place; widen stored int32 cells back to int64 first
+    cube.cells = {g: {m: np.asarray(v, dtype=np.int64) for m, v in ms.items()} for g, ms in cube.cells.items()}
+    cube.facts = {k: np.array(v, dtype=FACT_COLUMNS[k]) for k, v in cube.facts.items()}
+    report = []
+    for path in appointments.export_paths(paths):
+        digest = file_digest(path)
+        if digest in cube.exports:
+            continue
+        export = appointments.load_export(path, use_cache)
+        if export is None:
+            continue
+        report.append((path, *cube.add_export(export)))
+        cube.exports[digest] = os.path.basename(path)
+    if report or stored is None:
+        save_cube(cube)
+    return cube, report
+
+
+def run(args):
+    start = time.perf_counter()
+    _, report = update(args.exports, rebuild=args.rebuild, use_cache=not args.no_cache)
+    for path, added, replaced, ignored in report:
+        print(f"📥 {os.path.basename(path)}: {added} new facts"
+              + (f", {replaced} replacing older exports" if replaced else '')
+              + (f", {ignored} already held" if ignored else ''))
+    cube = load_cube()
+    if cube is None or not len(cube):
+        print("❌ No appointment facts; nothing in data/Appointments?")
+        return
+    print(f"🧊 {len(cube)} facts from {len(cube.exports)} exports"
+          f"{' (up to date)' if not report else ''} ({1000 * (time.perf_counter() - start):.0f} ms)\n")
+
+    by = tuple(a.strip() for a in args.by.split(',') if a.strip()) if args.by else ()
+    filters = {axis: getattr(args, axis) for axis in ('location', 'type', 'status') if getattr(args, axis)}
+    query_start = time.perf_counter()
+    names, totals = cube.slice(args.grain, ('period',) + by, args.measure, args.since, args.until, **filters)
+    query_ms = 1000 * (time.perf_counter() - query_start)
+    kept = [axis for axis in AXES if axis in names]
+    shown = 0
+    for at in zip(*np.nonzero(totals)):
+        period, *labels = [names[axis][i] for axis, i in zip(kept, at)]
+        print(f"  {period}  " + ''.join(f"{label[:28]:<30}" for label in labels) + f"{int(totals[at]):>8}")
+        shown += 1
+    print(f"\n{shown} non-empty cells of {args.grain} x {' x '.join(kept[1:]) or 'total'} "
+          f"({args.measure}) in {query_ms:.1f} ms")
@@ -0,0 +1,519 @@
+"""
+Appointment export ingestion
+============================
+Reads the EzyVet appointment exports in data/Appointments into columnar,
+memory-mappable tables:
+
+    Appointment Status-*.csv / .xls   one row per appointment: division,
+                                      animal, owner, start time, seconds spent
+                                      in each status, derived status
+    Appointment Type-*.csv            booked appointments per type for one
+                                      location: count, average/total minutes
+
+    scripts/gdd-data appointments                 (all exports)
+    scripts/gdd-data appointments --no-cache      (re-read every export)
+
+CSVs are streamed with csv.reader in chunks of --chunk-size rows; legacy .xls
+exports are read with xlrd (`pip install xlrd`, imported only when one is
+read). Cells go through the same `clean` as the vendor contacts parser. Each
+chunk is normalized straight into compact arrays: text columns are
+dictionary-encoded (int32 codes + vocabulary), start times are
+datetime64[m], durations int32.
+
+Each normalized export is cached under $GDD_CACHE_DIR/appointments/<key>/,
+one .npy file per column plus meta.json (vocabularies, report window), keyed
+on sha256(file bytes) + kind + FORMAT_VERSION like the parsed workbook cache.
+Cached exports are opened with np.load(mmap_mode='r'), so re-reading them
+costs a few page faults instead of a parse.
+
+Exports cover overlapping windows (a monthly .xls and the later CSVs share
+weeks). `merge` keeps one row per key - division + animal + owner + start
+for status rows, location + report date + type for type rows - taking it
+from the newest export (exports sort by the timestamp in their file name).
+"""
+
+import csv
+import glob
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+
+import numpy as np
+
+from gdd_data.med_contacts import clean, deduplicate
+from gdd_data.parse_cache import DEFAULT_CACHE_DIR, file_digest
+
+EXPORTS = 'data/Appointments/Appointment*-*.*'
+CACHE_DIR = os.path.join(DEFAULT_CACHE_DIR, 'appointments')
+# Bump whenever normalization or the cached column layout changes
+FORMAT_VERSION = 1
+CHUNK_SIZE = 5000
+
+STATUS, TYPE = 'status', 'type'
+# Export columns holding seconds spent per status, in export order
+TIMINGS = (
+    'no status', 'unconfirmed', 'confirmed', 'in transit', 'in waiting room',
+    'in consultation', 'in procedure', 'admit for surgery', 'in hospital', 'in discharge',
+    'awaiting collect', 'departed', 'interim report', 'referral done', 'complete',
+    'time to complete',
+)
+# Derived appointment status (codes index this tuple), as upload-status.post.ts derives it
+STATUSES = ('scheduled', 'confirmed', 'in_progress', 'completed')
+LOCATIONS = (('sherman oaks', 'Sherman Oaks'), ('van nuys', 'Van Nuys'), ('venice', 'Venice'))
+UNKNOWN_LOCATION = 'Unknown'
+SUMMARY_OWNERS = ('AVERAGE', 'TOTAL')
+# Type rows that are not booked appointments (facility totals, open slots)
+NOT_BOOKED = ('facility', 'avail')
+
+_EXPORT_STAMP = re.compile(r'-(\d{4}-\d{2}-\d{2}-\d{2}-\d{2}-\d{2})\.')
+_REPORT_DATE = re.compile(r'(\d{1,2})-(\d{1,2})-(\d{4})')
+_SLASH_DATETIME = re.compile(r'^(\d{1,2})[/-](\d{1,2})[/-](\d{4})\s+(\d{2}:\d{2})')
+
+
+# ============================================================
+# NORMALIZATION
+# ============================================================
+def export_kind(path):
+    name = os.path.basename(path).lower()
+    if name.startswith('appointment status-'):
+        return STATUS
+    if name.startswith('appointment type-'):
+        return TYPE
+    return None
+
+
+def location_name(text):
+    """'Green Dog - Sherman Oaks' / 'Venice - Green Dog Facility' -> 'Sherman Oaks' / 'Venice'."""
+    lower = (text or '').lower()
+    for needle, name in LOCATIONS:
+        if needle in lower:
+            return name
+    return None
+
+
+class Vocabulary:
+    """Dictionary encoding of one text column: values -> int32 codes in first-seen order."""
+
+    def __init__(self, values=()):
+        self.values = list(values)
+        self.codes = {v: i for i, v in enumerate(self.values)}
+
+    def code(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def encode(self, values):
+        return np.fromiter((self.code(v) for v in values), dtype=np.int32, count=len(values))
+
+
+def _seconds(val):
+    try:
+        return int(float(val))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _start_minute(val):
+    """'YYYY-MM-DD HH:MM:SS' (or D/M/YYYY HH:MM) -> 'YYYY-MM-DDTHH:MM'; None if unparseable."""
+    if not val:
+        return None
+    if len(val) >= 16 and val[4] == '-' and val[10] in ' T':
+        return f"{val[:10]}T{val[11:16]}"
+    m = _SLASH_DATETIME.match(val)
+    if not m:
+        return None
+    day, month, year, hm = m.groups()
+    day, month = int(day), int(month)
+    if month > 12 >= day:
+        day, month = month, day
+    return f"{year}-{month:02d}-{day:02d}T{hm}"
+
+
+def _report_date(value):
+    """EzyVet 'MM-DD-YYYY h:mma' -> 'YYYY-MM-DD' (None if absent)."""
+    m = _REPORT_DATE.search(value or '')
+    if not m:
+        return None
+    month, day, year = m.groups()
+    return f"{year}-{int(month):02d}-{int(day):02d}"
+
+
+class StatusChunks:
+    """Accumulates normalized Appointment Status rows chunk by chunk."""
+
+    def __init__(self, header):
+        index = {h.lower(): i for i, h in enumerate(header) if h}
+        self.division, self.animal, self.owner, self.start = (
+            index['division'], index['animal'], index['owner'], index['appointment date/time'])
+        self.timing_cols = [index.get(t) for t in TIMINGS]
+        self.vocab = {'division': Vocabulary(), 'animal': Vocabulary(), 'owner': Vocabulary()}
+        self.parts = []
+
+    def add(self, rows):
+        divisions, animals, owners, starts, timings = [], [], [], [], []
+        for cells in rows:
+            n = len(cells)
+
+            def cell(col):
+                return clean(cells[col]) if col is not None and col < n else None
+
+            owner, animal = cell(self.owner), cell(self.animal)
+            if not owner or owner in SUMMARY_OWNERS or not animal:
+                continue
+            start = _start_minute(cell(self.start))
+            if start is None:
+                continue
+            divisions.append(cell(self.division) or '')
+            animals.append(animal)
+            owners.append(owner)
+            starts.append(start)
+            timings.append([_seconds(cells[c]) if c is not None and c < n else 0
+                            for c in self.timing_cols])
+        if not starts:
+            return
+        timings = np.array(timings, dtype=np.int32).T
+        self.parts.append({
+            'division': self.vocab['division'].encode(divisions),
+            'animal': self.vocab['animal'].encode(animals),
+            'owner': self.vocab['owner'].encode(owners),
+            'start': np.array(starts, dtype='datetime64[m]'),
+            'timings': timings,
+            'status': derive_status(timings),
+        })
+
+    def columns(self):
+        if not self.parts:
+            return {'division': np.empty(0, np.int32), 'animal': np.empty(0, np.int32),
+                    'owner': np.empty(0, np.int32), 'start': np.empty(0, 'datetime64[m]'),
+                    'timings': np.empty((len(TIMINGS), 0), np.int32), 'status': np.empty(0, np.int8)}
+        axis = {'timings': 1}
+        return {k: np.concatenate([p[k] for p in self.parts], axis=axis.get(k, 0)) for k in self.parts[0]}
+
+
+def derive_status(timings):
+    """Status codes (into STATUSES) from the per-status seconds, one column per appointment."""
+    t = {name: timings[i] for i, name in enumerate(TIMINGS)}
+    status = np.zeros(timings.shape[1], dtype=np.int8)
+    status[(t['confirmed'] > 0) | (t['in waiting room'] > 0) | (t['in transit'] > 0)] = 1
+    status[(t['in consultation'] > 0) | (t['in procedure'] > 0) | (t['in hospital'] > 0)] = 2
+    status[(t['complete'] > 0) | (t['departed'] > 0)] = 3
+    return status
+
+
+class TypeChunks:
+    """Accumulates normalized Appointment Type rows; the facility row names the location."""
+
+    def __init__(self, header):
+        lowered = [h.lower() for h in header]
+        self.type, self.count = lowered.index('type'), lowered.index('count')
+        self.average = next((i for i, h in enumerate(lowered) if 'average time' in h), None)
+        self.total = next((i for i, h in enumerate(lowered) if 'total time' in h), None)
+        self.vocab = {'type': Vocabulary()}
+        self.location = None
+        self.types, self.counts, self.averages, self.totals = [], [], [], []
+
+    def add(self, rows):
+        for cells in rows:
+            n = len(cells)
+            name = clean(cells[self.type]) if self.type < n else None
+            if not name or name.lower() == 'totals':
+                continue
+            lower = name.lower()
+            if self.location is None:
+                self.location = location_name(name) if 'facility' in lower else None
+            count = _seconds(cells[self.count]) if self.count < n else 0
+            if not count or any(word in lower for word in NOT_BOOKED):
+                continue
+            self.types.append(name)
+            self.counts.append(count)
+            self.averages.append(_seconds(cells[self.average]) if self.average is not None and self.average < n else 0)
+            self.totals.append(_seconds(cells[self.total]) if self.total is not None and self.total < n else 0)
+
+    def columns(self):
+        return {
+            'type': self.vocab['type'].encode(self.types),
+            'count': np.array(self.counts, dtype=np.int32),
+            'average_mins': np.array(self.averages, dtype=np.int32),
+            'total_mins': np.array(self.totals, dtype=np.int32),
+        }
+
+
+def _is_header(kind, cells):
+    lowered = {(c or '').strip().lower() for c in cells}
+    if kind == STATUS:
+        return {'division', 'animal', 'owner'} <= lowered
+    return {'type', 'count'} <= lowered
+
+
+def _read_metadata(meta, cells):
+    """Label/value pairs of the report banner ('Active Division', 'Report Start Date', ...)."""
+    for i, cell in enumerate(cells[:-1]):
+        label = (cell or '').strip().lower()
+        value = clean(cells[i + 1])
+        if label in ('active division', 'report start date', 'report end date', 'created at') and value:
+            meta.setdefault(label, value)
+
+
+def _csv_rows(path):
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        yield from csv.reader(f)
+
+
+def _xls_rows(path):
+    try:
+        import xlrd
+    except ImportError:
+        print('❌ reading legacy .xls exports needs xlrd: pip install xlrd', file=sys.stderr)
+        sys.exit(1)
+
+    # EzyVet writes the .xls with PhpSpreadsheet, whose compound-document
+    # directory xlrd flags as corrupt; the data itself reads fine
+    with open(os.devnull, 'w') as quiet:
+        book = xlrd.open_workbook(path, ignore_workbook_corruption=True, logfile=quiet)
+    sheet = book.sheet_by_index(0)
+    for r in range(sheet.nrows):
+        yield [v if isinstance(v, str) else repr(v) if isinstance(v, float) else str(v)
+               for v in sheet.row_values(r)]
+
+
+def read_export(path, chunk_size=CHUNK_SIZE):
+    """
+    Normalize one export. Returns (meta, columns, vocab) - vocab maps each
+    dictionary-encoded column to its values - or None if the export has no
+    header row.
+    """
+    kind = export_kind(path)
+    rows = _xls_rows(path) if path.lower().endswith('.xls') else _csv_rows(path)
+    meta = {}
+    chunks = None
+    for i, cells in enumerate(rows):
+        if _is_header(kind, cells):
+            header = [(c or '').strip() for c in cells]
+            chunks = StatusChunks(header) if kind == STATUS else TypeChunks(header)
+            break
+        if i >= 20:
+            return None
+        _read_metadata(meta, cells)
+    if chunks is None:
+        return None
+
+    chunk = []
+    for cells in rows:
+        chunk.append(cells)
+        if len(chunk) >= chunk_size:
+            chunks.add(chunk)
+            chunk = []
+    chunks.add(chunk)
+
+    exported = export_time(path)[:10] or None
+    info = {
+        'kind': kind,
+        'file': os.path.basename(path),
+        'exported': exported,
+        'division': meta.get('active division'),
+        'report_start': _report_date(meta.get('report start date')),
+        'report_end': _report_date(meta.get('report end date')),
+    }
+    if kind == TYPE:
+        info['location'] = (location_name(info['division']) or chunks.location or UNKNOWN_LOCATION)
+        # Type exports without a banner are dated by the day they were exported
+        info['report_start'] = info['report_start'] or exported
+        info['report_end'] = info['report_end'] or info['report_start']
+    vocab = {name: v.values for name, v in chunks.vocab.items()}
+    return info, chunks.columns(), vocab
+
+
+# ============================================================
+# COLUMNAR CACHE
+# ============================================================
+class Export:
+    """One normalized export: meta, columns (read-only, memory-mapped when cached) and vocabularies."""
+
+    def __init__(self, path, meta, columns, vocab, cached=False):
+        self.path = path
+        self.meta = meta
+        self.columns = columns
+        self.vocab = vocab
+        self.cached = cached
+
+    @property
+    def kind(self):
+        return self.meta['kind']
+
+    def __len__(self):
+        return len(self.columns['status' if self.kind == STATUS else 'count'])
+
+    def decode(self, name):
+        """Text values of a dictionary-encoded column."""
+        return np.array(self.vocab[name], dtype=object)[self.columns[name]]
+
+
+def _cache_path(path):
+    spec = f"{file_digest(path)}\0{export_kind(path)}\0{FORMAT_VERSION}"
+    return os.path.join(CACHE_DIR, hashlib.sha256(spec.encode('utf-8')).hexdigest())
+
+
+def _load(directory):
+    try:
+        with open(os.path.join(directory, 'meta.json'), encoding='utf-8') as f:
+            meta = json.load(f)
+        columns = {name: np.load(os.path.join(directory, name + '.npy'), mmap_mode='r')
+                   for name in meta['columns']}
+    except (OSError, ValueError, KeyError):
+        # Missing or torn: read the export again
+        return None
+    return meta['meta'], columns, meta['vocab']
+
+
+def _store(directory, meta, columns, vocab):
+    tmp = f"{directory}.{os.getpid()}.tmp"
+    os.makedirs(tmp, exist_ok=True)
+    for name, values in columns.items():
+        np.save(os.path.join(tmp, name + '.npy'), np.ascontiguousarray(values))
+    with open(os.path.join(tmp, 'meta.json'), 'w', encoding='utf-8') as f:
+        json.dump({'meta': meta, 'columns': list(columns), 'vocab': vocab}, f, ensure_ascii=False)
+    try:
+        os.replace(tmp, directory)
+    except OSError:
+        # Another run stored the same export first
+        for name in os.listdir(tmp):
+            os.remove(os.path.join(tmp, name))
+        os.rmdir(tmp)
+
+
+def load_export(path, use_cache=True, chunk_size=CHUNK_SIZE):
+    """Normalized export from the cache, reading (and caching) it on a miss. None if unreadable."""
+    directory = _cache_path(path)
+    if use_cache:
+        loaded = _load(directory)
+        if loaded is not None:
+            return Export(path, *loaded, cached=True)
+    read = read_export(path, chunk_size)
+    if read is None:
+        return None
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    _store(directory, *read)
+    return Export(path, *read)
+
+
+def export_paths(paths=None):
+    """Appointment Status/Type exports, oldest first (EzyVet stamps the export time in the name)."""
+    paths = paths or glob.glob(EXPORTS)
+    paths = [p for p in paths if export_kind(p) and p.lower().endswith(('.csv', '.xls'))]
+    return sorted(paths, key=lambda p: (export_time(p), os.path.basename(p)))
+
+
+def export_time(path):
+    """'YYYY-MM-DD-HH-MM-SS' stamped in the export's file name ('' if absent)."""
+    m = _EXPORT_STAMP.search(os.path.basename(path))
+    return m.group(1) if m else ''
+
+
+# ============================================================
+# MERGING
+# ============================================================
+def _row_keys(export, vocab):
+    """Per-row dedup keys of one export, with its text codes translated into the merged `vocab`."""
+    c = export.columns
+    if export.kind == STATUS:
+        codes = {name: vocab[name].encode(export.vocab[name])[c[name]] for name in ('division', 'animal', 'owner')}
+        return list(zip(codes['division'].tolist(), codes['animal'].tolist(), codes['owner'].tolist(),
+                        c['start'].astype(np.int64).tolist())), codes
+    codes = {'type': vocab['type'].encode(export.vocab['type'])[c['type']]}
+    location = export.meta['location']
+    date = export.meta['report_start']
+    return [(location, date, t) for t in codes['type'].tolist()], codes
+
+
+def merge(exports, kind):
+    """
+    One table from all exports of `kind`, one row per key, the newest export
+    winning. Returns (columns, vocab, {export path: rows dropped as repeated or superseded}).
+    """
+    exports = [e for e in exports if e.kind == kind]
+    names = ('division', 'animal', 'owner') if kind == STATUS else ('type',)
+    vocab = {name: Vocabulary() for name in names}
+    kept = []
+    row_codes = []
+    # Newest first: deduplicate keeps the rows already merged over later duplicates
+    for i, export in enumerate(reversed(exports)):
+        keys, codes = _row_keys(export, vocab)
+        row_codes.append(codes)
+        kept = deduplicate(kept, [(key, i, r) for r, key in enumerate(keys)], key=lambda row: row[0])
+
+    superseded = {}
+    parts = []
+    for i, export in enumerate(reversed(exports)):
+        rows = np.array([r for _, e, r in kept if e == i], dtype=np.int64)
+        superseded[export.path] = len(export) - len(rows)
+        part = {name: row_codes[i][name][rows] for name in names}
+        for name, values in export.columns.items():
+            if name not in part:
+                part[name] = values[..., rows]
+        if kind == TYPE:
+            part['location'] = np.full(len(rows), export.meta['location'], dtype=object)
+            part['date'] = np.full(len(rows), export.meta['report_start'], dtype='datetime64[D]')
+        parts.append(part)
+    if not parts:
+        return None, {}, superseded
+    columns = {name: np.concatenate([p[name] for p in parts], axis=-1) for name in parts[0]}
+    if kind == STATUS:
+        division = np.array(vocab['division'].values, dtype=object)
+        locations = np.array([location_name(d) or UNKNOWN_LOCATION for d in division], dtype=object)
+        columns['location'] = locations[columns['division']] if len(division) else np.empty(0, object)
+    return columns, {name: v.values for name, v in vocab.items()}, superseded
+
+
+def load_exports(paths=None, use_cache=True, chunk_size=CHUNK_SIZE):
+    exports = []
+    for path in export_paths(paths):
+        export = load_export(path, use_cache, chunk_size)
+        if export is not None:
+            exports.append(export)
+    return exports
+
+
+def run(args):
+    start = time.perf_counter()
+    exports = load_exports(args.exports, use_cache=not args.no_cache, chunk_size=args.chunk_size)
+    if not exports:
+        print(f"❌ No appointment exports matching {EXPORTS}")
+        return
+    read_ms = 1000 * (time.perf_counter() - start)
+
+    for kind, label in ((STATUS, 'appointments'), (TYPE, 'type rows')):
+        columns, vocab, superseded = merge(exports, kind)
+        if columns is None:
+            continue
+        print(f"📥 Appointment {kind.title()} exports:")
+        for e in exports:
+            if e.kind != kind:
+                continue
+            where = e.meta.get('location') or e.meta.get('division') or ''
+            dupes = superseded[e.path]
+            print(f"   {e.meta['file']}: {len(e)} {label}{f' ({where})' if where else ''}"
+                  + (f", {dupes} repeated or superseded by a newer export" if dupes else '')
+                  + (' [cached]' if e.cached else ''))
+        n = len(columns['location'])
+        if kind == STATUS:
+            starts = columns['start']
+            print(f"   {n} {label}, {starts.min().astype('datetime64[D]')} .. "
+                  f"{starts.max().astype('datetime64[D]')}")
+            names, counts = np.unique(columns['location'].astype(str), return_counts=True)
+            for name, count in zip(names, counts):
+                mine = columns['location'] == name
+                by_status = np.bincount(columns['status'][mine], minlength=len(STATUSES))
+                print(f"     {name:<14} {count:>6}  " + '  '.join(
+                    f"{s} {c}" for s, c in zip(STATUSES, by_status) if c))
+        else:
+            print(f"   {n} {label}, {int(columns['count'].sum())} booked appointments "
+                  f"in {len(vocab['type'])} types")
+        print()
+    cached = sum(e.cached for e in exports)
+    print(f"✅ {len(exports)} exports ({cached} from the cache in {CACHE_DIR}) in {read_ms:.0f} ms")
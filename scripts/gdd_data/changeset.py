@@ -0,0 +1,57 @@
+"""
+Partner changesets
+==================
+`gdd-data plan` writes the per-partner field changes a run would make to a
+changeset file instead of the database; `gdd-data apply <file>` pushes it.
+
+The file is JSON lines: a header, then one record per changed partner:
+
+    {"changeset": 2, "created": "...", "stages": [...], "ruleset": "..."}
+    {"id": "<uuid>", "name": "Venice Dog Groomers", "updated_at": "...",
+     "set": {"area": "Westside & Coastal"}}
+
+`updated_at` is the value the change was computed from. Applying goes through
+the partner outbox (gdd_data.outbox), so every change is conditional on it: a
+partner edited in the UI after the plan was made is reported, not overwritten.
+"""
+
+import json
+import os
+import time
+
+DEFAULT_CACHE_DIR = os.environ.get("GDD_CACHE_DIR", ".cache/gdd-data")
+FORMAT_VERSION = 2
+
+
+def default_changeset_path(job):
+    return os.path.join(DEFAULT_CACHE_DIR, 'changesets', f"{job}-{time.strftime('%Y%m%d-%H%M%S')}.jsonl")
+
+
+class ChangesetWriter:
+    def __init__(self, path, **header):
+        self.path = path
+        self.count = 0
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self.f = open(self.path, 'w')
+        self._write({'changeset': FORMAT_VERSION, 'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                     **header})
+
+    def _write(self, record):
+        self.f.write(json.dumps(record, separators=(',', ':'), ensure_ascii=False) + '\n')
+
+    def add(self, key, name, updates, updated_at):
+        self.count += 1
+        self._write({'id': key, 'name': name, 'updated_at': updated_at, 'set': updates})
+
+    def close(self):
+        self.f.close()
+
+
+def read_changeset(path):
+    """(header, [change records]) from a changeset file."""
+    with open(path) as f:
+        header = json.loads(f.readline())
+        if header.get('changeset') != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} changeset; re-run plan")
+        return header, [json.loads(line) for line in f if line.strip()]
+
@@ -0,0 +1,176 @@
+"""
+Persistent classification cache
+===============================
+SQLite-backed cache for the rule functions in gdd_data.rules
+(categorize_partner, determine_area).
+
+Entries are keyed on a hash of the inputs, with the free text (name, address)
+lowercased. The whole cache is tagged with a hash of the rule tables and rule
+function bodies, so editing a keyword list, a zone neighborhood or a
+known-business entry wipes it automatically on the next run. Size is bounded:
+once more than `max_entries` rows exist the least recently used ones are
+evicted.
+
+The connection runs in autocommit mode on a WAL journal: every put (and
+LRU touch) is committed as it happens, so a crashed worker loses nothing,
+readers never block the writer, and two processes (`gdd-data watch` next to
+`gdd-data partners`) can share the default file - a writer waits up to
+BUSY_TIMEOUT seconds for the other's write to finish. Shard workers still
+get their own file via `shard` to keep them off one another's write lock.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+DEFAULT_CACHE_DIR = os.environ.get("GDD_CACHE_DIR", ".cache/gdd-data")
+DEFAULT_MAX_ENTRIES = 50_000
+BUSY_TIMEOUT = 30.0
+
+_MISSING = object()
+
+
+def _hash_code(code, h):
+    """Feed a code object (bytecode + constants, recursively) into a hash."""
+    h.update(code.co_code)
+    for const in code.co_consts:
+        if hasattr(const, 'co_code'):
+            _hash_code(const, h)
+        else:
+            h.update(repr(const).encode('utf-8'))
+    for name in code.co_names:
+        h.update(name.encode('utf-8'))
+
+
+def ruleset_hash(tables, functions=()):
+    """
+    Hash rule tables (dicts/lists of plain data) plus rule functions.
+
+    Function bodies are hashed from their bytecode and constants, which covers
+    keyword lists written inline in categorize_partner/determine_area.
+    """
+    h = hashlib.sha256()
+    h.update(json.dumps(tables, sort_keys=True, default=str).encode('utf-8'))
+    for fn in functions:
+        h.update(fn.__qualname__.encode('utf-8'))
+        _hash_code(fn.__code__, h)
+    return h.hexdigest()
+
+
+# Bumped whenever make_key() changes, so keys of an older scheme never match
+KEY_VERSION = 2
+
+# Positions of the free-text inputs (name, address) the rule functions only
+# ever read lowercased. Everything else - partner_type above all, which
+# categorize_partner compares and returns as is - keys the cache unchanged.
+FREE_TEXT_INPUTS = {
+    'type': (0,),           # categorize_partner(name, partner_type, services, notes, category)
+    'area': (0, 1),         # determine_area(name, address, notes, proximity)
+    'known_area': (0,),     # match_known_area(name)
+}
+
+
+def normalize_inputs(kind, *values):
+    """Lowercase the free-text inputs of `kind`; other inputs are kept exactly."""
+    text = FREE_TEXT_INPUTS.get(kind, ())
+    return [v.lower() if i in text and isinstance(v, str) else v for i, v in enumerate(values)]
+
+
+class ClassificationCache:
+    """LRU-bounded on-disk cache of rule results, invalidated on ruleset change."""
+
+    def __init__(self, ruleset, path=None, max_entries=DEFAULT_MAX_ENTRIES, shard=None):
+        suffix = f"-{shard[0]}of{shard[1]}" if shard else ''
+        self.path = path or os.path.join(DEFAULT_CACHE_DIR, f'classification{suffix}.sqlite')
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        # Opened by the caller but used from pipeline stage threads (classify, and
+        # write when a conflicting row is re-classified)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT, isolation_level=None,
+                                    check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        # A lost last write only costs a recomputation; skip the fsync per commit
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (k TEXT PRIMARY KEY, v TEXT);
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                last_used REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_entries_last_used ON entries(last_used);
+        """)
+        row = self.conn.execute("SELECT v FROM meta WHERE k = 'ruleset'").fetchone()
+        if not row or row[0] != ruleset:
+            # Rules changed (or fresh cache) - every stored result is stale
+            with self.conn:
+                self.conn.execute("BEGIN IMMEDIATE")
+                self.conn.execute("DELETE FROM entries")
+                self.conn.execute("INSERT OR REPLACE INTO meta (k, v) VALUES ('ruleset', ?)", (ruleset,))
+        self._count = self.conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    @staticmethod
+    def make_key(kind, *inputs):
+        payload = json.dumps([KEY_VERSION, kind, normalize_inputs(kind, *inputs)], separators=(',', ':'))
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key, default=None):
+        with self.lock:
+            row = self.conn.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return default
+            self.conn.execute("UPDATE entries SET last_used = ? WHERE key = ?", (time.time(), key))
+        return json.loads(row[0])
+
+    def put(self, key, value):
+        with self.lock:
+            payload, now = json.dumps(value), time.time()
+            cur = self.conn.execute(
+                "UPDATE entries SET value = ?, last_used = ? WHERE key = ?", (payload, now, key))
+            if cur.rowcount:
+                return
+            # Only a new key grows the cache; OR REPLACE covers another process inserting it meanwhile
+            self.conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, last_used) VALUES (?, ?, ?)",
+                (key, payload, now)
+            )
+            self._count += 1
+            if self._count > self.max_entries:
+                self._evict()
+
+    def _evict(self):
+        """Drop least recently used rows, leaving ~10% headroom to amortize evictions."""
+        keep = int(self.max_entries * 0.9)
+        self.conn.execute(
+            "DELETE FROM entries WHERE key IN "
+            "(SELECT key FROM entries ORDER BY last_used ASC LIMIT ?)",
+            (self._count - keep,)
+        )
+        self._count = self.conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def lookup(self, kind, inputs, compute):
+        """Return the cached result for `kind`/`inputs`, computing it on a miss."""
+        key = self.make_key(kind, *inputs)
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            self.hits += 1
+            return value
+        self.misses += 1
+        value = compute(*inputs)
+        self.put(key, value)
+        return value
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
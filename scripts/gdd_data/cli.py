@@ -0,0 +1,275 @@
+"""
+gdd-data command line
+=====================
+Single entry point for the data scripts:
+
+    scripts/gdd-data parse-contacts
+    scripts/gdd-data load [inventory ...] [--dry-run]  (parsed marketing CSVs)
+    scripts/gdd-data categorize | enrich | area     (one partner stage)
+    scripts/gdd-data partners                       (all partner stages)
+    scripts/gdd-data partners --workers 4           (or --shard 2/4 per machine)
+    scripts/gdd-data plan [--stage area] [-o file]  (changeset, no writes)
+    scripts/gdd-data apply <changeset>
+    scripts/gdd-data flush                          (writes left queued offline)
+    scripts/gdd-data referrer-revenue [--dry-run]   (partner revenue rollups)
+    scripts/gdd-data appointments [--no-cache]      (appointment exports -> columnar cache)
+    scripts/gdd-data appointment-cube [--grain week --by type,status]  (dashboard rollups)
+    scripts/gdd-data snapshot
+    scripts/gdd-data impact [--against HEAD]        (rule edit preview)
+    scripts/gdd-data watch                          (LISTEN/NOTIFY worker)
+    scripts/gdd-data serve [--port 8787]            (classification HTTP service)
+    scripts/gdd-data proximity [--near venice --within 3 --type groomer]
+
+Only argparse is imported up front. Each command's module - and whatever it
+pulls in (rule tables, numpy, openpyxl) - is imported when that command runs,
+so `--help` and small commands start quickly.
+"""
+
+import argparse
+import importlib
+import os
+import sys
+
+PARTNER_STAGES = ('categorize', 'enrich', 'area')
+GEOCODE_BACKENDS = ('nominatim', 'google')
+
+
+def _parse_args(parser):
+    parser.add_argument('--workbook',
+                        help='vendor contacts workbook to parse (default: data/marketing/Med COntacts 1.xlsx)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='parse the workbook again even if its parsed sheets are cached')
+    parser.add_argument('--delta', action='store_true',
+                        help='write only rows inserted/updated/removed since the last import as a new '
+                             'migration, instead of regenerating the full seed')
+
+
+def _partner_args(parser):
+    parser.add_argument('--provider', default=os.environ.get('ENRICHMENT_PROVIDER', 'local'),
+                        help='enrichment provider spec, e.g. "local" or "local,google"')
+    parser.add_argument('--rate', type=float, default=5.0,
+                        help='max remote enrichment lookups per second (default 5)')
+    parser.add_argument('--geocode', choices=GEOCODE_BACKENDS,
+                        help='geocode area-less partners without coordinates before area assignment')
+    parser.add_argument('--geocode-rate', type=float,
+                        help='max geocoding requests per second (default 1 for nominatim, '
+                             'as its usage policy asks; 50 for google)')
+    parser.add_argument('--page-size', type=int, default=500,
+                        help='rows per fetched page; fetch, lookup, classify and write overlap by page')
+
+
+def _stage_arg(parser):
+    parser.add_argument('--stage', choices=PARTNER_STAGES,
+                        help='run a single stage (same as the stage subcommand)')
+
+
+def _shard(value):
+    k, _, n = value.partition('/')
+    try:
+        k, n = int(k), int(n)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected K/N, e.g. 2/4, not {value!r}")
+    if not 1 <= k <= n:
+        raise argparse.ArgumentTypeError(f"shard {value} is out of range (1 <= K <= N)")
+    return k, n
+
+
+def _write_args(parser):
+    _partner_args(parser)
+    parser.add_argument('--resume', action='store_true',
+                        help='continue an interrupted run from its journal checkpoint')
+    parser.add_argument('--batch-size', type=int, default=200,
+                        help='max partners per bulk write from the outbox (default 200)')
+    parser.add_argument('--flush-timeout', type=float, default=120.0,
+                        help='seconds to wait at the end for queued writes (default 120); '
+                             'the rest stays queued for the next run')
+    parallel = parser.add_mutually_exclusive_group()
+    parallel.add_argument('--shard', type=_shard,
+                          help='process only id partition K of N (run one per machine/core)')
+    parallel.add_argument('--workers', type=int, default=1,
+                          help='run all N id partitions in N local processes')
+
+
+def _all_stages_args(parser):
+    _stage_arg(parser)
+    _write_args(parser)
+
+
+def _plan_args(parser):
+    _stage_arg(parser)
+    _partner_args(parser)
+    parser.add_argument('-o', '--output',
+                        help='changeset file (default $GDD_CACHE_DIR/changesets/partners-<time>.jsonl)')
+
+
+def _apply_args(parser):
+    parser.add_argument('changeset', help='changeset file written by plan')
+    parser.add_argument('--batch-size', type=int, default=200,
+                        help='max partners per bulk write (default 200)')
+    parser.add_argument('--flush-timeout', type=float, default=120.0,
+                        help='seconds to keep retrying before leaving the rest queued (default 120)')
+
+
+def _load_args(parser):
+    parser.add_argument('specs', nargs='*',
+                        help='load specs to run, e.g. inventory events_completed (default: all)')
+    parser.add_argument('--dir', default='data/marketing/parsed',
+                        help='directory holding the CSVs (default data/marketing/parsed)')
+    parser.add_argument('--batch-size', type=int, default=500,
+                        help='rows per streamed batch / bulk upsert (default 500)')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='parse and coerce only; no Supabase credentials needed')
+
+
+def _referrer_revenue_args(parser):
+    parser.add_argument('exports', nargs='*',
+                        help='Referrer Revenue .xls exports (default: data/Appointments/Referrer Revenue-*.xls)')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='aggregate and match only; write nothing')
+
+
+def _appointments_args(parser):
+    parser.add_argument('exports', nargs='*',
+                        help='Appointment Status/Type exports (default: data/Appointments/Appointment*-*)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='read every export again even if its columns are cached')
+    parser.add_argument('--chunk-size', type=int, default=5000,
+                        help='CSV rows normalized per chunk (default 5000)')
+
+
+def _appointment_cube_args(parser):
+    parser.add_argument('exports', nargs='*',
+                        help='Appointment Status/Type exports (default: data/Appointments/Appointment*-*)')
+    parser.add_argument('--rebuild', action='store_true',
+                        help='discard the stored cube and fold in every export again')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='re-read new exports even if their columns are cached')
+    parser.add_argument('--grain', choices=('day', 'week', 'month'), default='week',
+                        help='period granularity of the printed slice (default week)')
+    parser.add_argument('--by', default='',
+                        help='axes to break the slice down by besides period, e.g. type,status')
+    parser.add_argument('--measure', choices=('count', 'minutes'), default='count')
+    parser.add_argument('--location', help='only this location (e.g. Venice)')
+    parser.add_argument('--type', help='only this appointment type')
+    parser.add_argument('--status', help='only this status (scheduled, confirmed, in_progress, completed, booked)')
+    parser.add_argument('--since', help='first period start to show (YYYY-MM-DD)')
+    parser.add_argument('--until', help='last period start to show (YYYY-MM-DD)')
+
+
+def _flush_args(parser):
+    parser.add_argument('outbox', nargs='*',
+                        help='outbox files (default: every file in $GDD_CACHE_DIR/outbox)')
+    parser.add_argument('--batch-size', type=int, default=200,
+                        help='max partners per bulk write (default 200)')
+    parser.add_argument('--timeout', type=float, default=120.0,
+                        help='seconds to keep retrying before leaving the rest queued (default 120)')
+
+
+def _snapshot_args(parser):
+    parser.add_argument('-o', '--output',
+                        help='snapshot file (default $GDD_CACHE_DIR/snapshots/marketing_partners.jsonl)')
+
+
+def _impact_args(parser):
+    parser.add_argument('--against', default='HEAD',
+                        help='old rules: a git revision of gdd_data/rules.py or a file path (default HEAD)')
+    parser.add_argument('--snapshot', help='snapshot file (default: the one `snapshot` writes)')
+    parser.add_argument('--json', action='store_true', help='print the changed partners as JSON')
+
+
+def _watch_args(parser):
+    parser.add_argument('--provider', default=os.environ.get('ENRICHMENT_PROVIDER', 'local'),
+                        help='enrichment provider spec, e.g. "local" or "local,google"')
+    parser.add_argument('--rate', type=float, default=5.0,
+                        help='max remote enrichment lookups per second (default 5)')
+    parser.add_argument('--window', type=float, default=0.25,
+                        help='seconds to keep collecting a burst of changes into one batch (default 0.25)')
+    parser.add_argument('--max-batch', type=int, default=200,
+                        help='max partners per batch (default 200)')
+
+
+def _serve_args(parser):
+    parser.add_argument('--host', default='127.0.0.1', help='bind address (default 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8787, help='port (default 8787)')
+    parser.add_argument('--window', type=float, default=2.0,
+                        help='ms to coalesce concurrent /classify requests (default 2)')
+    parser.add_argument('--max-batch', type=int, default=256,
+                        help='max requests per micro-batch (default 256)')
+
+
+def _proximity_args(parser):
+    parser.add_argument('--near', help='clinic code or name fragment for a territory query')
+    parser.add_argument('--within', type=float, default=3.0, help='radius in miles (default 3)')
+    parser.add_argument('--type', dest='partner_type', help='only this partner_type')
+    parser.add_argument('--batch-size', type=int, default=200,
+                        help='max partners per bulk write (default 200)')
+    parser.add_argument('--flush-timeout', type=float, default=120.0,
+                        help='seconds to wait for queued writes (default 120); '
+                             'the rest stays queued for the next run')
+
+
+# name: (module, help, add_arguments, fixed argument values)
+COMMANDS = {
+    'parse-contacts': ('gdd_data.med_contacts',
+                       'parse Med Contacts 1.xlsx into the med_contacts seed SQL/JSON', _parse_args, {}),
+    'load': ('gdd_data.csv_loader',
+             'bulk-upsert the parsed marketing CSVs (data/marketing/parsed) into Supabase',
+             _load_args, {}),
+    'partners': ('gdd_data.partners',
+                 'categorize, enrich and assign areas to marketing partners', _all_stages_args, {}),
+    'plan': ('gdd_data.partners:plan',
+             'compute partner changes into a changeset file without writing', _plan_args, {}),
+    'apply': ('gdd_data.partners:apply',
+              'push a changeset from plan in bulk, skipping partners edited since', _apply_args, {}),
+    'flush': ('gdd_data.outbox',
+              'send partner writes left queued in the local outbox', _flush_args, {}),
+    **{stage: ('gdd_data.partners',
+               f'run only the partner {stage} stage (fetches only the rows it can change)',
+               _write_args, {'stage': stage})
+       for stage in PARTNER_STAGES},
+    # Known areas and category fixes are part of the partners job now
+    'assign-areas': ('gdd_data.partners',
+                     'same as partners (known areas and category fixes are evaluated there)',
+                     _all_stages_args, {}),
+    'referrer-revenue': ('gdd_data.referrer_revenue',
+                         'roll up Referrer Revenue exports per referral partner in one bulk write',
+                         _referrer_revenue_args, {}),
+    'appointments': ('gdd_data.appointments',
+                     'read appointment exports into the columnar cache, merging overlapping windows',
+                     _appointments_args, {}),
+    'appointment-cube': ('gdd_data.appointment_cube',
+                         'update the precomputed appointment rollups and print a slice',
+                         _appointment_cube_args, {}),
+    'snapshot': ('gdd_data.snapshot',
+                 'save marketing_partners to a local snapshot file', _snapshot_args, {}),
+    'impact': ('gdd_data.impact',
+               'preview which partners a rules.py edit changes, from the local snapshot',
+               _impact_args, {}),
+    'watch': ('gdd_data.watch',
+              'worker: classify partners as they change (Postgres LISTEN/NOTIFY)', _watch_args, {}),
+    'serve': ('gdd_data.service',
+              'local HTTP classification service (/classify, /classify/batch)', _serve_args, {}),
+    'proximity': ('gdd_data.clinic_proximity',
+                  'nearest clinic per partner, or a territory query with --near', _proximity_args, {}),
+}
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='gdd-data', description='Green Dog data scripts')
+    sub = parser.add_subparsers(dest='command', metavar='command', required=True)
+    for name, (module, help_text, add_arguments, fixed) in COMMANDS.items():
+        p = sub.add_parser(name, help=help_text, description=help_text)
+        if add_arguments:
+            add_arguments(p)
+        p.set_defaults(module=module, **fixed)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    module, _, function = args.module.partition(':')
+    getattr(importlib.import_module(module), function or 'run')(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,116 @@
+"""
+Marketing Partners: Nearest Clinic & Territory Queries
+======================================================
+1. For every geocoded partner, find the nearest clinic (locations with
+   coordinates) and write nearest_location_id / nearest_location_miles
+   (in bulk through the partner outbox, conditional on updated_at)
+2. Territory queries, e.g. all groomers within 3 miles of Venice:
+
+   gdd-data proximity --near venice --within 3 --type groomer
+"""
+
+import sys
+
+import numpy as np
+
+from gdd_data.config import supabase_client
+from gdd_data.outbox import Outbox, outbox_path
+from gdd_data.proximity import PointIndex, nearest_clinics
+from gdd_data.records import Partner
+
+
+def fetch_clinics(client):
+    return client.select('locations', ['id', 'name', 'code', 'latitude', 'longitude'],
+                         ['is_active=eq.true', 'latitude=not.is.null', 'longitude=not.is.null'],
+                         order='name')
+
+
+def fetch_partners(client):
+    rows = [r for page in client.select_pages(
+                'marketing_partners',
+                ['id', 'name', 'partner_type', 'area', 'latitude', 'longitude',
+                 'nearest_location_id', 'nearest_location_miles', 'updated_at'],
+                ['latitude=not.is.null', 'longitude=not.is.null'])
+            for r in page]
+    lat = np.fromiter((float(r['latitude']) for r in rows), dtype=np.float64, count=len(rows))
+    lng = np.fromiter((float(r['longitude']) for r in rows), dtype=np.float64, count=len(rows))
+    return rows, lat, lng
+
+
+def find_clinic(clinics, query):
+    q = query.lower().strip()
+    for c in clinics:
+        if q == (c.get('code') or '').lower() or q in (c.get('name') or '').lower():
+            return c
+    return None
+
+
+def assign_nearest(client, clinics, partners, lat, lng, batch_size=200, flush_timeout=120.0):
+    clinic_lat = np.array([float(c['latitude']) for c in clinics])
+    clinic_lng = np.array([float(c['longitude']) for c in clinics])
+    idx, miles = nearest_clinics(lat, lng, clinic_lat, clinic_lng, k=1)
+
+    changed = []
+    unchanged = 0
+    for p, ci, d in zip(partners, idx[:, 0], miles[:, 0]):
+        clinic = clinics[ci]
+        d = round(float(d), 2)
+        old = p.get('nearest_location_miles')
+        if p.get('nearest_location_id') == clinic['id'] and old is not None and round(float(old), 2) == d:
+            unchanged += 1
+            continue
+        changed.append((Partner.from_row(p), {'nearest_location_id': clinic['id'], 'nearest_location_miles': d},
+                        [f"{clinic['name']} ({d:.2f} mi)"]))
+
+    # Bulk writes via apply_marketing_partner_updates() (migrations 291/295); a partner
+    # edited meanwhile is left for the next run
+    outbox = Outbox(client, outbox_path('proximity'), batch_size=batch_size)
+    outbox.put_many(changed)
+    status = outbox.close(flush_timeout)
+
+    print(f"\n  Updated: {status.get('done', 0)}   Unchanged: {unchanged}   "
+          f"Failed: {status.get('failed', 0)}   Edited meanwhile: {status.get('stale', 0)}")
+    if status['pending']:
+        print(f"  Still queued: {status['pending']} (sent on the next run or `gdd-data flush`)")
+
+    print("\n📊 Partners by nearest clinic...")
+    for ci, clinic in enumerate(clinics):
+        mask = idx[:, 0] == ci
+        if mask.any():
+            print(f"    {clinic['name']:<35} {int(mask.sum()):>4}  "
+                  f"(median {np.median(miles[mask, 0]):.1f} mi)")
+
+
+def territory_query(clinics, partners, lat, lng, near, within, partner_type):
+    clinic = find_clinic(clinics, near)
+    if not clinic:
+        print(f"❌ No clinic matching '{near}'", file=sys.stderr)
+        sys.exit(1)
+    index = PointIndex(lat, lng)
+    hits, miles = index.query_radius(float(clinic['latitude']), float(clinic['longitude']), within)
+    print(f"Partners within {within:g} mi of {clinic['name']}"
+          + (f" (type={partner_type})" if partner_type else '') + ":\n")
+    shown = 0
+    for i, d in zip(hits, miles):
+        p = partners[i]
+        if partner_type and p.get('partner_type') != partner_type:
+            continue
+        shown += 1
+        print(f"  {d:5.2f} mi  {(p.get('name') or '')[:45]:<45} {p.get('partner_type') or '':<20} {p.get('area') or ''}")
+    print(f"\n  {shown} partners")
+
+
+def run(args):
+    client = supabase_client()
+    clinics = fetch_clinics(client)
+    if not clinics:
+        print("❌ No active clinic locations with coordinates (run scripts/batch-geocode.ts)",
+              file=sys.stderr)
+        sys.exit(1)
+    partners, lat, lng = fetch_partners(client)
+    print(f"📥 {len(partners)} geocoded partners, {len(clinics)} clinics\n")
+
+    if args.near:
+        territory_query(clinics, partners, lat, lng, args.near, args.within, args.partner_type)
+    else:
+        assign_nearest(client, clinics, partners, lat, lng, args.batch_size, args.flush_timeout)
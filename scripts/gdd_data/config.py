@@ -0,0 +1,33 @@
+"""
+Environment configuration
+=========================
+Read when a command needs it rather than at import time, so every gdd_data
+module can be imported (e.g. by tests or other scripts) without credentials.
+"""
+
+import os
+import sys
+
+
+def supabase_credentials():
+    """(SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY); exits with an error if either is missing."""
+    url = os.environ.get("SUPABASE_URL")
+    key = os.environ.get("SUPABASE_SERVICE_ROLE_KEY")
+    if not url or not key:
+        print("❌ Missing SUPABASE_URL or SUPABASE_SERVICE_ROLE_KEY env vars", file=sys.stderr)
+        sys.exit(1)
+    return url, key
+
+
+def supabase_client():
+    from gdd_data.postgrest import PostgrestClient
+    return PostgrestClient(*supabase_credentials())
+
+
+def database_url():
+    """Direct Postgres connection string (DATABASE_URL), for LISTEN/NOTIFY; exits if missing."""
+    url = os.environ.get("DATABASE_URL")
+    if not url:
+        print("❌ Missing DATABASE_URL env var (Postgres connection string)", file=sys.stderr)
+        sys.exit(1)
+    return url
@@ -0,0 +1,382 @@
+"""
+Marketing CSV loader
+====================
+Streams the CSVs in data/marketing/parsed into Supabase with bulk upserts,
+driven by the LoadSpec mappings in SPECS (one per file):
+
+    scripts/gdd-data load                       (every spec, in order)
+    scripts/gdd-data load inventory events_completed
+    scripts/gdd-data load --dry-run             (parse and coerce only)
+
+Each file is read with csv.reader in batches of --batch-size rows, so memory
+stays bounded whatever the file size. Per batch, every mapped column is
+cleaned (the med_contacts `clean` rules: blanks, 'None', 'NA', 'N/A' -> NULL)
+and coerced as a column, then the batch goes out as bulk upserts on
+import_key (migration 293):
+
+- a row's import_key is its normalized natural key, so re-running a load
+  updates rows in place, and the same partner in two files is one row;
+- a NULL never overwrites a stored value: rows are grouped by the columns
+  they actually fill, one upsert per group, so a sparse file cannot blank
+  out what a richer one loaded;
+- transient errors (network, 429, 5xx) are retried with backoff; a batch
+  rejected with a 4xx is split in halves until the bad rows are isolated,
+  which are reported and skipped.
+"""
+
+import csv
+import os
+import re
+import time
+import urllib.error
+from dataclasses import dataclass
+
+from gdd_data.med_contacts import clean
+from gdd_data.postgrest import transient
+
+MAX_ATTEMPTS = 5
+
+
+# ============================================================
+# COERCION
+# ============================================================
+def _int(value):
+    try:
+        return int(float(value.replace(',', '')))
+    except ValueError:
+        return None
+
+
+def _number(value):
+    try:
+        return float(value.replace(',', '').replace('$', ''))
+    except ValueError:
+        return None
+
+
+_DATE_US = re.compile(r'^(\d{1,2})/(\d{1,2})/(\d{2}|\d{4})$')
+
+
+def _date(value):
+    """ISO date from 'YYYY-MM-DD[...]' or 'M/D/YY[YY]'; None otherwise."""
+    if re.match(r'^\d{4}-\d{2}-\d{2}', value):
+        return value[:10]
+    m = _DATE_US.match(value)
+    if not m:
+        return None
+    month, day, year = m.groups()
+    year = int(year) + (2000 if len(year) == 2 else 0)
+    return f"{year:04d}-{int(month):02d}-{int(day):02d}"
+
+
+_COUNT = re.compile(r'([\d.,]+)\s*(k|m|million|thousand)?', re.IGNORECASE)
+_SCALE = {'k': 1_000, 'thousand': 1_000, 'm': 1_000_000, 'million': 1_000_000}
+
+
+def _count(value):
+    """Follower counts as written in the sheets: '4.2M', '110k', '1 million', '7248'."""
+    m = _COUNT.search(value)
+    if not m:
+        return None
+    try:
+        number = float(m.group(1).replace(',', ''))
+    except ValueError:
+        return None
+    return int(number * _SCALE.get((m.group(2) or '').lower(), 1))
+
+
+def _email(value):
+    value = value.lower()
+    return value if '@' in value else None
+
+
+def _handle(value):
+    """Instagram handle without '@' or URL; the first one if several are listed."""
+    value = value.split()[0].rstrip('/')
+    return value.rsplit('/', 1)[-1].lstrip('@') or None
+
+
+COERCE = {
+    'text': None,
+    'int': _int,
+    'number': _number,
+    'date': _date,
+    'count': _count,
+    'email': _email,
+    'handle': _handle,
+}
+
+
+def coerce_column(values, kind):
+    """Clean and coerce one column of a batch."""
+    values = [clean(v) for v in values]
+    convert = COERCE[kind] if isinstance(kind, str) else kind
+    if convert is None:
+        return values
+    return [None if v is None else convert(v) for v in values]
+
+
+def import_key(*values):
+    """Same normalization as marketing_import_key() in migration 293."""
+    return '|'.join(' '.join(str(v).lower().split()) for v in values)
+
+
+# ============================================================
+# SPECS
+# ============================================================
+@dataclass(frozen=True)
+class LoadSpec:
+    """
+    How one CSV maps onto a table.
+
+    columns   {target column: source column, or (source column, kind)} where
+              kind is a COERCE name or a callable(str) -> value
+    key       target columns forming the import_key
+    fixed     constant values written on every row
+    skip      {source column: values}: rows whose (raw, stripped) cell is one
+              of these are skipped, e.g. section rows inside the data
+    """
+    file: str
+    table: str
+    columns: dict
+    key: tuple
+    fixed: dict = None
+    skip: dict = None
+
+
+def _event_date(value):
+    # Known typo in the events sheet: 2035-11-02 for 2025-11-02
+    date = _date(value)
+    return '2025' + date[4:] if date and date.startswith('2035') else date
+
+
+def _event_status(value):
+    # marketing_events.status CHECK; 'awareness' / 'pending decision' are planned
+    value = value.lower()
+    return value if value in ('planned', 'confirmed', 'cancelled', 'completed') else 'planned'
+
+
+PARTNER_SECTIONS = frozenset({'Rescues', 'Food/Beverage Vendors', 'Regular Vendors', 'Entertainment',
+                              'Donations/Silent Auction', 'Donations/Goodie Bags'})
+
+SPECS = {
+    'events_completed': LoadSpec(
+        'events_completed.csv', 'marketing_events',
+        columns={'name': 'event_name', 'event_date': ('event_date', _event_date),
+                 'location': 'location', 'budget': ('cost', 'number'),
+                 'actual_attendance': ('attendees', 'int'),
+                 'leads_collected': ('leads_collected', 'int'), 'post_event_notes': 'notes'},
+        key=('name', 'event_date'),
+        fixed={'status': 'completed'},
+    ),
+    'events_scheduled': LoadSpec(
+        'events_scheduled.csv', 'marketing_events',
+        columns={'name': 'event_name', 'event_date': ('event_date', _event_date),
+                 'location': 'clinic', 'description': 'description', 'staffing_needs': 'organizer',
+                 'status': ('status', _event_status)},
+        key=('name', 'event_date'),
+        # Awareness months and holidays are calendar notes, not events
+        skip={'event_type': {'Awareness', 'National Holiday'}},
+    ),
+    # PetChewlla first: the master list's notes win for influencers on both
+    'influencers_petchewlla_2024': LoadSpec(
+        'influencers_petchewlla_2024.csv', 'marketing_influencers',
+        columns={'contact_name': 'contact_name', 'instagram_handle': ('instagram_handle', 'handle'),
+                 'notes': 'notes'},
+        key=('contact_name',),
+    ),
+    'influencers_master': LoadSpec(
+        'influencers_master.csv', 'marketing_influencers',
+        columns={'contact_name': 'contact_name', 'pet_name': 'pet_name', 'phone': 'phone',
+                 'email': ('email', 'email'), 'instagram_handle': ('instagram_handle', 'handle'),
+                 # The export shifted follower counts into the location column
+                 'follower_count': ('location', 'count'),
+                 'agreement_details': 'agreement_details', 'promo_code': 'promo_code',
+                 'notes': 'status_notes'},
+        key=('contact_name',),
+    ),
+    'inventory': LoadSpec(
+        'inventory.csv', 'marketing_inventory',
+        columns={'item_name': 'item_name', 'boxes_on_hand': ('boxes_on_hand', 'int'),
+                 'quantity_venice': ('quantity_venice', 'int'),
+                 'quantity_sherman_oaks': ('quantity_sherman_oaks', 'int'),
+                 'quantity_valley': ('quantity_valley', 'int'),
+                 'reorder_point': ('reorder_point', 'int'), 'last_ordered': ('last_ordered', 'date'),
+                 'order_quantity': ('order_quantity', 'int'), 'notes': 'notes'},
+        key=('item_name',),
+    ),
+    'marketing_contacts': LoadSpec(
+        'marketing_contacts.csv', 'marketing_partners',
+        columns={'name': 'business_name', 'contact_name': 'contact_name', 'contact_phone': 'phone',
+                 'contact_email': ('email', 'email'), 'services_provided': 'services_provided',
+                 'notes': 'notes'},
+        key=('name',),
+    ),
+    'vendors_petchewlla_2024': LoadSpec(
+        'vendors_petchewlla_2024.csv', 'marketing_partners',
+        # contact_name holds the outreach notes in this export
+        columns={'name': 'business_name', 'contact_email': ('email', 'email'),
+                 'contact_phone': 'phone', 'instagram_handle': ('instagram', 'handle'),
+                 'notes': 'contact_name'},
+        key=('name',),
+        skip={'business_name': PARTNER_SECTIONS},
+    ),
+    'vendors_gd_land_2025': LoadSpec(
+        'vendors_gd_land_2025.csv', 'marketing_partners',
+        columns={'name': 'business_name', 'contact_name': 'contact_name',
+                 'contact_email': ('email', 'email'), 'contact_phone': 'phone',
+                 'instagram_handle': ('instagram', 'handle'), 'notes': 'notes'},
+        key=('name',),
+        # Section rows: "RESCUES, NAME", "VENDORS, NAME", ...
+        skip={'contact_name': {'NAME'}},
+    ),
+}
+
+
+# ============================================================
+# LOADING
+# ============================================================
+def read_batches(path, spec, batch_size):
+    """Yield (rows read, [record dicts]) per batch of the CSV, coerced per column."""
+    with open(path, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        index = {name: i for i, name in enumerate(header)}
+        missing = {src for src, _ in _sources(spec)} - set(index)
+        if missing:
+            raise ValueError(f"{os.path.basename(path)}: no column(s) {', '.join(sorted(missing))}")
+        skip = [(index[col], values) for col, values in (spec.skip or {}).items()]
+        width = len(header)
+        batch = []
+        read = 0
+        for cells in reader:
+            read += 1
+            if len(cells) < width:
+                cells += [''] * (width - len(cells))
+            if any(cells[i].strip() in values for i, values in skip):
+                continue
+            batch.append(cells)
+            if len(batch) == batch_size:
+                yield read, _records(batch, spec, index)
+                batch = []
+                read = 0
+        if read:
+            yield read, _records(batch, spec, index)
+
+
+def _sources(spec):
+    for target, source in spec.columns.items():
+        yield (source, 'text') if isinstance(source, str) else source
+
+
+def _records(batch, spec, index):
+    columns = {target: coerce_column([cells[index[src]] for cells in batch], kind)
+               for target, (src, kind) in zip(spec.columns, _sources(spec))}
+    records = []
+    for i in range(len(batch)):
+        record = {target: values[i] for target, values in columns.items()}
+        if any(record[k] is None for k in spec.key):
+            continue
+        record.update(spec.fixed or {})
+        record['import_key'] = import_key(*(record[k] for k in spec.key))
+        records.append(record)
+    return records
+
+
+def _merge(records):
+    """One record per import_key (a batch may repeat one); later non-NULL values win."""
+    merged = {}
+    for record in records:
+        previous = merged.get(record['import_key'])
+        if previous is None:
+            merged[record['import_key']] = record
+        else:
+            previous.update((k, v) for k, v in record.items() if v is not None)
+    return list(merged.values())
+
+
+class Loader:
+    def __init__(self, client, table):
+        self.client = client
+        self.path = f"{table}?on_conflict=import_key"
+        self.rejected = 0
+
+    def upsert(self, records):
+        """Upsert a batch; rows are grouped by filled columns so NULLs never overwrite."""
+        groups = {}
+        for record in _merge(records):
+            filled = {k: v for k, v in record.items() if v is not None}
+            groups.setdefault(tuple(sorted(filled)), []).append(filled)
+        loaded = 0
+        for rows in groups.values():
+            loaded += self._send(rows)
+        return loaded
+
+    def _send(self, rows, attempt=0):
+        try:
+            self.client.request('POST', self.path, rows,
+                                headers={"Prefer": "resolution=merge-duplicates,return=minimal"})
+            return len(rows)
+        except OSError as e:
+            if transient(e):
+                if attempt + 1 >= MAX_ATTEMPTS:
+                    raise
+                print(f"  ⏳ {len(rows)} rows: {e}; retrying in {2 ** attempt}s")
+                time.sleep(2 ** attempt)
+                return self._send(rows, attempt + 1)
+            if len(rows) > 1:
+                # Split until the rows the server rejects are isolated
+                half = len(rows) // 2
+                return self._send(rows[:half]) + self._send(rows[half:])
+            detail = e.read().decode('utf-8') if isinstance(e, urllib.error.HTTPError) else ''
+            self.rejected += 1
+            print(f"  ❌ {rows[0]['import_key'][:50]:<50} | {e} {detail}".rstrip())
+            return 0
+
+
+def load(spec, path, client=None, batch_size=500):
+    """Load one CSV; returns {'read', 'loaded', 'skipped', 'rejected', 'seconds'}."""
+    loader = Loader(client, spec.table) if client else None
+    start = time.perf_counter()
+    read = loaded = skipped = 0
+    for n, records in read_batches(path, spec, batch_size):
+        read += n
+        skipped += n - len(records)
+        if loader:
+            loaded += loader.upsert(records)
+        else:
+            loaded += len(_merge(records))
+    return {'read': read, 'loaded': loaded, 'skipped': skipped,
+            'rejected': loader.rejected if loader else 0,
+            'seconds': time.perf_counter() - start}
+
+
+def run(args):
+    names = args.specs or list(SPECS)
+    unknown = [n for n in names if n not in SPECS]
+    if unknown:
+        print(f"❌ Unknown spec(s): {', '.join(unknown)}. Known: {', '.join(SPECS)}")
+        return
+    client = None
+    if not args.dry_run:
+        from gdd_data.config import supabase_client
+        client = supabase_client()
+
+    total = {'read': 0, 'loaded': 0, 'seconds': 0.0}
+    for name in names:
+        spec = SPECS[name]
+        path = os.path.join(args.dir, spec.file)
+        if not os.path.exists(path):
+            print(f"⚠️ {path} not found; skipping {name}")
+            continue
+        print(f"📥 {spec.file} → {spec.table}{' (dry run)' if args.dry_run else ''}")
+        stats = load(spec, path, client, args.batch_size)
+        rate = stats['read'] / stats['seconds'] if stats['seconds'] else 0
+        print(f"   {stats['read']} rows: {stats['loaded']} {'valid' if args.dry_run else 'loaded'}, "
+              f"{stats['skipped']} skipped, {stats['rejected']} rejected "
+              f"in {stats['seconds']:.2f}s ({rate:,.0f} rows/s)")
+        for k in total:
+            total[k] += stats[k]
+    if len(names) > 1 and total['seconds']:
+        print(f"\n✅ {total['read']} rows, {total['loaded']} {'valid' if args.dry_run else 'loaded'} "
+              f"in {total['seconds']:.2f}s ({total['read'] / total['seconds']:,.0f} rows/s)")
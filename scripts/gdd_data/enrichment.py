@@ -0,0 +1,279 @@
+"""
+Enrichment providers
+====================
+Lookups of website/address/social fields for a partner name, behind a small
+provider interface:
+
+- LocalProvider   - the researched known-business table (also the stand-in for tests)
+- GooglePlacesProvider - Places API text search + details (GOOGLE_MAPS_API_KEY)
+- ChainProvider   - first provider that returns anything wins
+- any "package.module:Class" importable provider
+
+Enricher wraps a provider with a persistent TTL response cache, coalescing of
+concurrent lookups for the same name, a token-bucket rate limit and a thread
+pool fan-out, so large runs are bounded by provider throughput.
+"""
+
+import importlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import urllib.parse
+import urllib.request
+from concurrent.futures import Future, ThreadPoolExecutor
+
+DEFAULT_CACHE_DIR = os.environ.get("GDD_CACHE_DIR", ".cache/gdd-data")
+DEFAULT_TTL = 30 * 24 * 3600
+
+
+def normalize_name(name):
+    return ' '.join((name or '').lower().split())
+
+
+# ============================================================
+# PROVIDERS
+# ============================================================
+class EnrichmentProvider:
+    """Base provider: return a dict of found fields (possibly empty) for a name."""
+    name = 'base'
+    # Remote providers are cached and rate limited; local ones are not
+    remote = True
+
+    def lookup(self, name):
+        raise NotImplementedError
+
+
+class LocalProvider(EnrichmentProvider):
+    name = 'local'
+    remote = False
+
+    def __init__(self, table):
+        self.table = {normalize_name(k): v for k, v in table.items()}
+
+    def lookup(self, name):
+        return dict(self.table.get(normalize_name(name), {}))
+
+
+class GooglePlacesProvider(EnrichmentProvider):
+    name = 'google'
+    FIND_URL = "https://maps.googleapis.com/maps/api/place/findplacefromtext/json"
+    DETAILS_URL = "https://maps.googleapis.com/maps/api/place/details/json"
+
+    def __init__(self, api_key=None, region_hint="Los Angeles, CA", timeout=10):
+        self.api_key = api_key or os.environ.get("GOOGLE_MAPS_API_KEY")
+        if not self.api_key:
+            raise ValueError("GooglePlacesProvider needs GOOGLE_MAPS_API_KEY")
+        self.region_hint = region_hint
+        self.timeout = timeout
+
+    def _get(self, url, params):
+        params['key'] = self.api_key
+        with urllib.request.urlopen(f"{url}?{urllib.parse.urlencode(params)}",
+                                    timeout=self.timeout) as response:
+            return json.loads(response.read().decode('utf-8'))
+
+    def lookup(self, name):
+        found = self._get(self.FIND_URL, {
+            'input': f"{name}, {self.region_hint}",
+            'inputtype': 'textquery',
+            'fields': 'place_id,formatted_address',
+        })
+        candidates = found.get('candidates') or []
+        if not candidates:
+            return {}
+        result = {}
+        if candidates[0].get('formatted_address'):
+            result['address'] = candidates[0]['formatted_address']
+        details = self._get(self.DETAILS_URL, {
+            'place_id': candidates[0]['place_id'],
+            'fields': 'website',
+        }).get('result') or {}
+        if details.get('website'):
+            result['website'] = details['website']
+        return result
+
+
+class ChainProvider(EnrichmentProvider):
+    """Try providers in order; the first non-empty answer wins."""
+
+    def __init__(self, providers):
+        self.providers = providers
+        self.name = '+'.join(p.name for p in providers)
+        self.remote = any(p.remote for p in providers)
+
+    def lookup(self, name):
+        for provider in self.providers:
+            result = provider.lookup(name)
+            if result:
+                return result
+        return {}
+
+
+def load_provider(spec, local_table):
+    """
+    Build a provider from a comma-separated spec, e.g. "local", "local,google"
+    or "local,mypkg.providers:YelpProvider".
+    """
+    providers = []
+    for part in (s.strip() for s in spec.split(',') if s.strip()):
+        if part == 'local':
+            providers.append(LocalProvider(local_table))
+        elif part == 'google':
+            providers.append(GooglePlacesProvider())
+        else:
+            module, _, cls = part.partition(':')
+            providers.append(getattr(importlib.import_module(module), cls)())
+    return providers[0] if len(providers) == 1 else ChainProvider(providers)
+
+
+# ============================================================
+# CACHE / RATE LIMIT
+# ============================================================
+class ResponseCache:
+    """SQLite cache of provider responses with a time-to-live, shared across threads."""
+
+    def __init__(self, path=None, ttl=DEFAULT_TTL):
+        self.path = path or os.path.join(DEFAULT_CACHE_DIR, 'enrichment.sqlite')
+        self.ttl = ttl
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                provider TEXT NOT NULL,
+                name TEXT NOT NULL,
+                value TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                PRIMARY KEY (provider, name)
+            )
+        """)
+
+    def get(self, provider, name):
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT value FROM responses WHERE provider = ? AND name = ? AND expires_at > ?",
+                (provider, name, time.time())
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, provider, name, value):
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses (provider, name, value, expires_at) VALUES (?, ?, ?, ?)",
+                (provider, name, json.dumps(value), time.time() + self.ttl)
+            )
+            self.conn.commit()
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens/second, bursts up to `capacity`."""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = float(rate)
+        self.capacity = float(capacity or rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+# ============================================================
+# ENRICHER
+# ============================================================
+class Enricher:
+    def __init__(self, provider, cache=None, rate=5.0, burst=None, max_workers=8):
+        self.provider = provider
+        self.cache = cache if cache is not None else (ResponseCache() if provider.remote else None)
+        self.bucket = TokenBucket(rate, burst) if provider.remote else None
+        self.max_workers = max_workers
+        self.lock = threading.Lock()
+        self.in_flight = {}
+        self.calls = 0
+        self.cache_hits = 0
+        self.errors = 0
+
+    def lookup(self, name):
+        key = normalize_name(name)
+        if not key:
+            return {}
+        if self.cache is not None:
+            cached = self.cache.get(self.provider.name, key)
+            if cached is not None:
+                with self.lock:
+                    self.cache_hits += 1
+                return cached
+
+        # Coalesce: concurrent lookups of the same name share one provider call
+        with self.lock:
+            future = self.in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = self.in_flight[key] = Future()
+        if not owner:
+            return future.result()
+
+        try:
+            # Another owner may have finished between our cache miss and now
+            result = self.cache.get(self.provider.name, key) if self.cache is not None else None
+            if result is None:
+                result = self._call(self.provider, name)
+                if self.cache is not None:
+                    self.cache.put(self.provider.name, key, result)
+        except Exception as e:
+            # Failed lookups are not cached; the next run retries them
+            with self.lock:
+                self.errors += 1
+            print(f"  ⚠️ Enrichment lookup failed for {name}: {e}")
+            result = {}
+        future.set_result(result)
+        with self.lock:
+            del self.in_flight[key]
+        return result
+
+    def _call(self, provider, name):
+        """Provider answer for a name; only calls to remote providers take a rate-limit token."""
+        if isinstance(provider, ChainProvider):
+            # A local answer ends the chain before any remote provider is tried
+            for p in provider.providers:
+                result = self._call(p, name)
+                if result:
+                    return result
+            return {}
+        if provider.remote:
+            self.bucket.acquire()
+            with self.lock:
+                self.calls += 1
+        return provider.lookup(name) or {}
+
+    def lookup_many(self, names):
+        """Look up many names concurrently; returns {normalized name: fields}."""
+        unique = {}
+        for n in names:
+            unique.setdefault(normalize_name(n), n)
+        unique.pop('', None)
+        if not self.provider.remote:
+            return {k: self.lookup(n) for k, n in unique.items()}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            results = pool.map(self.lookup, unique.values())
+            return dict(zip(unique.keys(), results))
+
+    def close(self):
+        if self.cache is not None:
+            self.cache.close()
@@ -0,0 +1,185 @@
+"""
+Geospatial area resolver
+========================
+Assigns referral-CRM area zones from latitude/longitude using the zone polygons
+in data/area_zones.geojson. The polygons follow rules.ZONE_NEIGHBORHOODS (every
+listed neighborhood lies in its own zone) and determine_area: the last feature
+covers the Ventura County side of the bounding box (Thousand Oaks, Simi
+Valley), which the rules put Online/Remote/Out of Area. Earlier features win
+where polygons touch.
+
+A uniform grid is laid over the zones once. Cells that no polygon edge crosses
+get their zone precomputed (scanline fill), so almost every lookup is a single
+list index; only points in boundary cells fall back to point-in-polygon tests
+against the few candidate zones for that cell.
+"""
+
+import bisect
+import json
+import os
+
+ZONES_GEOJSON = os.path.join(os.path.dirname(__file__), 'data', 'area_zones.geojson')
+OUT_OF_AREA = 'Online/Remote/Out of Area'
+
+_NONE = -1
+
+
+def _point_in_rings(x, y, rings):
+    """Even-odd test over all rings (outer + holes) of a polygon."""
+    inside = False
+    for ring in rings:
+        n = len(ring)
+        x1, y1 = ring[n - 1]
+        for i in range(n):
+            x2, y2 = ring[i]
+            if (y1 > y) != (y2 > y) and x < x1 + (y - y1) * (x2 - x1) / (y2 - y1):
+                inside = not inside
+            x1, y1 = x2, y2
+    return inside
+
+
+def _segment_hits_box(x1, y1, x2, y2, bx0, by0, bx1, by1):
+    """Liang-Barsky clip: does segment (x1,y1)-(x2,y2) touch the box?"""
+    t0, t1 = 0.0, 1.0
+    dx, dy = x2 - x1, y2 - y1
+    for p, q in ((-dx, x1 - bx0), (dx, bx1 - x1), (-dy, y1 - by0), (dy, by1 - y1)):
+        if p == 0:
+            if q < 0:
+                return False
+            continue
+        t = q / p
+        if p < 0:
+            if t > t1:
+                return False
+            t0 = max(t0, t)
+        else:
+            if t < t0:
+                return False
+            t1 = min(t1, t)
+    return True
+
+
+class AreaResolver:
+    """Grid-indexed point-in-polygon lookup of area zones."""
+
+    def __init__(self, path=ZONES_GEOJSON, cell_size=0.005, outside_area=OUT_OF_AREA):
+        with open(path) as f:
+            collection = json.load(f)
+        self.areas = []
+        self.polygons = []  # per zone: list of rings, each a list of (x, y)
+        for feature in collection['features']:
+            geom = feature['geometry']
+            polys = geom['coordinates'] if geom['type'] == 'MultiPolygon' else [geom['coordinates']]
+            rings = [[(float(x), float(y)) for x, y in ring] for poly in polys for ring in poly]
+            self.areas.append(feature['properties']['area'])
+            self.polygons.append(rings)
+        self.outside_area = outside_area
+        self._build_grid(cell_size)
+
+    def _build_grid(self, cell):
+        xs = [x for rings in self.polygons for ring in rings for x, _ in ring]
+        ys = [y for rings in self.polygons for ring in rings for _, y in ring]
+        self.x0, self.y0 = min(xs), min(ys)
+        self.x1, self.y1 = max(xs), max(ys)
+        self.cell = cell
+        self.inv = 1.0 / cell
+        self.nx = int((self.x1 - self.x0) * self.inv) + 1
+        self.ny = int((self.y1 - self.y0) * self.inv) + 1
+
+        # Boundary cells: any cell an edge passes through, with the zones involved
+        boundary = {}
+        for zi, rings in enumerate(self.polygons):
+            for ring in rings:
+                for (ax, ay), (bx, by) in zip(ring, ring[1:] + ring[:1]):
+                    cx0, cx1 = sorted((self._col(ax), self._col(bx)))
+                    cy0, cy1 = sorted((self._row(ay), self._row(by)))
+                    for cy in range(cy0, cy1 + 1):
+                        by0 = self.y0 + cy * cell
+                        for cx in range(cx0, cx1 + 1):
+                            bx0 = self.x0 + cx * cell
+                            if _segment_hits_box(ax, ay, bx, by, bx0, by0, bx0 + cell, by0 + cell):
+                                boundary.setdefault(cy * self.nx + cx, set()).add(zi)
+
+        # Interior cells: scanline through each row's centre, first zone wins
+        grid = [_NONE] * (self.nx * self.ny)
+        for cy in range(self.ny):
+            yc = self.y0 + (cy + 0.5) * cell
+            spans = [self._crossings(rings, yc) for rings in self.polygons]
+            for cx in range(self.nx):
+                idx = cy * self.nx + cx
+                if idx in boundary:
+                    continue
+                xc = self.x0 + (cx + 0.5) * cell
+                for zi, crossings in enumerate(spans):
+                    if bisect.bisect_left(crossings, xc) % 2:
+                        grid[idx] = zi
+                        break
+
+        # Boundary cells keep candidate zones (in priority order) for exact tests
+        for idx, zones in boundary.items():
+            cy, cx = divmod(idx, self.nx)
+            xc = self.x0 + (cx + 0.5) * cell
+            yc = self.y0 + (cy + 0.5) * cell
+            # A zone fully covering the cell without an edge in it is also a candidate
+            covering = {zi for zi, rings in enumerate(self.polygons)
+                        if zi not in zones and _point_in_rings(xc, yc, rings)}
+            grid[idx] = tuple(sorted(zones | covering))
+        self.grid = grid
+
+    @staticmethod
+    def _crossings(rings, y):
+        xs = []
+        for ring in rings:
+            for (x1, y1), (x2, y2) in zip(ring, ring[1:] + ring[:1]):
+                if (y1 > y) != (y2 > y):
+                    xs.append(x1 + (y - y1) * (x2 - x1) / (y2 - y1))
+        xs.sort()
+        return xs
+
+    def _col(self, x):
+        return min(max(int((x - self.x0) * self.inv), 0), self.nx - 1)
+
+    def _row(self, y):
+        return min(max(int((y - self.y0) * self.inv), 0), self.ny - 1)
+
+    def resolve(self, lat, lng):
+        """Area for one point: a zone name, `outside_area` beyond all zones, or None in a gap."""
+        return self.resolve_many([(lat, lng)])[0]
+
+    def resolve_many(self, points):
+        """Areas for an iterable of (lat, lng) pairs; None entries stay None."""
+        x0, y0, x1, y1 = self.x0, self.y0, self.x1, self.y1
+        inv, nx, grid = self.inv, self.nx, self.grid
+        areas, polygons = self.areas, self.polygons
+        out = []
+        append = out.append
+        for point in points:
+            if point is None or point[0] is None or point[1] is None:
+                append(None)
+                continue
+            y, x = point
+            if x < x0 or x > x1 or y < y0 or y > y1:
+                append(self.outside_area)
+                continue
+            c = grid[int((y - y0) * inv) * nx + int((x - x0) * inv)]
+            if c.__class__ is int:
+                append(areas[c] if c != _NONE else None)
+                continue
+            for zi in c:
+                if _point_in_rings(x, y, polygons[zi]):
+                    append(areas[zi])
+                    break
+            else:
+                append(None)
+        return out
+
+
+_resolver = None
+
+
+def get_resolver():
+    """Shared resolver, built on first use."""
+    global _resolver
+    if _resolver is None:
+        _resolver = AreaResolver()
+    return _resolver
@@ -0,0 +1,217 @@
+"""
+Geocoding client
+================
+Python counterpart to scripts/batch-geocode.ts for the partner scripts.
+
+Addresses are normalized ("Street" → "st", punctuation and country suffixes
+dropped, whitespace collapsed) and results - including misses - are cached on
+disk by normalized address, so a re-run never geocodes the same address twice.
+Only a definite miss (no results, Google's ZERO_RESULTS) is cached as one;
+quota, key and server errors raise and the address is retried next run.
+Each batch is deduplicated before it reaches the backend, and cache misses are
+fetched concurrently under a token-bucket rate limit: the backend's own
+limit (1 request/s for Nominatim) unless the caller passes a rate.
+
+Backends:
+- NominatimGeocoder - any Nominatim-compatible /search endpoint (NOMINATIM_URL;
+  point it at a local Nominatim or stub server for tests)
+- GoogleGeocoder    - Google Geocoding API (GOOGLE_MAPS_API_KEY), as used by batch-geocode.ts
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from gdd_data.enrichment import TokenBucket
+
+DEFAULT_CACHE_DIR = os.environ.get("GDD_CACHE_DIR", ".cache/gdd-data")
+
+_SUFFIXES = {
+    'street': 'st', 'avenue': 'ave', 'boulevard': 'blvd', 'drive': 'dr', 'road': 'rd',
+    'place': 'pl', 'lane': 'ln', 'court': 'ct', 'highway': 'hwy', 'parkway': 'pkwy',
+    'suite': 'ste', 'north': 'n', 'south': 's', 'east': 'e', 'west': 'w',
+}
+_SUFFIX_RE = re.compile(r'\b(' + '|'.join(_SUFFIXES) + r')\b')
+_PUNCT_RE = re.compile(r"[.#']")
+_COUNTRY_RE = re.compile(r',?\s*(usa|united states( of america)?)\s*$')
+_SPACE_RE = re.compile(r'\s+')
+
+
+def normalize_address(address):
+    """Canonical cache key for an address ('' if there is nothing to geocode)."""
+    if not address:
+        return ''
+    a = address.lower().strip()
+    a = _PUNCT_RE.sub('', a)
+    a = _COUNTRY_RE.sub('', a)
+    a = _SUFFIX_RE.sub(lambda m: _SUFFIXES[m.group(1)], a)
+    a = re.sub(r'\s*,\s*', ', ', a)
+    return _SPACE_RE.sub(' ', a).strip(' ,')
+
+
+# ============================================================
+# BACKENDS
+# ============================================================
+class NominatimGeocoder:
+    name = 'nominatim'
+    # The public server's usage policy: at most one request per second
+    rate = 1.0
+
+    def __init__(self, base_url=None, user_agent="gdd-data-geocoder", timeout=10):
+        self.base_url = (base_url or os.environ.get("NOMINATIM_URL")
+                         or "https://nominatim.openstreetmap.org").rstrip('/')
+        self.user_agent = user_agent
+        self.timeout = timeout
+
+    def geocode(self, address):
+        params = urllib.parse.urlencode({'q': address, 'format': 'json', 'limit': 1,
+                                         'countrycodes': 'us'})
+        req = urllib.request.Request(f"{self.base_url}/search?{params}",
+                                     headers={"User-Agent": self.user_agent})
+        with urllib.request.urlopen(req, timeout=self.timeout) as response:
+            results = json.loads(response.read().decode('utf-8'))
+        if not results:
+            return None
+        r = results[0]
+        return {'lat': float(r['lat']), 'lng': float(r['lon']),
+                'formatted_address': r.get('display_name'), 'place_id': str(r.get('place_id') or '')}
+
+
+class GoogleGeocoder:
+    name = 'google'
+    # Paid per request; Google allows 50 requests per second
+    rate = 50.0
+    URL = "https://maps.googleapis.com/maps/api/geocode/json"
+
+    def __init__(self, api_key=None, timeout=10):
+        self.api_key = api_key or os.environ.get("GOOGLE_MAPS_API_KEY")
+        if not self.api_key:
+            raise ValueError("GoogleGeocoder needs GOOGLE_MAPS_API_KEY")
+        self.timeout = timeout
+
+    def geocode(self, address):
+        params = urllib.parse.urlencode({'address': address, 'key': self.api_key})
+        with urllib.request.urlopen(f"{self.URL}?{params}", timeout=self.timeout) as response:
+            data = json.loads(response.read().decode('utf-8'))
+        status = data.get('status')
+        if status == 'ZERO_RESULTS' or (status == 'OK' and not data.get('results')):
+            return None
+        if status != 'OK':
+            # OVER_QUERY_LIMIT, REQUEST_DENIED, INVALID_REQUEST, UNKNOWN_ERROR: a
+            # failed request, not an unknown address - raise so it is not cached
+            raise RuntimeError(f"Google geocoding {status}: {data.get('error_message', '')}".rstrip(': '))
+        r = data['results'][0]
+        return {'lat': r['geometry']['location']['lat'], 'lng': r['geometry']['location']['lng'],
+                'formatted_address': r.get('formatted_address'), 'place_id': r.get('place_id')}
+
+
+BACKENDS = {'nominatim': NominatimGeocoder, 'google': GoogleGeocoder}
+
+
+# ============================================================
+# CACHE + CLIENT
+# ============================================================
+_MISS = object()
+
+
+class GeocodeCache:
+    """
+    Disk cache of geocode results by normalized address. Misses (the backend
+    found nothing) are cached as None; backend errors never reach the cache.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(DEFAULT_CACHE_DIR, 'geocode.sqlite')
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS geocodes (
+                address TEXT PRIMARY KEY,
+                result TEXT,
+                backend TEXT NOT NULL,
+                fetched_at REAL NOT NULL
+            )
+        """)
+
+    def get_many(self, keys):
+        found = {}
+        keys = list(keys)
+        with self.lock:
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                rows = self.conn.execute(
+                    f"SELECT address, result FROM geocodes WHERE address IN ({','.join('?' * len(chunk))})",
+                    chunk
+                ).fetchall()
+                for address, result in rows:
+                    found[address] = json.loads(result) if result else None
+        return found
+
+    def put(self, key, result, backend):
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO geocodes (address, result, backend, fetched_at) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(result) if result else None, backend, time.time())
+            )
+            self.conn.commit()
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+
+class Geocoder:
+    def __init__(self, backend, cache=None, rate=None, max_workers=4):
+        self.backend = backend
+        self.cache = cache or GeocodeCache()
+        self.bucket = TokenBucket(rate or backend.rate)
+        self.max_workers = max_workers
+        self.lock = threading.Lock()
+        self.calls = 0
+        self.cache_hits = 0
+        self.errors = 0
+
+    def _fetch(self, key, address):
+        self.bucket.acquire()
+        with self.lock:
+            self.calls += 1
+        try:
+            result = self.backend.geocode(address)
+        except Exception as e:
+            # Errors are not cached so the address is retried next run
+            with self.lock:
+                self.errors += 1
+            print(f"  ⚠️ Geocoding failed for {address}: {e}")
+            return _MISS
+        self.cache.put(key, result, self.backend.name)
+        return result
+
+    def geocode_many(self, addresses):
+        """
+        Geocode a batch. Returns {normalized address: result or None}; look
+        results up with normalize_address(address).
+        """
+        pending = {}
+        for address in addresses:
+            key = normalize_address(address)
+            if key:
+                pending.setdefault(key, address)
+        results = self.cache.get_many(pending)
+        self.cache_hits += len(results)
+        misses = [(k, a) for k, a in pending.items() if k not in results]
+        if misses:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                for (key, _), result in zip(misses, pool.map(lambda m: self._fetch(*m), misses)):
+                    if result is not _MISS:
+                        results[key] = result
+        return results
+
+    def close(self):
+        self.cache.close()
@@ -0,0 +1,359 @@
+"""
+Rule-change impact analysis
+===========================
+Preview what an edit to gdd_data/rules.py would change, against the local
+snapshot (`gdd-data snapshot`), without re-running the whole table:
+
+    scripts/gdd-data impact                 # working tree vs HEAD
+    scripts/gdd-data impact --against HEAD~3
+    scripts/gdd-data impact --against /tmp/old_rules.py
+
+1. Diff the two rule modules into the strings whose presence in a partner
+   could change the outcome: added/removed keywords (keyword lists and `in`
+   operands in categorize_partner/determine_area/match_known_area), neighborhoods and
+   online indicators, and the names whose known-business/area/category entries
+   changed.
+2. Look those strings up in an inverted index over the snapshot: a trigram
+   index over each partner's lowercased text (the rules do substring tests),
+   plus an exact index of lowercased names.
+3. Re-evaluate only those candidate partners with the old and the new rules
+   (rules.classify(), the chain a real run uses, zone polygons included) and
+   report the ones whose type, area or enrichment actually changes.
+
+If a rule function's control flow or any other constant changed - including
+a result label such as `return 'entertainment'` - the affected set cannot be
+bounded by text, and every partner is re-evaluated. Only
+rules.py is diffed; ZIP table edits (data/la_zip_zones.json) are not.
+"""
+
+import dis
+import json
+import os
+import pickle
+import subprocess
+import sys
+import time
+import types
+
+from gdd_data.enrichment import normalize_name
+from gdd_data.geo import get_resolver
+from gdd_data.records import Partner
+from gdd_data.snapshot import SNAPSHOT_PATH, load_snapshot
+
+RULES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'rules.py')
+RULE_FUNCTIONS = ('categorize_partner', 'determine_area', 'match_known_area', 'classify')
+INDEX_VERSION = 1
+
+# Partner fields the rules read, in the order they are joined for indexing
+TEXT_FIELDS = ('name', 'partner_type', 'services_provided', 'notes', 'category', 'address',
+               'proximity_to_location')
+
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+# ============================================================
+# INVERTED INDEX
+# ============================================================
+class PartnerIndex:
+    """Trigram and exact-name postings over a list of partner rows."""
+
+    def __init__(self, rows):
+        self.ids = [r['id'] for r in rows]
+        self.texts = ['\n'.join(str(r.get(f) or '') for f in TEXT_FIELDS).lower() for r in rows]
+        self.grams = {}
+        self.names = {}
+        for i, (row, text) in enumerate(zip(rows, self.texts)):
+            for g in _trigrams(text):
+                self.grams.setdefault(g, []).append(i)
+            self.names.setdefault(normalize_name(row.get('name')), []).append(i)
+
+    def containing(self, keyword):
+        """Rows whose text contains `keyword` (lowercased substring match)."""
+        keyword = keyword.lower()
+        if len(keyword) < 3:
+            return {i for i, text in enumerate(self.texts) if keyword in text}
+        postings = sorted((self.grams.get(g, ()) for g in _trigrams(keyword)), key=len)
+        candidates = set(postings[0])
+        for p in postings[1:]:
+            candidates.intersection_update(p)
+            if not candidates:
+                break
+        return {i for i in candidates if keyword in self.texts[i]}
+
+    def named(self, name):
+        return set(self.names.get(normalize_name(name), ()))
+
+    def names_within(self, text):
+        """Rows whose whole (normalized) name occurs inside `text`."""
+        text = normalize_name(text)
+        found = set()
+        for start in range(len(text)):
+            for end in range(start + 1, len(text) + 1):
+                found.update(self.names.get(text[start:end], ()))
+        return found
+
+
+def load_index(rows, snapshot_path=SNAPSHOT_PATH):
+    """Index for the snapshot, reusing a pickled copy while the snapshot is unchanged."""
+    path = snapshot_path + '.index.pickle'
+    stamp = (INDEX_VERSION, os.path.getmtime(snapshot_path), len(rows))
+    try:
+        with open(path, 'rb') as f:
+            cached_stamp, index = pickle.load(f)
+        if cached_stamp == stamp:
+            return index
+    except (OSError, EOFError, pickle.UnpicklingError, ValueError):
+        pass
+    index = PartnerIndex(rows)
+    with open(path, 'wb') as f:
+        pickle.dump((stamp, index), f, protocol=pickle.HIGHEST_PROTOCOL)
+    return index
+
+
+# ============================================================
+# RULE DIFF
+# ============================================================
+def load_rules(against):
+    """A rules module from a file path or a git revision of gdd_data/rules.py."""
+    if os.path.exists(against):
+        with open(against) as f:
+            source = f.read()
+    else:
+        repo_path = os.path.relpath(RULES_PATH, _git_root())
+        source = subprocess.run(['git', 'show', f"{against}:{repo_path}"], check=True,
+                                capture_output=True, text=True).stdout
+    module = types.ModuleType(f'gdd_data.rules@{against}')
+    exec(compile(source, f'rules.py@{against}', 'exec'), module.__dict__)
+    if not hasattr(module, 'classify'):
+        # Revisions from before rules.classify() get today's chain over their own tables
+        from gdd_data.rules import classify
+        module.classify = types.FunctionType(classify.__code__, module.__dict__, 'classify',
+                                             classify.__defaults__)
+    return module
+
+
+def _git_root():
+    return subprocess.run(['git', 'rev-parse', '--show-toplevel'], check=True, capture_output=True,
+                          text=True, cwd=os.path.dirname(RULES_PATH)).stdout.strip()
+
+
+# What may sit between a keyword and its `in`: the right operand, a variable
+# with attribute loads and zero-argument method calls (`'spa' in svc.lower()`)
+_OPERAND_OPS = frozenset({'LOAD_FAST', 'LOAD_DEREF', 'LOAD_GLOBAL', 'LOAD_NAME', 'LOAD_ATTR',
+                          'LOAD_METHOD', 'PRECALL', 'CALL', 'CALL_METHOD', 'CACHE'})
+
+
+def _membership_strings(code):
+    """
+    String constants used as keywords, in code order: the left operand of an
+    `in` test (`'spa' in name_lower`). Strings inside tuple/frozenset constants
+    (keyword lists) are keywords too; every other string is a result label or
+    argument.
+    """
+    found = []
+    ops = list(dis.get_instructions(code))
+    for i, op in enumerate(ops):
+        if op.opname != 'LOAD_CONST' or not isinstance(op.argval, str):
+            continue
+        for nxt in ops[i + 1:]:
+            if nxt.opname == 'CONTAINS_OP':
+                found.append(op.argval)
+                break
+            if nxt.opname not in _OPERAND_OPS or nxt.opname.startswith('CALL') and nxt.arg:
+                break
+    return found
+
+
+def _code_strings(code, out):
+    """Collect every keyword string of a code object (recursively)."""
+    out.update(_membership_strings(code))
+    for const in code.co_consts:
+        if isinstance(const, (tuple, frozenset)):
+            out.update(c for c in const if isinstance(c, str))
+        elif hasattr(const, 'co_code'):
+            _code_strings(const, out)
+    return out
+
+
+def _keyword_slots(code, out):
+    """
+    Keywords by position (recursively): one set per `in` operand and per
+    keyword list. Two codes of the same shape line up slot for slot, so a
+    keyword moved from one list to another shows up in both slots.
+    """
+    out.extend({s} for s in _membership_strings(code))
+    for const in code.co_consts:
+        if isinstance(const, (tuple, frozenset)):
+            out.append({c for c in const if isinstance(c, str)})
+        elif hasattr(const, 'co_code'):
+            _keyword_slots(const, out)
+    return out
+
+
+def _code_shape(code):
+    """
+    Bytecode, names and every constant except keywords: changes here are
+    logic changes. Result labels (`return 'entertainment'`) and numbers are
+    compared by value - a renamed label changes partners that contain none of
+    the diffed strings. Unloaded strings (the docstring) are left out.
+    """
+    keywords = set(_membership_strings(code))
+    loaded = {op.argval for op in dis.get_instructions(code) if op.opname == 'LOAD_CONST'
+              and isinstance(op.argval, str)}
+    consts = []
+    for c in code.co_consts:
+        if hasattr(c, 'co_code'):
+            consts.append(_code_shape(c))
+        elif isinstance(c, (tuple, frozenset)) and all(isinstance(v, str) for v in c):
+            consts.append(type(c).__name__)
+        elif isinstance(c, str):
+            consts.append('str' if c in keywords or c not in loaded else c)
+        else:
+            consts.append(repr(c))
+    return code.co_code, code.co_names, tuple(consts)
+
+
+def _keys_changed(old, new):
+    return {k for k in old.keys() | new.keys() if old.get(k) != new.get(k)}
+
+
+def rule_diff(old, new):
+    """
+    What changed between two rules modules, as:
+    {'keywords': set, 'names': set, 'names_within': set, 'all': bool, 'changes': [text]}
+    """
+    diff = {'keywords': set(), 'names': set(), 'names_within': set(), 'all': False, 'changes': []}
+
+    for fn in RULE_FUNCTIONS:
+        old_code, new_code = getattr(old, fn).__code__, getattr(new, fn).__code__
+        if _code_shape(old_code) != _code_shape(new_code):
+            diff['all'] = True
+            diff['changes'].append(f"{fn}: logic or result labels changed (every partner re-evaluated)")
+        old_strings, new_strings = _code_strings(old_code, set()), _code_strings(new_code, set())
+        for s in sorted(new_strings - old_strings):
+            diff['changes'].append(f"{fn}: + {s!r}")
+        for s in sorted(old_strings - new_strings):
+            diff['changes'].append(f"{fn}: - {s!r}")
+        diff['keywords'] |= old_strings ^ new_strings
+        # Same keywords overall, but in another list (or another `in` test)
+        moved = set()
+        for before, after in zip(_keyword_slots(old_code, []), _keyword_slots(new_code, [])):
+            moved |= before ^ after
+        moved -= old_strings ^ new_strings
+        diff['changes'] += [f"{fn}: ~ {s!r} (moved to another rule)" for s in sorted(moved)]
+        diff['keywords'] |= moved
+
+    for zone in old.ZONE_NEIGHBORHOODS.keys() | new.ZONE_NEIGHBORHOODS.keys():
+        before = set(old.ZONE_NEIGHBORHOODS.get(zone, ()))
+        after = set(new.ZONE_NEIGHBORHOODS.get(zone, ()))
+        for n in sorted(after - before):
+            diff['changes'].append(f"ZONE_NEIGHBORHOODS[{zone}]: + {n!r}")
+        for n in sorted(before - after):
+            diff['changes'].append(f"ZONE_NEIGHBORHOODS[{zone}]: - {n!r}")
+        diff['keywords'] |= before ^ after
+    # Zone order decides which zone wins when several neighborhoods match
+    if list(old.ZONE_NEIGHBORHOODS) != list(new.ZONE_NEIGHBORHOODS):
+        diff['all'] = True
+        diff['changes'].append("ZONE_NEIGHBORHOODS: zone order changed (every partner re-evaluated)")
+
+    indicators = set(old.ONLINE_REMOTE_INDICATORS) ^ set(new.ONLINE_REMOTE_INDICATORS)
+    diff['keywords'] |= indicators
+    diff['changes'] += [f"ONLINE_REMOTE_INDICATORS: ± {i!r}" for i in sorted(indicators)]
+
+    for table in ('KNOWN_BUSINESS_DATA', 'KNOWN_BUSINESS_AREAS', 'KNOWN_AREAS', 'CATEGORY_FIXES'):
+        changed = _keys_changed(getattr(old, table), getattr(new, table))
+        diff['names'] |= changed
+        diff['changes'] += [f"{table}: {k!r}" for k in sorted(changed)]
+        if table == 'KNOWN_AREAS':
+            # match_known_area() also matches known names inside partner names and vice versa
+            diff['keywords'] |= changed
+            diff['names_within'] |= changed
+    return diff
+
+
+def affected_rows(index, diff):
+    if diff['all']:
+        return set(range(len(index.ids)))
+    rows = set()
+    for kw in diff['keywords']:
+        if kw.strip():
+            rows |= index.containing(kw)
+    for name in diff['names']:
+        rows |= index.named(name)
+    for name in diff['names_within']:
+        rows |= index.names_within(name)
+    return rows
+
+
+# ============================================================
+# RE-EVALUATION
+# ============================================================
+def evaluate(rules, p, geo_area=None):
+    """
+    What a rules module decides for one partner: {'partner_type', 'area',
+    enrichment fields}. `geo_area` is the partner's zone polygon, which does
+    not depend on rules.py.
+    """
+    enrichment = rules.KNOWN_BUSINESS_DATA.get(normalize_name(p.name), {})
+    stages = ('categorize',) if p.area else ('categorize', 'area')
+    partner_type, area = rules.classify(p, geo_area, enrichment.get('address'), stages=stages)
+    result = {'partner_type': partner_type}
+    for field, value in enrichment.items():
+        if not getattr(p, field, None):
+            result[field] = value
+    if not p.area:
+        result['area'] = area
+    return {k: str(v) if v is not None else None for k, v in result.items()}
+
+
+def impact(old, new, rows, index):
+    """(diff, candidate count, [(row, {field: (old, new)})]) for two rules modules."""
+    diff = rule_diff(old, new)
+    candidates = affected_rows(index, diff)
+    changed = []
+    resolver = get_resolver()
+    for i in sorted(candidates):
+        p = Partner.from_row(rows[i])
+        geo_area = None
+        if not p.area and p.latitude is not None and p.longitude is not None:
+            geo_area = resolver.resolve(p.latitude, p.longitude)
+        before, after = evaluate(old, p, geo_area), evaluate(new, p, geo_area)
+        delta = {k: (before.get(k), after.get(k)) for k in before.keys() | after.keys()
+                 if before.get(k) != after.get(k)}
+        if delta:
+            changed.append((rows[i], delta))
+    return diff, len(candidates), changed
+
+
+def run(args):
+    snapshot = args.snapshot or SNAPSHOT_PATH
+    if not os.path.exists(snapshot):
+        print(f"❌ No snapshot at {snapshot}; run `scripts/gdd-data snapshot` first", file=sys.stderr)
+        sys.exit(1)
+    start = time.perf_counter()
+    rows = load_snapshot(snapshot)
+    index = load_index(rows, snapshot)
+    loaded = time.perf_counter()
+
+    import gdd_data.rules as new
+    old = load_rules(args.against)
+    diff, candidates, changed = impact(old, new, rows, index)
+    done = time.perf_counter()
+
+    if args.json:
+        print(json.dumps([{'id': r['id'], 'name': r.get('name'),
+                           'changes': {k: {'old': o, 'new': n} for k, (o, n) in d.items()}}
+                          for r, d in changed], indent=2, ensure_ascii=False))
+        return
+
+    print(f"🔎 Rule changes vs {args.against}:")
+    for line in diff['changes'] or ['(none)']:
+        print(f"    {line}")
+    print(f"\n   {candidates}/{len(rows)} partners could be affected; {len(changed)} change\n")
+    for r, delta in changed:
+        summary = ', '.join(f"{k}: {o} → {n}" for k, (o, n) in sorted(delta.items()))
+        print(f"  {(r.get('name') or '')[:45]:<45} | {summary}")
+    print(f"\n   snapshot+index {1000 * (loaded - start):.0f} ms, "
+          f"diff+re-evaluation {1000 * (done - loaded):.0f} ms")
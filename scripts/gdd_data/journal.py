@@ -0,0 +1,93 @@
+"""
+Run journal
+===========
+Append-only JSON-lines log of a long partner run, so an interrupted run can
+pick up where it stopped (`--resume`) instead of starting again from row 0:
+
+    {"start": "<stamp>", "job": "partners", "stages": [...]}
+    {"applied": "<id>"}              one per successful write
+    {"checkpoint": "<id>"}           after every row up to <id> is written
+    {"done": "<stamp>"}
+
+Resuming reads the file back: fetching restarts after the last checkpoint,
+and rows written after that checkpoint (but before the crash) are skipped.
+Each record is flushed and fsynced as it is written.
+"""
+
+import json
+import os
+import time
+
+DEFAULT_CACHE_DIR = os.environ.get("GDD_CACHE_DIR", ".cache/gdd-data")
+
+
+def journal_path(job, stages, shard=None):
+    """One journal per job, stage set and shard (k, n), so shard workers never share a file."""
+    suffix = f"-{shard[0]}of{shard[1]}" if shard else ''
+    return os.path.join(DEFAULT_CACHE_DIR, 'journals', f"{job}-{'+'.join(stages)}{suffix}.jsonl")
+
+
+class RunJournal:
+    def __init__(self, path, job, stages, resume=False):
+        self.path = path
+        self.applied = set()
+        self.checkpoint = None
+        self.finished = False
+        self.resumed = False
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        if resume and os.path.exists(self.path):
+            # Cut a torn last line off, or the next record would be appended to it
+            os.truncate(self.path, self._load(job, stages))
+            self.resumed = True
+            self.f = open(self.path, 'a')
+        else:
+            self.f = open(self.path, 'w')
+            self._append({'start': time.strftime('%Y-%m-%dT%H:%M:%S'), 'job': job,
+                          'stages': list(stages)})
+
+    def _load(self, job, stages):
+        """Read the journal back; returns the length of its intact part."""
+        intact = 0
+        with open(self.path) as f:
+            for line in iter(f.readline, ''):
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    record = None
+                if record is None or not line.endswith('\n'):
+                    # A torn last line from the crash; everything before it stands
+                    break
+                intact = f.tell()
+                if 'start' in record and (record.get('job'), record.get('stages')) != (job, list(stages)):
+                    raise ValueError(f"{self.path} is a journal for {record.get('job')} "
+                                     f"{record.get('stages')}, not {job} {list(stages)}")
+                if 'applied' in record:
+                    self.applied.add(record['applied'])
+                elif 'checkpoint' in record:
+                    self.checkpoint = record['checkpoint']
+                elif 'done' in record:
+                    self.finished = True
+        return intact
+
+    def _append(self, record):
+        self.f.write(json.dumps(record) + '\n')
+        self.f.flush()
+        os.fsync(self.f.fileno())
+
+    def is_applied(self, key):
+        return key in self.applied
+
+    def record_applied(self, key):
+        self.applied.add(key)
+        self._append({'applied': key})
+
+    def record_checkpoint(self, key):
+        self.checkpoint = key
+        self._append({'checkpoint': key})
+
+    def finish(self):
+        self.finished = True
+        self._append({'done': time.strftime('%Y-%m-%dT%H:%M:%S')})
+
+    def close(self):
+        self.f.close()
@@ -0,0 +1,370 @@
+"""
+Parse Med Contacts 1.xlsx and generate SQL INSERT statements for med_contacts table.
+Uses the "Contacts" sheet (primary, more detailed) and "Updated Contacts Feb 2026" sheet (supplementary).
+
+Run as `gdd-data parse-contacts`. Parsed sheets are cached by workbook content
+(gdd_data.parse_cache), so re-runs on an unchanged workbook skip openpyxl.
+Both sheets go through the single-pass gdd_data.sheet_parser, described by
+CONTACTS_SCHEMA and UPDATED_SCHEMA; --workbook parses another drop with the
+same layout (e.g. Med COntacts 2.xlsx).
+
+With --delta a new workbook drop is diffed against the previous import
+instead of regenerating the full seed: each record is fingerprinted by
+vendor + contact + account (its import_key, migration 292) and by content,
+and only inserted, updated and removed rows are written to a new migration.
+"""
+
+import hashlib
+import json
+import os
+import time
+
+from gdd_data.parse_cache import parse_workbook
+from gdd_data.records import MED_CONTACT_FIELDS, MedContact
+from gdd_data.sheet_parser import SheetSchema, parse_sheet
+
+WORKBOOK = 'data/marketing/Med COntacts 1.xlsx'
+SEED_FILE = 'supabase/migrations/20260303000003_seed_med_contacts.sql'
+JSON_FILE = 'data/marketing/parsed/med_contacts_parsed.json'
+# import_key -> content fingerprint of the last import (written by --delta)
+FINGERPRINTS_FILE = 'data/marketing/parsed/med_contacts_fingerprints.json'
+# Bump when the parse_* functions or clean() change, to invalidate cached sheets
+PARSER_VERSION = 2
+
+def clean(val):
+    """Clean cell value"""
+    if val is None:
+        return None
+    s = str(val).strip()
+    if s in ('', 'None', 'NA', 'N/A', 'NO PW LISTED', 'NO SITE LISTED'):
+        return None
+    return s
+
+def escape_sql(val):
+    """Escape single quotes for SQL"""
+    if val is None:
+        return 'NULL'
+    return "'" + val.replace("'", "''") + "'"
+
+def _account(val):
+    # Account numbers come through as floats ("1234.0"); historical quirk: this
+    # also strips trailing zeros/dots from any account number
+    return str(val).rstrip('.0') if val else None
+
+def _contacts_record(row, state):
+    contact = row['contact']
+    # A sub-entry's contact without email/phone is a role label like "Sherman Oaks Rep"
+    sub_label = contact if state.sub_entry and contact and not row['email'] and not row['phone'] else None
+    notes = [n for n in (row['notes'], row['issues']) if n]
+    return MedContact(
+        vendor_name=state.vendor or 'Unknown',
+        category=state.section,
+        sub_label=row['misc_info'] or sub_label,
+        contact_name=contact,
+        contact_email=row['email'],
+        contact_phone=row['phone'],
+        account_number=_account(row['account']),
+        website=row['website'],
+        login_user_id=row['user_id'],
+        login_password=row['password'],
+        order_method=row['order_method'],
+        payment_method=row['payment_method'],
+        notes='; '.join(notes) if notes else None,
+    )
+
+# Headers: Vendor, Account Forms filled out, Misc Info, Contact, Email, Phone,
+#          Account #, Website, User ID, Password, Order Method, Payment Method,
+#          Notes, Issues, Statements, Itemized order emails, Orders
+#
+# An ALL CAPS vendor with no contact or login details is a category header;
+# rows with a blank vendor are sub-entries (other reps, other logins) of the
+# vendor above.
+CONTACTS_SCHEMA = SheetSchema(
+    columns={'vendor': 0, 'misc_info': 2, 'contact': 3, 'email': 4, 'phone': 5, 'account': 6,
+             'website': 7, 'user_id': 8, 'password': 9, 'order_method': 10,
+             'payment_method': 11, 'notes': 12, 'issues': 13},
+    key='vendor',
+    entry=('contact', 'email', 'phone', 'website', 'user_id', 'password', 'account'),
+    build=_contacts_record,
+    header_unless=('contact', 'email', 'phone', 'website', 'user_id', 'password'),
+    is_header=lambda vendor: vendor == vendor.upper(),
+    default_section='General',
+    clean=clean,
+)
+
+def _updated_record(row, state):
+    notes = [n for n in (row['info'], row['misc1'], row['misc2']) if n]
+    return MedContact(
+        vendor_name=state.vendor,
+        category='Updated Feb 2026',
+        sub_label=row['info'],
+        contact_name=row['contact_name'],
+        contact_email=row['contact_email'],
+        contact_phone=row['contact_phone'],
+        account_number=_account(row['acct_no']),
+        website=row['website'],
+        login_user_id=row['user_id'],
+        login_password=row['password'],
+        notes='; '.join(notes) if notes else None,
+        location=row['location'],
+        department=row['dept'],
+        browser_preference=row['browser'],
+    )
+
+# Headers: VENDOR, INFO, FORM FILLED, DATE FILLED, ACCT NO, LOCATION, DEPT, COSTS, CCFEES,
+#          WEBSITE, USER, PW, CONTACT NAME, CONTACT EM, CONTACT PH, CHROME/SAFARI, MISC, MISC
+#
+# Every entry names its vendor. A vendor with nothing else filled starts a
+# section; entries under "OLD - NO LONGER USING" are dropped until the next
+# section ("CE ONLY (BILLING)").
+_UPDATED_DATA = ('info', 'website', 'user_id', 'password', 'contact_name', 'contact_email',
+                 'contact_phone', 'acct_no')
+UPDATED_SCHEMA = SheetSchema(
+    columns={'vendor': 0, 'info': 1, 'acct_no': 4, 'location': 5, 'dept': 6, 'website': 9,
+             'user_id': 10, 'password': 11, 'contact_name': 12, 'contact_email': 13,
+             'contact_phone': 14, 'browser': 15, 'misc1': 16, 'misc2': 17},
+    key='vendor',
+    entry=_UPDATED_DATA,
+    build=_updated_record,
+    header_unless=_UPDATED_DATA,
+    sub_entries=False,
+    skip_keys=frozenset({'VENDOR'}),
+    is_retired=lambda section: 'OLD' in section and 'NO LONGER' in section,
+    clean=clean,
+)
+
+def parse_contacts_sheet(ws):
+    """Parse the main Contacts sheet"""
+    return parse_sheet(ws, CONTACTS_SCHEMA)
+
+def parse_updated_sheet(ws):
+    """Parse the Updated Contacts Feb 2026 sheet"""
+    return parse_sheet(ws, UPDATED_SCHEMA)
+
+def contact_key(c):
+    return (c.vendor_name, c.login_user_id, c.contact_name)
+
+def deduplicate(contacts_main, contacts_updated, key=contact_key):
+    """Merge contacts, preferring main sheet data but adding unique entries from updated sheet"""
+    # Use main sheet as primary
+    all_contacts = list(contacts_main)
+    
+    # Track existing keys (vendor+user combos for contacts) from main sheet
+    existing = set()
+    for c in contacts_main:
+        existing.add(key(c))
+    
+    # Add unique entries from updated sheet
+    for c in contacts_updated:
+        k = key(c)
+        if k not in existing:
+            all_contacts.append(c)
+            existing.add(k)
+    
+    return all_contacts
+
+def generate_sql(contacts):
+    """Generate SQL INSERT statements"""
+    lines = []
+    lines.append("-- Auto-generated from Med Contacts 1.xlsx and Med Contacts 2.xlsx")
+    lines.append("-- Generated on 2026-03-03")
+    lines.append("")
+    lines.append("INSERT INTO public.med_contacts (vendor_name, category, sub_label, contact_name, contact_email, contact_phone, account_number, website, login_user_id, login_password, order_method, payment_method, notes, location, department, browser_preference, is_active)")
+    lines.append("VALUES")
+    
+    value_rows = []
+    for c in contacts:
+        row = "({}, {}, {}, {}, {}, {}, {}, {}, {}, {}, {}, {}, {}, {}, {}, {}, true)".format(
+            escape_sql(c.vendor_name),
+            escape_sql(c.category),
+            escape_sql(c.sub_label),
+            escape_sql(c.contact_name),
+            escape_sql(c.contact_email),
+            escape_sql(c.contact_phone),
+            escape_sql(c.account_number),
+            escape_sql(c.website),
+            escape_sql(c.login_user_id),
+            escape_sql(c.login_password),
+            escape_sql(c.order_method),
+            escape_sql(c.payment_method),
+            escape_sql(c.notes),
+            escape_sql(c.location),
+            escape_sql(c.department),
+            escape_sql(c.browser_preference),
+        )
+        value_rows.append(row)
+    
+    lines.append(',\n'.join(value_rows))
+    lines.append(";")
+    
+    return '\n'.join(lines)
+
+# ============================================================
+# DELTA IMPORT
+# ============================================================
+def import_keys(contacts):
+    """
+    Stable identity per record: vendor + contact + account, plus the login for
+    vendors listing several logins without a contact or account (VetConnect
+    Plus). Records still sharing all of them are told apart by occurrence.
+    """
+    seen = {}
+    keys = []
+    for c in contacts:
+        identity = (c.vendor_name, c.contact_name, c.account_number, c.login_user_id)
+        n = seen[identity] = seen.get(identity, 0) + 1
+        payload = json.dumps(list(identity) + [n], ensure_ascii=False)
+        keys.append(hashlib.sha256(payload.encode('utf-8')).hexdigest()[:24])
+    return keys
+
+def fingerprint(c):
+    payload = json.dumps([getattr(c, f) for f in MED_CONTACT_FIELDS], ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:24]
+
+def diff_contacts(previous, contacts):
+    """
+    previous: {import_key: fingerprint}. Returns (inserted, updated, removed):
+    [(key, contact)], [(key, contact)], [key].
+    """
+    current = dict(zip(import_keys(contacts), contacts))
+    inserted = [(k, c) for k, c in current.items() if k not in previous]
+    updated = [(k, c) for k, c in current.items() if k in previous and previous[k] != fingerprint(c)]
+    removed = [k for k in previous if k not in current]
+    return inserted, updated, removed
+
+def generate_backfill_sql(contacts):
+    """
+    One-time: give the rows inserted by the original seed their import_key.
+    Matched on columns the data-quality fixes leave untouched; LIMIT 1 keeps
+    exact duplicates apart.
+    """
+    lines = ["-- Backfill import_key on rows from the original seed"]
+    for key, c in zip(import_keys(contacts), contacts):
+        lines.append(
+            f"UPDATE public.med_contacts SET import_key = '{key}' WHERE id = ("
+            f"SELECT id FROM public.med_contacts WHERE import_key IS NULL"
+            f" AND vendor_name = {escape_sql(c.vendor_name)}"
+            f" AND category IS NOT DISTINCT FROM {escape_sql(c.category)}"
+            f" AND sub_label IS NOT DISTINCT FROM {escape_sql(c.sub_label)}"
+            f" AND account_number IS NOT DISTINCT FROM {escape_sql(c.account_number)}"
+            f" AND login_user_id IS NOT DISTINCT FROM {escape_sql(c.login_user_id)}"
+            f" ORDER BY created_at, id LIMIT 1);")
+    return lines
+
+def generate_delta_sql(inserted, updated, removed, backfill=(), workbook=WORKBOOK):
+    """Migration applying only the changed rows, addressed by import_key."""
+    lines = [f"-- Auto-generated delta from {os.path.basename(workbook)}",
+             f"-- Generated on {time.strftime('%Y-%m-%d')}: "
+             f"{len(inserted)} inserted, {len(updated)} updated, {len(removed)} removed",
+             ""]
+    if backfill:
+        lines += list(backfill) + [""]
+    if removed:
+        keys = ', '.join(f"'{k}'" for k in removed)
+        lines += [f"DELETE FROM public.med_contacts WHERE import_key IN ({keys});", ""]
+    for key, c in updated:
+        assignments = ', '.join(f"{f} = {escape_sql(getattr(c, f))}" for f in MED_CONTACT_FIELDS)
+        lines.append(f"UPDATE public.med_contacts SET {assignments}, updated_at = now() "
+                     f"WHERE import_key = '{key}';")
+    if updated:
+        lines.append("")
+    if inserted:
+        columns = ', '.join(MED_CONTACT_FIELDS + ('import_key', 'is_active'))
+        lines.append(f"INSERT INTO public.med_contacts ({columns})")
+        lines.append("VALUES")
+        lines.append(',\n'.join(
+            "(" + ', '.join([escape_sql(getattr(c, f)) for f in MED_CONTACT_FIELDS] + [f"'{key}'", 'true']) + ")"
+            for key, c in inserted))
+        lines.append(";")
+    return '\n'.join(lines) + '\n'
+
+def previous_import():
+    """
+    ({import_key: fingerprint} of the last import, needs_backfill). Before the
+    first delta only the seed's JSON exists; its rows have no import_key yet.
+    """
+    if os.path.exists(FINGERPRINTS_FILE):
+        with open(FINGERPRINTS_FILE) as f:
+            return json.load(f)['records'], None
+    with open(JSON_FILE) as f:
+        seeded = [MedContact(**row) for row in json.load(f)]
+    return dict(zip(import_keys(seeded), map(fingerprint, seeded))), seeded
+
+def write_delta(all_contacts, workbook=WORKBOOK):
+    previous, seeded = previous_import()
+    inserted, updated, removed = diff_contacts(previous, all_contacts)
+    print(f"\nDelta vs previous import: {len(inserted)} inserted, {len(updated)} updated, "
+          f"{len(removed)} removed, {len(all_contacts) - len(inserted) - len(updated)} unchanged")
+    if not (inserted or updated or removed):
+        print("Nothing to import")
+        return
+    
+    backfill = generate_backfill_sql(seeded) if seeded else ()
+    sql = generate_delta_sql(inserted, updated, removed, backfill, workbook)
+    output_file = f"supabase/migrations/{time.strftime('%Y%m%d%H%M%S')}_med_contacts_delta.sql"
+    with open(output_file, 'w') as f:
+        f.write(sql)
+    print(f"Delta SQL written to {output_file} ({len(sql.encode('utf-8')) / 1024:.1f} KB)")
+    
+    # The new import becomes the baseline for the next one
+    with open(FINGERPRINTS_FILE, 'w') as f:
+        json.dump({'workbook': os.path.basename(workbook), 'generated': time.strftime('%Y-%m-%d'),
+                   'records': {k: fingerprint(c) for k, c in zip(import_keys(all_contacts), all_contacts)}},
+                  f, indent=2)
+    print(f"Fingerprints written to {FINGERPRINTS_FILE}")
+
+def run(args):
+    workbook = args.workbook or WORKBOOK
+    start = time.perf_counter()
+    sheets, cached = parse_workbook(workbook, {
+        'Contacts': parse_contacts_sheet,
+        'Updated Contacts Feb 2026': parse_updated_sheet,
+    }, PARSER_VERSION, use_cache=not args.no_cache)
+    
+    def source(sheet):
+        return ' (cached)' if sheet in cached else ''
+    
+    # Main Contacts sheet
+    contacts_main = sheets['Contacts']
+    print(f"Parsed {len(contacts_main)} contacts from main Contacts sheet{source('Contacts')}")
+    
+    # Updated sheet
+    contacts_updated = sheets['Updated Contacts Feb 2026']
+    print(f"Parsed {len(contacts_updated)} contacts from Updated Contacts Feb 2026 sheet"
+          f"{source('Updated Contacts Feb 2026')}")
+    print(f"  ({1000 * (time.perf_counter() - start):.0f} ms)")
+    
+    # Deduplicate
+    all_contacts = deduplicate(contacts_main, contacts_updated)
+    print(f"Total unique contacts after dedup: {len(all_contacts)}")
+    
+    if args.delta:
+        write_delta(all_contacts, workbook)
+    else:
+        if os.path.exists(FINGERPRINTS_FILE):
+            print(f"⚠️ Delta imports exist ({FINGERPRINTS_FILE}); the regenerated seed will not "
+                  f"match the database. Use --delta for new workbook drops.")
+        # Generate SQL
+        sql = generate_sql(all_contacts)
+        
+        output_file = SEED_FILE
+        with open(output_file, 'w') as f:
+            f.write(sql)
+        
+        print(f"SQL written to {output_file}")
+    
+    # Also output JSON for reference
+    json_file = JSON_FILE
+    with open(json_file, 'w') as f:
+        json.dump([c.to_dict() for c in all_contacts], f, indent=2, default=str)
+    
+    print(f"JSON written to {json_file}")
+    
+    # Summary by category
+    categories = {}
+    for c in all_contacts:
+        cat = c.category or 'Unknown'
+        categories[cat] = categories.get(cat, 0) + 1
+    print("\nBy category:")
+    for cat, count in sorted(categories.items()):
+        print(f"  {cat}: {count}")
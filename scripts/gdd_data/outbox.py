@@ -0,0 +1,277 @@
+"""
+Partner write outbox
+====================
+Partner writes are queued in a local SQLite outbox instead of being sent
+inline, and a background flusher drains it in batches. Computing never waits
+on Supabase, and a slow or unreachable Supabase only delays writes:
+
+- each page of changes is committed to disk before the write stage moves on;
+- a batch goes out as one apply_marketing_partner_updates() call (migration
+  291), every change conditional on the updated_at it was computed from;
+  without that function, changes fall back to single conditional PATCHes;
+- network errors, timeouts, 429 and 5xx responses are retried with
+  exponential backoff (1s doubling up to 5 min); other 4xx responses mark
+  the change failed;
+- a change whose partner was edited meanwhile is passed to `on_stale`, which
+  re-reads and re-classifies the partner and returns what is left to write.
+
+Changes still pending when a run stops waiting (--flush-timeout) stay in the
+outbox file and go out on the next run of the same job, or with
+`gdd-data flush`.
+"""
+
+import glob
+import json
+import os
+import sqlite3
+import threading
+import time
+import urllib.error
+from collections import Counter
+
+from gdd_data.postgrest import build_query, transient
+
+DEFAULT_CACHE_DIR = os.environ.get("GDD_CACHE_DIR", ".cache/gdd-data")
+OUTBOX_DIR = os.path.join(DEFAULT_CACHE_DIR, 'outbox')
+BULK_FUNCTION = 'apply_marketing_partner_updates'
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 300.0
+# Re-classifications of a partner that keeps changing before its change is given up as stale
+MAX_CONFLICTS = 3
+
+
+def outbox_path(job, shard=None):
+    suffix = f"-{shard[0]}of{shard[1]}" if shard else ''
+    return os.path.join(OUTBOX_DIR, f"{job}{suffix}.sqlite")
+
+
+class Outbox:
+    """Durable queue of partner changes with a background bulk flusher."""
+
+    def __init__(self, client, path, batch_size=200, on_stale=None, tag=''):
+        self.client = client
+        self.path = path
+        self.batch_size = batch_size
+        self.on_stale = on_stale
+        self.tag = tag
+        self.bulk = True
+        self.stats = Counter()
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS outbox (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                partner_id TEXT NOT NULL,
+                name TEXT,
+                fields TEXT NOT NULL,
+                updated_at TEXT,
+                changes TEXT,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                conflicts INTEGER NOT NULL DEFAULT 0,
+                next_attempt REAL NOT NULL DEFAULT 0,
+                last_error TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_outbox_due ON outbox(status, next_attempt);
+        """)
+        # Finished entries from earlier runs are not needed any more; pending ones go out first
+        self.conn.execute("DELETE FROM outbox WHERE status IN ('done', 'superseded')")
+        self.conn.execute("UPDATE outbox SET next_attempt = 0 WHERE status = 'pending'")
+        self.conn.commit()
+        self.carried = self.count('pending')
+        self.wake = threading.Event()
+        self.closing = threading.Event()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._flush_loop, name='outbox', daemon=True)
+        self.thread.start()
+
+    # ---- queueing ----
+    def put_many(self, items, conflicts=0):
+        """Durably queue [(partner, fields, changes)] in one transaction."""
+        rows = [(p.id, p.name, json.dumps(fields), p.updated_at, ', '.join(changes), conflicts)
+                for p, fields, changes in items]
+        if not rows:
+            return
+        with self.lock:
+            self.conn.executemany(
+                "INSERT INTO outbox (partner_id, name, fields, updated_at, changes, conflicts) "
+                "VALUES (?, ?, ?, ?, ?, ?)", rows)
+            self.conn.commit()
+        self.stats['queued'] += len(rows)
+        self.wake.set()
+
+    def count(self, status):
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM outbox WHERE status = ?", (status,)).fetchone()[0]
+
+    # ---- flushing ----
+    def _due(self):
+        with self.lock:
+            return self.conn.execute(
+                "SELECT seq, partner_id, name, fields, updated_at, changes, attempts, conflicts FROM outbox "
+                "WHERE status = 'pending' AND next_attempt <= ? ORDER BY seq LIMIT ?",
+                (time.time(), self.batch_size)).fetchall()
+
+    def _next_due_in(self):
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT MIN(next_attempt) FROM outbox WHERE status = 'pending'").fetchone()
+        return None if row[0] is None else max(0.0, row[0] - time.time())
+
+    def _flush_loop(self):
+        while not self.stopped.is_set():
+            batch = self._due()
+            if batch:
+                self._flush(batch)
+                continue
+            wait = self._next_due_in()
+            if wait is None and self.closing.is_set():
+                return
+            self.wake.wait(wait)
+            self.wake.clear()
+
+    def _flush(self, batch):
+        if not self.bulk and len(batch) > 1:
+            # Without the bulk function each change is its own PATCH; flushing them one
+            # by one records each as it lands, so a failure part-way through never
+            # re-sends (and then mistakes for stale) the ones already applied
+            for entry in batch:
+                self._flush([entry])
+            return
+        try:
+            applied = self._send(batch)
+        except OSError as e:
+            if transient(e):
+                self._retry(batch, e)
+            elif len(batch) > 1:
+                # One bad change fails the whole bulk call; send them one by one to isolate it
+                for entry in batch:
+                    self._flush([entry])
+            else:
+                detail = e.read().decode('utf-8') if isinstance(e, urllib.error.HTTPError) else ''
+                self._set(batch, 'failed', error=f"{e} {detail}".strip())
+                self.stats['failed'] += 1
+                print(f"  ❌ {self.tag}{(batch[0][2] or '')[:45]:<45} | FAILED: {e} {detail}".rstrip())
+            return
+        if applied is None:
+            self._flush(batch)
+            return
+        done = [entry for entry in batch if entry[1] in applied]
+        self._set(done, 'done')
+        self.stats['done'] += len(done)
+        for entry in done:
+            print(f"  ✅ {self.tag}{(entry[2] or '')[:45]:<45} | {entry[5]}")
+        for entry in batch:
+            if entry[1] not in applied:
+                self._stale(entry)
+
+    def _send(self, batch):
+        """
+        Apply a batch; returns the set of partner ids that were updated, or None
+        when the bulk function turns out to be missing and nothing was sent.
+        """
+        changes = [{'id': pid, 'updated_at': updated_at, 'fields': json.loads(fields)}
+                   for _, pid, _, fields, updated_at, _, _, _ in batch]
+        if self.bulk:
+            try:
+                return set(self.client.request('POST', f"rpc/{BULK_FUNCTION}", {'changes': changes}) or ())
+            except urllib.error.HTTPError as e:
+                if e.code != 404:
+                    raise
+                self.bulk = False
+                print(f"  ⚠️ {BULK_FUNCTION}() not found (migration 291); "
+                      f"falling back to one PATCH per partner")
+                return None
+        applied = set()
+        for change in changes:
+            unchanged = (f"updated_at=eq.{change['updated_at']}" if change['updated_at']
+                         else 'updated_at=is.null')
+            query = build_query(['id'], [f"id=eq.{change['id']}", unchanged])
+            if self.client.request('PATCH', f"marketing_partners?{query}", change['fields'],
+                                   headers={"Prefer": "return=representation"}):
+                applied.add(change['id'])
+        return applied
+
+    def _retry(self, batch, error):
+        with self.lock:
+            for seq, *_, attempts, _ in batch:
+                delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempts)
+                self.conn.execute(
+                    "UPDATE outbox SET attempts = attempts + 1, next_attempt = ?, last_error = ? "
+                    "WHERE seq = ?", (time.time() + delay, str(error), seq))
+            self.conn.commit()
+        self.stats['retries'] += 1
+        delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** min(entry[6] for entry in batch))
+        print(f"  ⏳ {self.tag}{len(batch)} writes deferred {delay:.0f}s: {error}")
+
+    def _stale(self, entry):
+        """The partner changed after the change was computed: re-classify or give up."""
+        seq, pid, name, _, _, _, _, conflicts = entry
+        if self.on_stale is None or conflicts >= MAX_CONFLICTS:
+            self._set([entry], 'stale')
+            self.stats['stale'] += 1
+            print(f"  ⚠️ {self.tag}{(name or '')[:45]:<45} | edited since computed; not written")
+            return
+        try:
+            p, fields, changes = self.on_stale(pid)
+        except OSError as e:
+            if transient(e):
+                self._retry([entry], e)
+            else:
+                self._set([entry], 'failed', error=str(e))
+                self.stats['failed'] += 1
+            return
+        self.stats['reclassified'] += 1
+        with self.lock:
+            self.conn.execute("UPDATE outbox SET status = 'superseded' WHERE seq = ?", (seq,))
+            self.conn.commit()
+        if p is None or not fields:
+            self.stats['unchanged'] += 1
+            print(f"  ↩️  {self.tag}{(name or '')[:45]:<45} | edited meanwhile; nothing left to change")
+        else:
+            self.put_many([(p, fields, changes)], conflicts=conflicts + 1)
+
+    def _set(self, batch, status, error=None):
+        with self.lock:
+            self.conn.executemany("UPDATE outbox SET status = ?, last_error = ? WHERE seq = ?",
+                                  [(status, error, entry[0]) for entry in batch])
+            self.conn.commit()
+
+    # ---- shutdown ----
+    def close(self, timeout=None):
+        """
+        Wait up to `timeout` seconds for everything queued to be sent, then stop.
+        Returns the final status: {'done', 'failed', 'stale', 'pending', ...}.
+        """
+        self.closing.set()
+        self.wake.set()
+        self.thread.join(timeout)
+        self.stopped.set()
+        self.wake.set()
+        # A request in flight finishes (or times out) before the flusher stops
+        self.thread.join()
+        status = dict(self.stats, pending=self.count('pending'))
+        with self.lock:
+            self.conn.close()
+        return status
+
+
+def run(args):
+    """`gdd-data flush`: send whatever earlier runs left queued."""
+    from gdd_data.config import supabase_client
+
+    client = supabase_client()
+    paths = args.outbox or sorted(glob.glob(os.path.join(OUTBOX_DIR, '*.sqlite')))
+    if not paths:
+        print(f"✅ No outbox files in {OUTBOX_DIR}")
+        return
+    for path in paths:
+        # No re-classification here: changes to partners edited since are reported stale,
+        # and the next partners run recomputes them
+        outbox = Outbox(client, path, batch_size=args.batch_size)
+        print(f"📤 {path}: {outbox.carried} queued changes")
+        status = outbox.close(args.timeout)
+        print(f"   sent {status.get('done', 0)}, failed {status.get('failed', 0)}, "
+              f"stale {status.get('stale', 0)}, still queued {status['pending']}")
@@ -0,0 +1,85 @@
+"""
+Parsed workbook cache
+=====================
+Loading an .xlsx with openpyxl and walking its rows is by far the slowest part
+of the spreadsheet scripts, and the workbooks rarely change between runs.
+Parsed records are pickled under $GDD_CACHE_DIR/parsed, keyed on
+
+    sha256(file bytes) + sheet name + parser (module.function) + parser version
+
+so an unchanged file, or a byte-identical copy under another name, is never
+parsed twice. Workbooks are opened read-only, so parsers get streaming
+worksheets (iter_rows only, no random cell access). Bump the caller's parser
+version whenever the parsing code changes; editing the workbook changes its
+hash on its own. The workbook is only opened when at least one requested sheet
+misses.
+"""
+
+import hashlib
+import os
+import pickle
+
+DEFAULT_CACHE_DIR = os.environ.get("GDD_CACHE_DIR", ".cache/gdd-data")
+PARSED_DIR = os.path.join(DEFAULT_CACHE_DIR, 'parsed')
+
+
+def file_digest(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def cache_key(digest, sheet, parser, version):
+    spec = f"{digest}\0{sheet}\0{parser.__module__}.{parser.__qualname__}\0{version}"
+    return hashlib.sha256(spec.encode('utf-8')).hexdigest()
+
+
+def _load(key):
+    try:
+        with open(os.path.join(PARSED_DIR, key + '.pickle'), 'rb') as f:
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError):
+        # Missing, torn or written by an incompatible record class: parse again
+        return None
+
+
+def _store(key, records):
+    os.makedirs(PARSED_DIR, exist_ok=True)
+    path = os.path.join(PARSED_DIR, key + '.pickle')
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'wb') as f:
+        pickle.dump(records, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+
+
+def parse_workbook(path, parsers, version, use_cache=True):
+    """
+    Parse sheets of one workbook: `parsers` maps sheet name -> parser(ws).
+    Returns ({sheet: records}, set of sheet names served from the cache).
+    """
+    digest = file_digest(path)
+    keys = {sheet: cache_key(digest, sheet, parser, version) for sheet, parser in parsers.items()}
+    results = {}
+    if use_cache:
+        for sheet, key in keys.items():
+            records = _load(key)
+            if records is not None:
+                results[sheet] = records
+    cached = set(results)
+
+    missing = [sheet for sheet in parsers if sheet not in results]
+    if missing:
+        # openpyxl is only needed (and only imported) when a workbook is parsed
+        import openpyxl
+
+        # Read-only mode streams rows instead of building every cell up front
+        wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+        try:
+            for sheet in missing:
+                results[sheet] = parsers[sheet](wb[sheet])
+                _store(keys[sheet], results[sheet])
+        finally:
+            wb.close()
+    return results, cached
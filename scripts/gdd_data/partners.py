@@ -0,0 +1,470 @@
+"""
+Marketing Partners: Categorization, Enrichment & Area Assignment
+================================================================
+1. Re-categorize partners based on name, notes, and services_provided
+2. Lookup of missing address/contact/social data through an enrichment
+   provider (ENRICHMENT_PROVIDER: "local" known-business table by default,
+   "local,google" to fall back to Google Places)
+3. Assign area zones based on address/name location cues (matching referral CRM zones)
+
+Category fixes and the known-area list (formerly assign-partner-areas.py) are
+evaluated in the same pass, so each changed partner gets at most one write.
+
+Run as `gdd-data partners` (all stages) or `gdd-data categorize|enrich|area`.
+
+Full passes can be split across processes or machines: `--shard K/N` takes
+one of N id partitions, `--workers N` runs all N locally. Writes go through a
+durable local outbox (gdd_data.outbox) flushed in bulk in the background; each
+is conditional on the updated_at value read, so a partner edited in the UI
+meanwhile is re-read and re-classified instead of overwritten.
+"""
+
+import argparse
+import multiprocessing
+import os
+import queue
+import uuid
+from collections import Counter
+
+from gdd_data.changeset import ChangesetWriter, default_changeset_path, read_changeset
+from gdd_data.classify_cache import ClassificationCache
+from gdd_data.config import supabase_client
+from gdd_data.enrichment import Enricher, load_provider, normalize_name
+from gdd_data.geo import get_resolver
+from gdd_data.geocode import BACKENDS as GEOCODE_BACKENDS, Geocoder, normalize_address
+from gdd_data.journal import RunJournal, journal_path
+from gdd_data.outbox import Outbox, outbox_path
+from gdd_data.pipeline import Pipeline
+from gdd_data.records import PARTNER_FIELDS, Partner, intern_value, PartnerType, Area
+from gdd_data.rules import CATEGORY_FIXES, KNOWN_BUSINESS_DATA, classification_ruleset, classify
+
+# ============================================================
+# STAGE INPUTS (columns each stage reads, rows it can change)
+# ============================================================
+ENRICH_FIELDS = ('website', 'address', 'instagram_handle', 'facebook_url',
+                 'tiktok_handle', 'youtube_url')
+
+STAGES = {
+    'categorize': {
+        'columns': ('name', 'partner_type', 'services_provided', 'notes', 'category'),
+        # categorize_partner() always keeps these types as-is, but a CATEGORY_FIXES
+        # name is re-typed whatever its type (matched loosely; extra rows are harmless)
+        'filters': ('or=(partner_type.is.null,partner_type.not.in.(exotic_shop,food_vendor,chamber,rescue),'
+                    + ','.join(f'name.ilike."*{name}*"' for name in CATEGORY_FIXES) + ')',),
+    },
+    'enrich': {
+        'columns': ('name',) + ENRICH_FIELDS,
+        # Enrichment only fills blanks (NULL or empty)
+        'filters': ('or=(' + ','.join(f'{f}.is.null,{f}.eq.' for f in ENRICH_FIELDS) + ')',),
+    },
+    'area': {
+        'columns': ('name', 'address', 'notes', 'proximity_to_location', 'area',
+                    'latitude', 'longitude'),
+        # Existing areas are never overwritten
+        'filters': ('area=is.null',),
+    },
+}
+
+
+def partner_query(stages):
+    """
+    Columns and pushed-down filters for a run of `stages`.
+
+    Columns are the union of what the stages read. Filters are only pushed down
+    for a single-stage run; with several stages a row skipped by one stage may
+    still be changed by another.
+    """
+    wanted = {'id', 'updated_at'}.union(*(STAGES[s]['columns'] for s in stages))
+    columns = [f for f in PARTNER_FIELDS if f in wanted]
+    filters = STAGES[stages[0]]['filters'] if len(stages) == 1 else ()
+    return columns, filters
+
+
+def shard_filters(shard):
+    """
+    Filters selecting shard (k, n), 1-based, of marketing_partners.
+
+    Partner ids are random (gen_random_uuid), so n equal ranges of the UUID
+    space split the rows as evenly as hashing the id would, and each shard is
+    still an index range that keyset pagination walks in id order.
+    """
+    k, n = shard
+    
+    def bound(i):
+        return uuid.UUID(int=i * (1 << 128) // n)
+    
+    filters = []
+    if k > 1:
+        filters.append(f"id=gte.{bound(k - 1)}")
+    if k < n:
+        filters.append(f"id=lt.{bound(k)}")
+    return filters
+
+
+def reclassifier(client, columns, stages, cache, enricher, geocoder):
+    """reclassify(id) for the outbox: re-read one partner and classify it again."""
+    def reclassify(partner_id):
+        rows = client.select('marketing_partners', columns, [f"id=eq.{partner_id}"], limit=1)
+        if not rows:
+            return None, {}, []
+        p = Partner.from_row(rows[0])
+        batch = lookup_batch([p], stages, enricher, geocoder)
+        # Counted once already, when the stale row was classified
+        return (p,) + classify_partner(p, stages, cache, batch, Counter())
+    return reclassify
+
+
+def needs_enrichment(p, stages):
+    """Whether an enrichment lookup could change anything the stages write for `p`."""
+    if 'enrich' in stages and not all(getattr(p, f) for f in ENRICH_FIELDS):
+        return True
+    # The area stage only falls back to the looked-up address
+    return 'area' in stages and not p.area and not p.address
+
+
+def lookup_batch(partners, stages, enricher, geocoder):
+    """
+    External lookups for one page of partners: enrichment by name, optional
+    geocoding of area-less partners, and polygon areas for located partners.
+    """
+    batch = {'partners': partners, 'enrichment': {}, 'geocoded': {}, 'geo_areas': {},
+             'to_geocode': 0}
+    
+    # Enrichment lookups fan out concurrently (remote providers are cached and rate limited),
+    # only for partners with a blank to fill or an area to find without an address
+    if enricher:
+        batch['enrichment'] = enricher.lookup_many(
+            p.name for p in partners if needs_enrichment(p, stages))
+    
+    # Optionally geocode area-less partners that only have an address (cached by address)
+    if geocoder:
+        def address_of(p):
+            return p.address or batch['enrichment'].get(normalize_name(p.name), {}).get('address')
+        
+        to_geocode = [p for p in partners if not p.area and p.latitude is None and address_of(p)]
+        by_address = geocoder.geocode_many(address_of(p) for p in to_geocode)
+        for p in to_geocode:
+            result = by_address.get(normalize_address(address_of(p)))
+            if result:
+                batch['geocoded'][p.id] = result
+                p.latitude, p.longitude = result['lat'], result['lng']
+        batch['to_geocode'] = len(to_geocode)
+    
+    # Geocoded partners get their area from the zone polygons, in one batch
+    if 'area' in stages:
+        located = [p for p in partners if not p.area and p.latitude is not None]
+        resolved = get_resolver().resolve_many((p.latitude, p.longitude) for p in located)
+        batch['geo_areas'] = {p.id: area for p, area in zip(located, resolved) if area}
+    return batch
+
+
+def classify_partner(p, stages, cache, batch, stats):
+    """The updates (and printable changes) the requested stages make to one partner."""
+    pid = p.id
+    name = p.name
+    updates = {}
+    changes = []
+    
+    # ---- 1. CATEGORIZATION ----
+    if 'categorize' in stages:
+        new_type = intern_value(classify(p, lookup=cache.lookup, stages=('categorize',))[0],
+                                PartnerType)
+        if new_type and new_type != p.partner_type:
+            updates['partner_type'] = new_type
+            changes.append(f"type: {p.partner_type} → {new_type}")
+            stats['categorized'] += 1
+    
+    # ---- 2. ENRICHMENT (only fill blanks) ----
+    enrichment = batch['enrichment'].get(normalize_name(name), {})
+    if 'enrich' in stages:
+        for field in ENRICH_FIELDS:
+            if field in enrichment and not getattr(p, field):
+                updates[field] = enrichment[field]
+                changes.append(f"{field}: → {enrichment[field][:40]}")
+                stats['enriched'] += 1
+    
+    # ---- 3. AREA ASSIGNMENT ----
+    if 'area' in stages and not p.area:
+        area = intern_value(classify(p, batch['geo_areas'].get(pid), enrichment.get('address'),
+                                     cache.lookup, stages=('area',))[1], Area)
+        
+        if pid in batch['geocoded']:
+            result = batch['geocoded'][pid]
+            updates.update(latitude=result['lat'], longitude=result['lng'],
+                           place_id=result.get('place_id'),
+                           geocoded_address=result.get('formatted_address'))
+            changes.append(f"coords: → {result['lat']:.4f}, {result['lng']:.4f}")
+        
+        if area:
+            updates['area'] = area
+            changes.append(f"area: → {area}")
+            stats['areas'] += 1
+    
+    return updates, changes
+
+
+def run(args):
+    """Compute and apply partner changes (journaled, resumable, optionally sharded)."""
+    if args.workers > 1:
+        _run_workers(args)
+    else:
+        _run(args)
+
+
+def _shard_worker(args, results):
+    results.put((args.shard, _run(args, report=False)))
+
+
+def _run_workers(args):
+    """Run shards 1..N in N local processes, then report the combined result once."""
+    client = supabase_client()
+    n = args.workers
+    results = multiprocessing.Queue()
+    procs = []
+    for k in range(1, n + 1):
+        shard_args = argparse.Namespace(**{**vars(args), 'shard': (k, n), 'workers': 1})
+        proc = multiprocessing.Process(target=_shard_worker, args=(shard_args, results),
+                                       name=f"shard {k}/{n}")
+        proc.start()
+        procs.append(proc)
+    
+    # Drain before joining: a child exits only once its result is through the queue pipe
+    totals = Counter()
+    pending = n
+    while pending:
+        running = any(proc.is_alive() for proc in procs)
+        try:
+            _, stats = results.get(timeout=1)
+        except queue.Empty:
+            # A shard that crashed never reports; stop once nothing was left to report
+            if not running:
+                break
+            continue
+        pending -= 1
+        totals.update(stats)
+    for proc in procs:
+        proc.join()
+    failed = [proc.name for proc in procs if proc.exitcode]
+    
+    print("\n" + "=" * 70)
+    print(f"ALL SHARDS ({n} workers)")
+    print("=" * 70)
+    print(f"  Total records processed: {totals['processed']}")
+    print(f"  Records updated:         {totals['updated']}")
+    print(f"  Failed updates:          {totals['failed']}")
+    print(f"  Conflicts re-read:       {totals['retried']}")
+    print(f"  Gave up (kept changing): {totals['conflicts']}")
+    if totals['queued']:
+        print(f"  Still queued:            {totals['queued']} (sent on the next run or `gdd-data flush`)")
+    if failed:
+        print(f"  ❌ {', '.join(failed)} exited with an error; re-run with --resume")
+    _print_distribution(client)
+
+
+def plan(args):
+    """Compute partner changes into a changeset file without writing anything."""
+    _run(args, changeset_path=args.output or default_changeset_path('partners'))
+
+
+def _run(args, changeset_path=None, report=True):
+    client = supabase_client()
+    stages = [args.stage] if args.stage else list(STAGES)
+    page_size = args.page_size
+    # Plans are read-only and unsharded
+    shard = None if changeset_path else args.shard
+    tag = f"{shard[0]}/{shard[1]} " if shard else ''
+    
+    print("=" * 70)
+    print("MARKETING PARTNERS: CATEGORIZATION, ENRICHMENT & AREA ASSIGNMENT"
+          + (" (PLAN)" if changeset_path else "") + (f" (SHARD {shard[0]}/{shard[1]})" if shard else ""))
+    print("=" * 70)
+    
+    # Every write and finished page is journaled so an interrupted run can --resume;
+    # a plan writes a changeset instead
+    journal = changeset = None
+    if changeset_path:
+        changeset = ChangesetWriter(changeset_path, stages=stages, ruleset=classification_ruleset())
+    else:
+        journal = RunJournal(journal_path('partners', stages, shard), 'partners', stages,
+                             resume=args.resume)
+    if journal and journal.resumed:
+        if journal.finished:
+            print(f"\n✅ {tag}Journaled run already finished ({journal.path}); nothing to resume")
+            journal.close()
+            return Counter()
+        print(f"\n↩️  Resuming after {journal.checkpoint or 'the start'} "
+              f"({len(journal.applied)} writes already applied)")
+    
+    # Rule results are cached on disk; a rule edit invalidates the cache
+    cache = ClassificationCache(classification_ruleset(), shard=shard)
+    enricher = None
+    if 'enrich' in stages or 'area' in stages:
+        enricher = Enricher(load_provider(args.provider, KNOWN_BUSINESS_DATA), rate=args.rate)
+    geocoder = None
+    if 'area' in stages and args.geocode:
+        geocoder = Geocoder(GEOCODE_BACKENDS[args.geocode](), rate=args.geocode_rate)
+    
+    stats = dict.fromkeys(('processed', 'updated', 'failed', 'categorized', 'enriched',
+                           'areas', 'skipped', 'already_applied', 'planned', 'geocoded', 'to_geocode',
+                           'retried', 'conflicts', 'queued'), 0)
+    
+    # Fetch only the columns (and, for a single stage, the rows) we need, a page at a time
+    columns, filters = partner_query(stages)
+    if shard:
+        filters = list(filters) + shard_filters(shard)
+    print(f"\n📥 Streaming partner records ({', '.join(stages)}, {page_size} per page)...")
+    pages = (
+        [Partner.from_row(r) for r in rows]
+        for rows in client.select_pages('marketing_partners', columns, filters, page_size=page_size,
+                                        after=journal and journal.checkpoint)
+    )
+    # Computed changes are queued durably and flushed in bulk by a background thread
+    outbox = None
+    if journal:
+        outbox = Outbox(client, outbox_path('partners', shard), batch_size=args.batch_size, tag=tag,
+                        on_stale=reclassifier(client, columns, stages, cache, enricher, geocoder))
+        if outbox.carried:
+            print(f"📤 {outbox.carried} changes left queued by an earlier run go out first")
+    
+    def lookup(partners):
+        batch = lookup_batch(partners, stages, enricher, geocoder)
+        stats['geocoded'] += len(batch['geocoded'])
+        stats['to_geocode'] += batch['to_geocode']
+        return batch
+    
+    def classify(batch):
+        partners = batch['partners']
+        return partners, [(p,) + classify_partner(p, stages, cache, batch, stats) for p in partners]
+    
+    def write(page):
+        fetched, changed = page
+        queued = []
+        for p, updates, changes in changed:
+            stats['processed'] += 1
+            n = stats['processed']
+            if not updates:
+                stats['skipped'] += 1
+                continue
+            if changeset:
+                changeset.add(p.id, p.name, updates, p.updated_at)
+                stats['planned'] += 1
+                print(f"  [{tag}{n}] 📝 {p.name[:45]:<45} | {', '.join(changes)}")
+                continue
+            if journal.is_applied(p.id):
+                stats['already_applied'] += 1
+                continue
+            queued.append((p, updates, changes))
+        if journal:
+            # Once in the outbox a change is as good as applied: it survives a crash
+            outbox.put_many(queued)
+            for p, _, _ in queued:
+                journal.record_applied(p.id)
+            # The page was fetched whole, whatever it changed; resume past its last row
+            if fetched:
+                journal.record_checkpoint(fetched[-1].id)
+    
+    # Fetching page N+1, looking up/classifying page N and writing page N-1 overlap
+    pipeline = Pipeline(pages, [('lookup', lookup), ('classify', classify), ('write', write)])
+    try:
+        pipeline.run()
+        if journal:
+            journal.finish()
+    finally:
+        if outbox:
+            if outbox.count('pending'):
+                print(f"\n📤 Waiting up to {args.flush_timeout:g}s for queued writes to go out...")
+            # Must finish before the cache/enricher close: stale changes are re-classified
+            outbox_status = outbox.close(args.flush_timeout)
+            stats.update(updated=outbox_status.get('done', 0), failed=outbox_status.get('failed', 0),
+                         retried=outbox_status.get('reclassified', 0),
+                         conflicts=outbox_status.get('stale', 0), queued=outbox_status['pending'])
+        (journal or changeset).close()
+        cache.close()
+        if enricher:
+            enricher.close()
+        if geocoder:
+            geocoder.close()
+    
+    # Summary
+    print("\n" + "=" * 70)
+    print(f"SUMMARY{' (SHARD ' + tag.strip() + ')' if shard else ''}")
+    print("=" * 70)
+    print(f"  Total records processed: {stats['processed']}")
+    if changeset:
+        print(f"  Changes planned:         {stats['planned']}")
+    else:
+        print(f"  Records updated:         {stats['updated']}")
+        print(f"  Failed updates:          {stats['failed']}")
+        print(f"  Conflicts re-read:       {stats['retried']}")
+        if stats['conflicts']:
+            print(f"  Gave up (kept changing): {stats['conflicts']}")
+        if stats['queued']:
+            print(f"  Still queued:            {stats['queued']} "
+                  f"(Supabase unreachable; sent on the next run or `gdd-data flush`)")
+    print(f"  Re-categorized:          {stats['categorized']}")
+    print(f"  Fields enriched:         {stats['enriched']}")
+    print(f"  Areas assigned:          {stats['areas']}")
+    print(f"  Skipped (no changes):    {stats['skipped']}")
+    if journal and journal.resumed:
+        print(f"  Already applied:         {stats['already_applied']}")
+    print(f"  Rule cache hits/misses:  {cache.hits}/{cache.misses}")
+    if enricher and enricher.provider.remote:
+        print(f"  Enrichment calls/cached: {enricher.calls}/{enricher.cache_hits} ({enricher.errors} errors)")
+    if geocoder:
+        print(f"  Geocoded:                {stats['geocoded']}/{stats['to_geocode']} "
+              f"({geocoder.calls} lookups, {geocoder.cache_hits} cached)")
+    print("  Stage busy time:         " + ', '.join(
+        f"{name} {busy:.1f}s" for name, _, busy in pipeline.timings()))
+    print()
+    
+    if changeset:
+        print(f"📝 Changeset written to {changeset.path}")
+        print(f"   Review it, then: scripts/gdd-data apply {changeset.path}")
+        return stats
+    
+    # With writes still queued the distribution would be stale (and Supabase is likely down)
+    if report and not stats['queued']:
+        _print_distribution(client)
+    return stats
+
+
+def _print_distribution(client):
+    # Print category distribution
+    print("\n📊 Verifying final category distribution...")
+    type_counts = client.count_by('marketing_partners', 'partner_type', 'unknown')
+    for t in sorted(type_counts.keys()):
+        print(f"    {t:<25} {type_counts[t]:>4}")
+    
+    # Print area distribution
+    print("\n📊 Area distribution...")
+    area_counts = client.count_by('marketing_partners', 'area', 'Unassigned')
+    for a in sorted(area_counts.keys()):
+        print(f"    {a:<30} {area_counts[a]:>4}")
+
+
+def apply(args):
+    """
+    Push a changeset from `plan` through the outbox: bulk writes, each only if
+    the partner's updated_at is still what the plan read.
+    """
+    client = supabase_client()
+    header, changes = read_changeset(args.changeset)
+    print(f"📤 Applying {len(changes)} partner changes from {args.changeset} "
+          f"(planned {header.get('created')}, stages {', '.join(header.get('stages', []))})")
+    if header.get('ruleset') != classification_ruleset():
+        print("   ⚠️ Rules have changed since this plan was made; re-run plan to pick them up")
+    print()
+    
+    # No re-classification: a partner edited since the plan is reported stale and left as is
+    job = 'apply-' + os.path.splitext(os.path.basename(args.changeset))[0]
+    outbox = Outbox(client, outbox_path(job), batch_size=args.batch_size)
+    outbox.put_many([(Partner.from_row(c), c['set'], [', '.join(f"{k}={str(v)[:30]}" for k, v in c['set'].items())])
+                     for c in changes])
+    status = outbox.close(args.flush_timeout)
+    
+    print(f"\n  Updated: {status.get('done', 0)}   Failed: {status.get('failed', 0)}   "
+          f"Edited since planned: {status.get('stale', 0)}")
+    if status.get('stale'):
+        print("  Re-run plan to recompute the partners edited since")
+    if status['pending']:
+        print(f"  Still queued: {status['pending']} (sent with `gdd-data flush`)")
@@ -0,0 +1,128 @@
+"""
+Threaded stage pipeline
+=======================
+Runs a source iterator and a chain of stage functions concurrently, one
+thread per stage, with a bounded queue between neighbours:
+
+    source ─▶ [q] ─▶ stage 1 ─▶ [q] ─▶ stage 2 ─▶ ... ─▶ results
+
+While stage 2 works on batch N, stage 1 is already on batch N+1 and the source
+is fetching N+2; a full queue blocks the producer (backpressure), so at most
+`maxsize` batches wait between any two stages. End-to-end time approaches the
+slowest stage rather than the sum of all of them.
+
+Stages are I/O bound here (HTTP, SQLite), so threads overlap fine under the GIL.
+"""
+
+import queue
+import threading
+import time
+
+_DONE = object()
+
+
+class _Failed:
+    def __init__(self, error):
+        self.error = error
+
+
+class Stage:
+    """A named step: fn(batch) returns the batch for the next stage (None drops it)."""
+
+    def __init__(self, name, fn):
+        self.name = name
+        self.fn = fn
+        self.batches = 0
+        self.busy = 0.0
+
+
+class Pipeline:
+    def __init__(self, source, stages, maxsize=2):
+        self.source = source
+        self.stages = [s if isinstance(s, Stage) else Stage(*s) for s in stages]
+        self.maxsize = maxsize
+        self.fetch = Stage('fetch', None)
+        self.stop = threading.Event()
+
+    def _put(self, q, item):
+        # Give up instead of blocking forever once the consumer has gone away
+        while not self.stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, q):
+        while not self.stop.is_set():
+            try:
+                return q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def _produce(self, out):
+        it = iter(self.source)
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    batch = next(it)
+                except StopIteration:
+                    break
+                self.fetch.busy += time.perf_counter() - start
+                self.fetch.batches += 1
+                if not self._put(out, batch):
+                    return
+        except BaseException as e:
+            self._put(out, _Failed(e))
+            return
+        self._put(out, _DONE)
+
+    def _work(self, stage, inq, out):
+        while True:
+            item = self._get(inq)
+            if item is _DONE or isinstance(item, _Failed):
+                self._put(out, item)
+                return
+            start = time.perf_counter()
+            try:
+                result = stage.fn(item)
+            except BaseException as e:
+                self._put(out, _Failed(e))
+                return
+            finally:
+                stage.busy += time.perf_counter() - start
+            stage.batches += 1
+            if result is not None and not self._put(out, result):
+                return
+
+    def __iter__(self):
+        queues = [queue.Queue(self.maxsize) for _ in range(len(self.stages) + 1)]
+        threads = [threading.Thread(target=self._produce, args=(queues[0],), daemon=True)]
+        threads += [threading.Thread(target=self._work, args=(s, queues[i], queues[i + 1]), daemon=True)
+                    for i, s in enumerate(self.stages)]
+        for t in threads:
+            t.start()
+        try:
+            while True:
+                item = queues[-1].get()
+                if item is _DONE:
+                    break
+                if isinstance(item, _Failed):
+                    raise item.error
+                yield item
+        finally:
+            self.stop.set()
+            for t in threads:
+                t.join()
+
+    def run(self):
+        """Drain the pipeline, discarding what the last stage returns."""
+        for _ in self:
+            pass
+
+    def timings(self):
+        """[(stage name, batches, busy seconds)] including the source."""
+        return [(s.name, s.batches, s.busy) for s in [self.fetch] + self.stages]
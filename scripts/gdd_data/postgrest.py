@@ -0,0 +1,86 @@
+"""
+Minimal PostgREST (Supabase REST) client used by the partner scripts.
+
+Only what the scripts need: projected/filtered selects and JSON writes, using
+urllib so the scripts keep running without third-party HTTP libraries.
+"""
+
+import json
+import urllib.error
+import urllib.parse
+import urllib.request
+
+
+def build_query(columns, filters=(), order=None):
+    """
+    Build a PostgREST query string.
+
+    `filters` are raw PostgREST predicates such as 'area=is.null' or
+    'or=(website.is.null,address.is.null)'; they are pushed down to the server.
+    """
+    parts = ['select=' + ','.join(columns)]
+    for f in filters:
+        key, _, value = f.partition('=')
+        parts.append(f"{key}={urllib.parse.quote(value, safe='.,()*:')}")
+    if order:
+        parts.append(f"order={order}")
+    return '&'.join(parts)
+
+
+def transient(error):
+    """Worth retrying: the request may succeed later unchanged."""
+    if isinstance(error, urllib.error.HTTPError):
+        return error.code in (408, 429) or error.code >= 500
+    return isinstance(error, OSError)
+
+
+class PostgrestClient:
+    def __init__(self, url, key, timeout=60):
+        self.base = f"{url.rstrip('/')}/rest/v1"
+        # Without one a stalled connection blocks the caller (e.g. the outbox flusher) forever
+        self.timeout = timeout
+        self.headers = {
+            "apikey": key,
+            "Authorization": f"Bearer {key}",
+            "Content-Type": "application/json",
+        }
+
+    def request(self, method, path, data=None, headers=None):
+        """Send a request and return the decoded JSON body (None if empty)."""
+        body = json.dumps(data).encode('utf-8') if data is not None else None
+        req = urllib.request.Request(f"{self.base}/{path}", data=body, method=method)
+        for k, v in {**self.headers, **(headers or {})}.items():
+            req.add_header(k, v)
+        with urllib.request.urlopen(req, timeout=self.timeout) as response:
+            text = response.read().decode('utf-8')
+            return json.loads(text) if text else None
+
+    def select(self, table, columns, filters=(), order=None, offset=0, limit=1000):
+        """Fetch one page of rows with only `columns`, filtered server-side."""
+        path = f"{table}?{build_query(columns, filters, order)}"
+        return self.request('GET', path, headers={"Range": f"{offset}-{offset + limit - 1}"})
+
+    def count_by(self, table, column, missing=None):
+        """{value: row count} for `column` over (the first page of) `table`."""
+        counts = {}
+        for r in self.select(table, [column], order=column):
+            v = r.get(column) or missing
+            counts[v] = counts.get(v, 0) + 1
+        return counts
+
+    def select_pages(self, table, columns, filters=(), page_size=1000, key='id', after=None):
+        """
+        Yield pages of rows ordered by `key`, using keyset pagination
+        (`key > last seen`) rather than offsets, so rows that stop matching
+        `filters` while earlier pages are being written never shift later pages.
+        `after` starts the scan past a key, e.g. a resumed run's checkpoint.
+        """
+        last = after
+        while True:
+            page_filters = list(filters) + ([f"{key}=gt.{last}"] if last is not None else [])
+            page = self.select(table, columns, page_filters, order=key, limit=page_size)
+            if page:
+                yield page
+            if len(page) < page_size:
+                return
+            last = page[-1][key]
@@ -0,0 +1,113 @@
+"""
+Partner ↔ clinic proximity
+==========================
+Vectorized great-circle distances between marketing partners and clinic
+locations, plus a static KD-tree over partner positions for radius queries
+("all groomers within 3 miles of Venice").
+
+Points are indexed as unit vectors on the sphere, where straight-line (chord)
+distance is monotonic in great-circle distance, so an ordinary 3-D KD-tree
+answers spherical radius queries exactly.
+"""
+
+import numpy as np
+
+EARTH_RADIUS_MILES = 3958.8
+
+
+def to_unit_vectors(lat, lng):
+    lat = np.radians(np.asarray(lat, dtype=np.float64))
+    lng = np.radians(np.asarray(lng, dtype=np.float64))
+    cos_lat = np.cos(lat)
+    return np.column_stack((cos_lat * np.cos(lng), cos_lat * np.sin(lng), np.sin(lat)))
+
+
+def haversine_miles(lat1, lng1, lat2, lng2):
+    """Element-wise (broadcasting) haversine distance in miles."""
+    lat1, lng1, lat2, lng2 = (np.radians(np.asarray(a, dtype=np.float64))
+                              for a in (lat1, lng1, lat2, lng2))
+    a = (np.sin((lat2 - lat1) / 2) ** 2
+         + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_MILES * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def _miles_to_chord(miles):
+    return 2 * np.sin(np.asarray(miles, dtype=np.float64) / (2 * EARTH_RADIUS_MILES))
+
+
+def nearest_clinics(lat, lng, clinic_lat, clinic_lng, k=1, batch_size=8192):
+    """
+    k nearest clinics for every point.
+
+    Returns (indices, miles), both shaped (n, k) and sorted by distance. Points
+    are processed in batches so the n×m distance matrix never exceeds
+    batch_size×m floats.
+    """
+    lat = np.asarray(lat, dtype=np.float64)
+    lng = np.asarray(lng, dtype=np.float64)
+    clinic_lat = np.asarray(clinic_lat, dtype=np.float64)
+    clinic_lng = np.asarray(clinic_lng, dtype=np.float64)
+    k = min(k, len(clinic_lat))
+    idx_out = np.empty((len(lat), k), dtype=np.int64)
+    dist_out = np.empty((len(lat), k), dtype=np.float64)
+    for start in range(0, len(lat), batch_size):
+        sl = slice(start, start + batch_size)
+        d = haversine_miles(lat[sl, None], lng[sl, None], clinic_lat[None, :], clinic_lng[None, :])
+        part = np.argpartition(d, k - 1, axis=1)[:, :k] if k < d.shape[1] else np.tile(np.arange(k), (len(d), 1))
+        part_d = np.take_along_axis(d, part, axis=1)
+        order = np.argsort(part_d, axis=1)
+        idx_out[sl] = np.take_along_axis(part, order, axis=1)
+        dist_out[sl] = np.take_along_axis(part_d, order, axis=1)
+    return idx_out, dist_out
+
+
+class PointIndex:
+    """Static KD-tree over (lat, lng) points for great-circle radius queries."""
+
+    def __init__(self, lat, lng, leaf_size=32):
+        self.lat = np.asarray(lat, dtype=np.float64)
+        self.lng = np.asarray(lng, dtype=np.float64)
+        self.xyz = to_unit_vectors(self.lat, self.lng)
+        self.leaf_size = leaf_size
+        # Nodes are (lo, hi, bbox_min, bbox_max, left, right) over self.order[lo:hi]
+        self.order = np.arange(len(self.xyz))
+        self.nodes = []
+        if len(self.xyz):
+            self._build(0, len(self.xyz))
+
+    def _build(self, lo, hi):
+        pts = self.xyz[self.order[lo:hi]]
+        node_id = len(self.nodes)
+        self.nodes.append([lo, hi, pts.min(axis=0), pts.max(axis=0), -1, -1])
+        if hi - lo > self.leaf_size:
+            axis = int(np.argmax(self.nodes[node_id][3] - self.nodes[node_id][2]))
+            mid = (hi - lo) // 2
+            part = np.argpartition(pts[:, axis], mid)
+            self.order[lo:hi] = self.order[lo:hi][part]
+            self.nodes[node_id][4] = self._build(lo, lo + mid)
+            self.nodes[node_id][5] = self._build(lo + mid, hi)
+        return node_id
+
+    def query_radius(self, lat, lng, miles):
+        """Indices of points within `miles` of (lat, lng), nearest first, and their distances."""
+        if not self.nodes:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        center = to_unit_vectors([lat], [lng])[0]
+        r2 = float(_miles_to_chord(miles)) ** 2
+        hits = []
+        stack = [0]
+        while stack:
+            lo, hi, bmin, bmax, left, right = self.nodes[stack.pop()]
+            gap = np.maximum(bmin - center, 0) + np.maximum(center - bmax, 0)
+            if gap @ gap > r2:
+                continue
+            if left < 0:
+                idx = self.order[lo:hi]
+                diff = self.xyz[idx] - center
+                hits.append(idx[np.einsum('ij,ij->i', diff, diff) <= r2])
+            else:
+                stack.extend((left, right))
+        idx = np.concatenate(hits) if hits else np.empty(0, dtype=np.int64)
+        dist = haversine_miles(lat, lng, self.lat[idx], self.lng[idx])
+        order = np.argsort(dist)
+        return idx[order], dist[order]
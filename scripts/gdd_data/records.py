@@ -0,0 +1,151 @@
+"""
+Compact record types
+====================
+Slotted dataclasses for marketing partners and med contacts.
+
+PostgREST rows and parsed spreadsheet rows used to be carried around as plain
+dicts (16+ keys each). These records keep only the fields the scripts use, have
+no per-instance __dict__, and share one object for every repeated
+partner_type / area / category value, so large runs hold several times more
+rows in the same memory.
+"""
+
+import sys
+from dataclasses import asdict, dataclass, fields
+from enum import Enum
+
+
+class _StrEnum(str, Enum):
+    """str-valued enum that formats, prints and JSON-encodes as its value."""
+    __str__ = str.__str__
+    __format__ = str.__format__
+
+
+class PartnerType(_StrEnum):
+    CHAMBER = 'chamber'
+    RESCUE = 'rescue'
+    CHARITY = 'charity'
+    GROOMER = 'groomer'
+    DAYCARE_BOARDING = 'daycare_boarding'
+    PET_RETAIL = 'pet_retail'
+    PET_BUSINESS = 'pet_business'
+    EXOTIC_SHOP = 'exotic_shop'
+    FOOD_VENDOR = 'food_vendor'
+    PRINT_VENDOR = 'print_vendor'
+    MERCH_VENDOR = 'merch_vendor'
+    DESIGNERS_GRAPHICS = 'designers_graphics'
+    MEDIA = 'media'
+    ENTERTAINMENT = 'entertainment'
+    LOCAL_BUSINESS = 'local_business'
+    MEDIA_OUTLET = 'media_outlet'
+    INFLUENCER = 'influencer'
+    ASSOCIATION = 'association'
+    SPAY_NEUTER = 'spay_neuter'
+    OTHER = 'other'
+
+
+class Area(_StrEnum):
+    WESTSIDE_COASTAL = 'Westside & Coastal'
+    SOUTH_VALLEY = 'South Valley'
+    NORTH_VALLEY = 'North Valley'
+    CENTRAL_EASTSIDE = 'Central & Eastside'
+    SOUTH_BAY = 'South Bay'
+    SAN_GABRIEL_VALLEY = 'San Gabriel Valley'
+    ONLINE_REMOTE = 'Online/Remote/Out of Area'
+
+
+def intern_value(value, enum_cls=None):
+    """Map a repeated string to a shared object (enum member if known, else interned str)."""
+    if value is None:
+        return None
+    if enum_cls is not None:
+        try:
+            return enum_cls(value)
+        except ValueError:
+            pass
+    return sys.intern(str(value))
+
+
+def _float(value):
+    return float(value) if value is not None else None
+
+
+@dataclass(slots=True)
+class Partner:
+    """A marketing_partners row, limited to the columns the partner scripts read."""
+    id: str
+    name: str
+    partner_type: PartnerType = None
+    services_provided: str = None
+    notes: str = None
+    category: str = None
+    address: str = None
+    proximity_to_location: str = None
+    area: Area = None
+    latitude: float = None
+    longitude: float = None
+    website: str = None
+    instagram_handle: str = None
+    facebook_url: str = None
+    tiktok_handle: str = None
+    youtube_url: str = None
+    # As read; writes are conditional on it (see gdd_data.outbox)
+    updated_at: str = None
+
+    @classmethod
+    def from_row(cls, row):
+        return cls(
+            id=row['id'],
+            name=row.get('name') or '',
+            partner_type=intern_value(row.get('partner_type'), PartnerType),
+            services_provided=row.get('services_provided'),
+            notes=row.get('notes'),
+            category=intern_value(row.get('category')),
+            address=row.get('address'),
+            proximity_to_location=row.get('proximity_to_location'),
+            area=intern_value(row.get('area'), Area),
+            latitude=_float(row.get('latitude')),
+            longitude=_float(row.get('longitude')),
+            website=row.get('website'),
+            instagram_handle=row.get('instagram_handle'),
+            facebook_url=row.get('facebook_url'),
+            tiktok_handle=row.get('tiktok_handle'),
+            youtube_url=row.get('youtube_url'),
+            updated_at=row.get('updated_at'),
+        )
+
+
+PARTNER_FIELDS = tuple(f.name for f in fields(Partner))
+
+
+@dataclass(slots=True)
+class MedContact:
+    """One med_contacts row parsed from the Med Contacts workbook."""
+    vendor_name: str
+    category: str
+    sub_label: str = None
+    contact_name: str = None
+    contact_email: str = None
+    contact_phone: str = None
+    account_number: str = None
+    website: str = None
+    login_user_id: str = None
+    login_password: str = None
+    order_method: str = None
+    payment_method: str = None
+    notes: str = None
+    location: str = None
+    department: str = None
+    browser_preference: str = None
+
+    def __post_init__(self):
+        self.vendor_name = intern_value(self.vendor_name)
+        self.category = intern_value(self.category)
+        self.order_method = intern_value(self.order_method)
+        self.payment_method = intern_value(self.payment_method)
+
+    def to_dict(self):
+        return asdict(self)
+
+
+MED_CONTACT_FIELDS = tuple(f.name for f in fields(MedContact))
@@ -0,0 +1,286 @@
+"""
+Referrer revenue rollups
+========================
+Aggregates the EzyVet "Referrer Revenue" exports
+(data/Appointments/Referrer Revenue-*.xls) per referral partner and writes the
+totals that partner metrics are computed from (tier, priority, visit tier:
+migration 191) in a single apply_referral_revenue() call (migration 294):
+
+    scripts/gdd-data referrer-revenue              (all exports)
+    scripts/gdd-data referrer-revenue --dry-run    (print, write nothing)
+
+Each export is read column-wise with xlrd (`pip install xlrd`). Detail rows
+(the ones with a date) are grouped with NumPy: np.unique gives every clinic
+name a code, and np.bincount / np.maximum.at sum revenue, count referrals and
+find the last referral date per code in one pass each. Exports with
+overlapping date windows are de-duplicated: a detail row already seen in an
+earlier export is dropped.
+
+Clinic names are matched to referral_partners through a normalized-name
+index (exact, then punctuation-insensitive, then containment, then keyword
+overlap - the same steps as scripts/populate-referral-stats.mjs). Clinics
+that match no partner are created as new partners by the bulk write.
+"""
+
+import glob
+import os
+import re
+import sys
+import time
+import urllib.error
+
+import numpy as np
+
+from gdd_data.enrichment import normalize_name
+
+EXPORTS = 'data/Appointments/Referrer Revenue-*.xls'
+# Column headers are on row 10 of the export; detail rows follow
+FIRST_ROW = 10
+DATE, CLINIC, CLIENT, ANIMAL, DIVISION, AMOUNT = 0, 1, 3, 4, 5, 6
+BULK_FUNCTION = 'apply_referral_revenue'
+
+GENERIC_WORDS = frozenset({
+    'the', 'and', 'for', 'of', 'at', 'in',
+    'vet', 'vets', 'pet', 'pets', 'animal', 'animals',
+    'clinic', 'clinics', 'hospital', 'hospitals',
+    'center', 'centre', 'medical', 'veterinary',
+    'care', 'health', 'wellness', 'group', 'practice',
+    'dr', 'dvm', 'inc', 'llc', 'corp',
+})
+
+
+# ============================================================
+# READING
+# ============================================================
+def read_export(path):
+    """Detail rows of one export as columns: {'clinic', 'division', 'amount', 'date', 'key'}."""
+    try:
+        import xlrd
+    except ImportError:
+        print('❌ reading the .xls exports needs xlrd: pip install xlrd', file=sys.stderr)
+        sys.exit(1)
+
+    # EzyVet writes the .xls with PhpSpreadsheet, whose compound-document
+    # directory xlrd flags as corrupt; the data itself reads fine
+    with open(os.devnull, 'w') as quiet:
+        book = xlrd.open_workbook(path, ignore_workbook_corruption=True, logfile=quiet)
+    sheet = book.sheet_by_index(0)
+    if sheet.nrows <= FIRST_ROW:
+        return None
+
+    def column(c):
+        return sheet.col_values(c, start_rowx=FIRST_ROW)
+
+    dates = np.array(column(DATE), dtype=object)
+    clinics = np.array([str(v).strip() for v in column(CLINIC)], dtype=object)
+    amounts = np.array([v if isinstance(v, float) else _amount(v) for v in column(AMOUNT)])
+    lowered = np.array([c.lower() for c in clinics], dtype=object)
+    # Detail rows only: summary rows have no date; skip unknown clinics, totals and refunds
+    keep = ((dates != '') & (clinics != '') & (lowered != 'unknown clinic')
+            & ~np.char.startswith(lowered.astype(str), 'total') & (amounts > 0))
+    dates = dates[keep]
+    divisions = np.array([str(v).strip() for v in column(DIVISION)], dtype=object)[keep]
+    clients = np.array(column(CLIENT), dtype=object)[keep]
+    animals = np.array(column(ANIMAL), dtype=object)[keep]
+    return {
+        'clinic': clinics[keep],
+        'division': divisions,
+        'amount': amounts[keep],
+        'date': np.array([_iso_date(d) for d in dates], dtype='datetime64[D]'),
+        # Identity of a detail row across exports
+        'key': list(zip(dates, clinics[keep], clients, animals, divisions, amounts[keep])),
+    }
+
+
+def _amount(value):
+    try:
+        return float(str(value).replace(',', '').replace('$', ''))
+    except ValueError:
+        return 0.0
+
+
+_DATE = re.compile(r'(\d{1,2})-(\d{1,2})-(\d{4})')
+
+
+def _iso_date(value):
+    """EzyVet 'MM-DD-YYYY h:mma' -> 'YYYY-MM-DD' ('NaT' if unparseable)."""
+    m = _DATE.search(str(value))
+    if not m:
+        return 'NaT'
+    month, day, year = m.groups()
+    return f"{year}-{int(month):02d}-{int(day):02d}"
+
+
+def read_exports(paths):
+    """Concatenate the detail rows of all exports, dropping rows seen in an earlier one."""
+    parts = []
+    seen = set()
+    stats = []
+    for path in paths:
+        rows = read_export(path)
+        if rows is None:
+            stats.append((path, 0, 0))
+            continue
+        fresh = np.array([key not in seen for key in rows['key']], dtype=bool)
+        seen.update(rows['key'])
+        parts.append({k: v[fresh] for k, v in rows.items() if k != 'key'})
+        stats.append((path, len(fresh), int((~fresh).sum())))
+    if not parts:
+        return None, stats
+    return {k: np.concatenate([p[k] for p in parts]) for k in ('clinic', 'division', 'amount', 'date')}, stats
+
+
+# ============================================================
+# AGGREGATION
+# ============================================================
+def rollup(codes, n, amount, date, division):
+    """
+    Per-group totals for integer group `codes` (0..n-1):
+    referrals, revenue, last date, and the sorted divisions of each group.
+    """
+    referrals = np.bincount(codes, minlength=n)
+    revenue = np.bincount(codes, weights=amount, minlength=n)
+    last = np.full(n, np.datetime64('NaT'), dtype='datetime64[D]')
+    dated = ~np.isnat(date)
+    days = date[dated].astype(np.int64)
+    last_days = np.full(n, np.iinfo(np.int64).min)
+    np.maximum.at(last_days, codes[dated], days)
+    has_date = last_days != np.iinfo(np.int64).min
+    last[has_date] = last_days[has_date].astype('datetime64[D]')
+    division_names, division_codes = np.unique(division.astype(str), return_inverse=True)
+    pairs = np.unique(codes * len(division_names) + division_codes)
+    divisions = [[] for _ in range(n)]
+    for pair in pairs:
+        group, d = divmod(int(pair), len(division_names))
+        if division_names[d]:
+            divisions[group].append(str(division_names[d]))
+    return referrals, revenue, last, divisions
+
+
+# ============================================================
+# MATCHING
+# ============================================================
+def _alnum(name):
+    return ' '.join(re.sub(r'[^a-z0-9\s]', '', (name or '').lower()).split())
+
+
+def _keywords(name):
+    return [w for w in re.sub(r'[^a-z0-9\s]', '', (name or '').lower()).split()
+            if len(w) > 1 and w not in GENERIC_WORDS]
+
+
+class NameIndex:
+    """Referral partners by normalized name, with the fuzzy fallbacks of populate-referral-stats."""
+
+    def __init__(self, partners):
+        self.partners = partners
+        self.exact = {}
+        self.alnum = {}
+        for p in partners:
+            self.exact.setdefault(normalize_name(p['name']), p)
+            self.alnum.setdefault(_alnum(p['name']), p)
+        self.keywords = [(p, set(_keywords(p['name']))) for p in partners]
+
+    def match(self, name):
+        p = self.exact.get(normalize_name(name)) or self.alnum.get(_alnum(name))
+        if p:
+            return p
+        wanted = _alnum(name)
+        for known, p in self.alnum.items():
+            shorter = min(len(wanted), len(known))
+            if shorter >= 6 and (wanted in known or known in wanted):
+                return p
+        words = _keywords(name)
+        if not words:
+            return None
+        required = 2 if len(words) >= 2 else 1
+        best, best_score = None, 0
+        for p, known in self.keywords:
+            score = sum(1 for w in words if w in known)
+            if score >= required and score > best_score:
+                best, best_score = p, score
+        return best
+
+
+def fetch_partners(client):
+    partners = []
+    for page in client.select_pages('referral_partners', ['id', 'name'], page_size=1000):
+        partners.extend(page)
+    # Same preference order as the .mjs script (it reads the partners ordered by name)
+    partners.sort(key=lambda p: p['name'] or '')
+    return partners
+
+
+def partner_stats(rows, index):
+    """
+    Roll detail rows up per clinic, map clinics to partners, and roll up again
+    per partner. Returns (stats entries for apply_referral_revenue, unmatched clinic names).
+    """
+    clinic_names, clinic_codes = np.unique(rows['clinic'].astype(str), return_inverse=True)
+    # One lookup per distinct clinic name rather than per row
+    targets = {}
+    partner_of = np.empty(len(clinic_names), dtype=np.int64)
+    entries = []
+    unmatched = []
+    for i, clinic in enumerate(clinic_names):
+        p = index.match(clinic)
+        target = p['id'] if p else f"new:{clinic}"
+        if target not in targets:
+            targets[target] = len(entries)
+            entries.append({'id': p['id'], 'name': p['name']} if p else {'id': None, 'name': str(clinic)})
+            if not p:
+                unmatched.append(str(clinic))
+        partner_of[i] = targets[target]
+
+    codes = partner_of[clinic_codes]
+    referrals, revenue, last, divisions = rollup(codes, len(entries), rows['amount'], rows['date'],
+                                                 rows['division'])
+    for i, entry in enumerate(entries):
+        entry.update(referrals=int(referrals[i]), revenue=round(float(revenue[i]), 2),
+                     last_referral_date=None if np.isnat(last[i]) else str(last[i]),
+                     divisions=divisions[i])
+    return entries, unmatched
+
+
+def run(args):
+    from gdd_data.config import supabase_client
+
+    start = time.perf_counter()
+    paths = args.exports or sorted(glob.glob(EXPORTS))
+    if not paths:
+        print(f"❌ No exports matching {EXPORTS}")
+        return
+    rows, read_stats = read_exports(paths)
+    for path, n, dupes in read_stats:
+        print(f"📥 {path}: {n} referral rows" + (f" ({dupes} already in an earlier export)" if dupes else ''))
+    if rows is None:
+        print("Nothing to import")
+        return
+    print(f"   {len(rows['clinic'])} rows, ${rows['amount'].sum():,.2f} "
+          f"({1000 * (time.perf_counter() - start):.0f} ms)\n")
+
+    client = supabase_client()
+    partners = fetch_partners(client)
+    entries, unmatched = partner_stats(rows, NameIndex(partners))
+    matched = [e for e in entries if e['id']]
+    print(f"🔗 {len(partners)} referral partners: {len(matched)} matched, "
+          f"{len(unmatched)} clinics without a partner (created as new partners)")
+
+    print("\nTop 15 partners by revenue:")
+    for e in sorted(entries, key=lambda e: -e['revenue'])[:15]:
+        print(f"  {e['name'][:45]:<45} {e['referrals']:>5} referrals  ${e['revenue']:>12,.2f}"
+              f"{'  (new)' if not e['id'] else ''}")
+
+    if args.dry_run:
+        print(f"\n🔍 Dry run: {len(entries)} partner rollups not written")
+        return
+    try:
+        result = client.request('POST', f"rpc/{BULK_FUNCTION}", {'stats': entries})
+    except urllib.error.HTTPError as e:
+        if e.code == 404:
+            print(f"❌ {BULK_FUNCTION}() not found; apply migration 294 first")
+            return
+        raise
+    print(f"\n✅ {result['updated']} partners updated, {result['inserted']} created, "
+          f"{result['cleared']} cleared; partner tiers recalculated "
+          f"({time.perf_counter() - start:.1f}s)")
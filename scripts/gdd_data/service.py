@@ -0,0 +1,210 @@
+"""
+Partner classification service
+==============================
+`gdd-data serve` exposes the classification rules over local HTTP so the Nuxt
+server can get a partner_type and area at create time:
+
+    POST /classify        {"name": "...", "services_provided": ..., "address": ...}
+                          → {"partner_type": "groomer", "area": "Westside & Coastal"}
+    POST /classify/batch  {"partners": [{...}, ...]}  → {"results": [{...}, ...]}
+    GET  /health
+
+Accepted fields: name, partner_type, services_provided, notes, category,
+address, proximity_to_location, latitude, longitude. The area comes from the
+same chain as the partners job (known businesses, zone polygons for
+coordinates, ZIP/neighborhood rules, partial known names), minus remote
+enrichment and geocoding.
+
+Rules and zone polygons are loaded once at startup. Concurrent /classify
+requests are coalesced by a micro-batcher (up to --window ms or --max-batch
+requests) and classified together; identical inputs are computed once and
+kept in an in-memory LRU memo, which is safe because the rules cannot change
+while the process runs.
+"""
+
+import json
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from gdd_data.enrichment import normalize_name
+from gdd_data.geo import get_resolver
+from gdd_data.records import Area, Partner, PartnerType, intern_value
+from gdd_data.rules import KNOWN_BUSINESS_DATA, classification_ruleset, classify
+
+INPUT_FIELDS = ('name', 'partner_type', 'services_provided', 'notes', 'category', 'address',
+                'proximity_to_location', 'latitude', 'longitude')
+MAX_BODY = 8 * 1024 * 1024
+
+
+def validate(record):
+    """Reject records the rules cannot take, before they join a shared batch."""
+    if not isinstance(record, dict):
+        raise ValueError('each partner must be a JSON object')
+    for field in INPUT_FIELDS[:7]:
+        if record.get(field) is not None and not isinstance(record[field], str):
+            raise ValueError(f'{field} must be a string')
+    for field in INPUT_FIELDS[7:]:
+        value = record.get(field)
+        if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float))):
+            raise ValueError(f'{field} must be a number')
+    return record
+
+
+class Classifier:
+    """Rule-only classification with an LRU memo on the normalized inputs."""
+
+    def __init__(self, memo_size=100_000):
+        self.resolver = get_resolver()
+        self.memo = OrderedDict()
+        self.memo_size = memo_size
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def _key(record):
+        # The rules compare partner_type exactly, so only free text is normalized
+        return tuple(v.strip().lower() if isinstance(v, str) and f != 'partner_type' else v
+                     for f, v in ((f, record.get(f)) for f in INPUT_FIELDS))
+
+    def _compute(self, r):
+        p = Partner.from_row(dict(r, id=r.get('id')))
+        geo_area = None
+        if p.latitude is not None and p.longitude is not None:
+            geo_area = self.resolver.resolve(p.latitude, p.longitude)
+        known = KNOWN_BUSINESS_DATA.get(normalize_name(p.name), {})
+        partner_type, area = classify(p, geo_area, known.get('address'))
+        partner_type = intern_value(partner_type, PartnerType)
+        return {'partner_type': str(partner_type) if partner_type else None,
+                'area': str(intern_value(area, Area)) if area else None}
+
+    def classify_many(self, records):
+        keys = [self._key(r) for r in records]
+        results = {}
+        with self.lock:
+            for k in keys:
+                if k in self.memo:
+                    self.memo.move_to_end(k)
+                    results[k] = self.memo[k]
+        for k, r in zip(keys, records):
+            if k not in results:
+                results[k] = self._compute(r)
+        with self.lock:
+            for k in keys:
+                self.memo[k] = results[k]
+            while len(self.memo) > self.memo_size:
+                self.memo.popitem(last=False)
+        return [results[k] for k in keys]
+
+
+class MicroBatcher:
+    """Coalesce concurrent single classifications into one classify_many() call."""
+
+    def __init__(self, classifier, window=0.002, max_batch=256):
+        self.classifier = classifier
+        self.window = window
+        self.max_batch = max_batch
+        self.queue = queue.Queue()
+        self.batches = 0
+        threading.Thread(target=self._loop, daemon=True).start()
+
+    def submit(self, record):
+        future = Future()
+        self.queue.put((record, future))
+        return future.result()
+
+    def _loop(self):
+        while True:
+            items = [self.queue.get()]
+            deadline = time.monotonic() + self.window
+            while len(items) < self.max_batch:
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    break
+                try:
+                    items.append(self.queue.get(timeout=left))
+                except queue.Empty:
+                    break
+            self.batches += 1
+            try:
+                results = self.classifier.classify_many([r for r, _ in items])
+                for (_, future), result in zip(items, results):
+                    future.set_result(result)
+            except Exception as e:
+                for _, future in items:
+                    future.set_exception(e)
+
+
+class Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 resets connections under modest concurrency
+    request_queue_size = 128
+
+
+def make_handler(classifier, batcher, ruleset):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        # Headers and body go out as separate writes; with Nagle on, keep-alive
+        # clients wait ~40 ms for the delayed ACK on every response
+        disable_nagle_algorithm = True
+
+        def log_message(self, fmt, *args):
+            pass
+
+        def _send(self, code, payload):
+            body = json.dumps(payload).encode('utf-8')
+            self.send_response(code)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _read_json(self):
+            length = int(self.headers.get('Content-Length') or 0)
+            if length > MAX_BODY:
+                raise ValueError('request body too large')
+            return json.loads(self.rfile.read(length) or b'{}')
+
+        def do_GET(self):
+            if self.path == '/health':
+                self._send(200, {'ok': True, 'ruleset': ruleset, 'memo': len(classifier.memo),
+                                 'batches': batcher.batches})
+            else:
+                self._send(404, {'error': 'not found'})
+
+        def do_POST(self):
+            try:
+                body = self._read_json()
+                if self.path == '/classify':
+                    self._send(200, batcher.submit(validate(body)))
+                elif self.path == '/classify/batch':
+                    partners = body.get('partners') if isinstance(body, dict) else None
+                    if not isinstance(partners, list):
+                        raise ValueError('expected {"partners": [{...}, ...]}')
+                    for p in partners:
+                        validate(p)
+                    self._send(200, {'results': classifier.classify_many(partners)})
+                else:
+                    self._send(404, {'error': 'not found'})
+            except ValueError as e:
+                self._send(400, {'error': str(e)})
+
+    return Handler
+
+
+def run(args):
+    start = time.perf_counter()
+    classifier = Classifier()
+    batcher = MicroBatcher(classifier, window=args.window / 1000, max_batch=args.max_batch)
+    ruleset = classification_ruleset()
+    server = Server((args.host, args.port), make_handler(classifier, batcher, ruleset))
+    print(f"🚀 Partner classifier on http://{args.host}:{args.port} "
+          f"(rules {ruleset[:12]}, ready in {1000 * (time.perf_counter() - start):.0f} ms)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
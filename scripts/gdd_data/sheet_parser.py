@@ -0,0 +1,134 @@
+"""
+Hierarchical sheet parser
+=========================
+The vendor workbooks share one layout: a section (category) header row, then a
+row per vendor, then optional sub-entry rows with the vendor cell left blank
+that belong to the vendor above. `parse_sheet` walks such a sheet once, as a
+small state machine driven by a declarative `SheetSchema`:
+
+    key cell blank     -> sub-entry of the current vendor (or skipped)
+    key in skip_keys   -> skipped (repeated column headings)
+    header row         -> starts a new section; a retired section
+                          ("OLD - NO LONGER USING") suppresses its entries
+    otherwise          -> becomes the current vendor
+    then, any `entry` field filled -> schema.build(row, state) -> record
+
+Rows are read with openpyxl's values_only iterator and cleaned into one
+reused `Row`; nothing is allocated per row beyond the cleaned strings, so a
+read-only (streaming) worksheet is parsed in constant memory.
+"""
+
+from dataclasses import dataclass
+
+
+def _always(key):
+    return True
+
+
+@dataclass(frozen=True)
+class SheetSchema:
+    """
+    Layout of one kind of sheet. Fields are named by `columns` (name -> 0-based
+    column); the other options name fields, not columns.
+
+    key          the vendor column
+    entry        a row becomes a record only if one of these is filled
+    build        build(row, state) -> record
+    header_unless
+                 a keyed row is a section header when none of these is filled
+                 and is_header(key) holds; empty disables section headers
+    sub_entries  keep rows with a blank key as entries of the vendor above
+    skip_keys    key values of rows to ignore outright
+    default_section
+                 state.section before the first header row
+    is_retired   is_retired(section): entries under such a section are dropped
+    clean        clean(cell) -> str or None; blank-ish values must map to None
+    """
+    columns: dict
+    key: str
+    entry: tuple
+    build: object
+    header_unless: tuple = ()
+    is_header: object = _always
+    sub_entries: bool = True
+    skip_keys: frozenset = frozenset()
+    default_section: str = None
+    is_retired: object = None
+    first_row: int = 2
+    clean: object = None
+
+
+class Row:
+    """Cleaned values of the current row, addressed by field name."""
+    __slots__ = ('slots', 'columns', 'values')
+
+    def __init__(self, columns):
+        self.slots = {name: i for i, name in enumerate(columns)}
+        self.columns = tuple(columns.values())
+        self.values = [None] * len(columns)
+
+    def load(self, cells, clean):
+        values = self.values
+        n = len(cells)
+        for i, col in enumerate(self.columns):
+            values[i] = clean(cells[col]) if col < n else None
+
+    def __getitem__(self, name):
+        return self.values[self.slots[name]]
+
+    def any(self, slots):
+        values = self.values
+        for i in slots:
+            if values[i] is not None:
+                return True
+        return False
+
+
+@dataclass
+class State:
+    """Where the parser is in the sheet hierarchy."""
+    section: str = None
+    vendor: str = None
+    sub_entry: bool = False
+    retired: bool = False
+
+
+def _default_clean(val):
+    if val is None:
+        return None
+    s = str(val).strip()
+    return s or None
+
+
+def parse_sheet(ws, schema):
+    """Parse a worksheet in one pass; returns the list of built records."""
+    clean = schema.clean or _default_clean
+    row = Row(schema.columns)
+    key = row.slots[schema.key]
+    entry = tuple(row.slots[f] for f in schema.entry)
+    header_unless = tuple(row.slots[f] for f in schema.header_unless)
+    headers = bool(header_unless)
+    values = row.values
+    state = State(section=schema.default_section)
+    records = []
+
+    for cells in ws.iter_rows(min_row=schema.first_row, values_only=True):
+        row.load(cells, clean)
+        vendor = values[key]
+        if vendor is None:
+            if not schema.sub_entries:
+                continue
+            state.sub_entry = True
+        elif vendor in schema.skip_keys:
+            continue
+        elif headers and schema.is_header(vendor) and not row.any(header_unless):
+            state.section = vendor
+            state.retired = bool(schema.is_retired and schema.is_retired(vendor))
+            continue
+        else:
+            state.vendor = vendor
+            state.sub_entry = False
+        if state.retired or not row.any(entry):
+            continue
+        records.append(schema.build(row, state))
+    return records
@@ -0,0 +1,43 @@
+"""
+Local partner snapshot
+======================
+`gdd-data snapshot` copies marketing_partners (all PARTNER_FIELDS) to a local
+JSON-lines file, so analyses such as rule-change impact previews
+(gdd_data.impact) run against local data instead of the production table.
+"""
+
+import json
+import os
+import time
+
+from gdd_data.config import supabase_client
+from gdd_data.records import PARTNER_FIELDS
+
+DEFAULT_CACHE_DIR = os.environ.get("GDD_CACHE_DIR", ".cache/gdd-data")
+SNAPSHOT_PATH = os.path.join(DEFAULT_CACHE_DIR, 'snapshots', 'marketing_partners.jsonl')
+
+
+def save_snapshot(client, path=SNAPSHOT_PATH, page_size=1000):
+    """Write every partner row to `path` (atomically); returns the row count."""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp = path + '.tmp'
+    count = 0
+    with open(tmp, 'w') as f:
+        for page in client.select_pages('marketing_partners', list(PARTNER_FIELDS), page_size=page_size):
+            for row in page:
+                f.write(json.dumps(row, ensure_ascii=False) + '\n')
+            count += len(page)
+    os.replace(tmp, path)
+    return count
+
+
+def load_snapshot(path=SNAPSHOT_PATH):
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def run(args):
+    start = time.perf_counter()
+    path = args.output or SNAPSHOT_PATH
+    count = save_snapshot(supabase_client(), path)
+    print(f"📸 {count} partners written to {path} ({time.perf_counter() - start:.1f}s)")
@@ -0,0 +1,6 @@
+import os
+import tempfile
+
+# Module-level cache paths are read from the environment at import time, so this
+# has to happen before any gdd_data module is imported by a test
+os.environ["GDD_CACHE_DIR"] = tempfile.mkdtemp(prefix='gdd-data-tests-')
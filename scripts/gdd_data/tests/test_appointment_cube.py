@@ -0,0 +1,41 @@
+from gdd_data.appointment_cube import Cube, load_cube, save_cube
+from gdd_data.appointments import load_export
+
+from .test_appointments import status_export, status_row, type_export
+
+
+def cube_totals(cube, grain='week', **filters):
+    names, totals = cube.slice(grain, by=('period', 'status'), **filters)
+    return {(period, status): int(totals[i, j])
+            for i, period in enumerate(names['period']) for j, status in enumerate(names['status'])
+            if totals[i, j]}
+
+
+def test_cube_counts_and_replaces_facts(tmp_path):
+    rex = ('Green Dog - Venice', 'Rex', 'Doe, Jane', '2026-02-04 09:00:00')
+    older = load_export(status_export(tmp_path, '2026-02-23-12-21-35', status_row(*rex, confirmed=1),
+                                      status_row('Green Dog - Venice', 'Bo', 'Roe, Ann', '2026-02-10 08:00:00')))
+    newer = load_export(status_export(tmp_path, '2026-03-04-13-59-02',
+                                      status_row(*rex, complete=1, time_to_complete=2700)))
+    booked = load_export(type_export(tmp_path, '2026-03-04-14-04-00',
+                                     ['Venice - Green Dog Facility', '40', '30', '1200'],
+                                     ['Imaging', '3', '20', '60']))
+
+    cube = Cube()
+    assert cube.add_export(older) == (2, 0, 0)
+    assert cube.add_export(newer) == (0, 1, 0)
+    assert cube.add_export(booked) == (1, 0, 0)
+    assert cube_totals(cube) == {('2026-02-02', 'completed'): 1, ('2026-02-09', 'scheduled'): 1,
+                                 ('2026-03-02', 'booked'): 3}
+    _, minutes = cube.slice('month', by=('status',), measure='minutes', location='Venice')
+    assert minutes.tolist() == [0, 0, 0, 45, 60]
+
+    # Folding the same exports in another order gives the same cube
+    reordered = Cube()
+    for export in (booked, newer, older):
+        reordered.add_export(export)
+    assert cube_totals(reordered) == cube_totals(cube)
+
+    save_cube(cube, tmp_path / 'cube')
+    stored = load_cube(tmp_path / 'cube')
+    assert len(stored) == 3 and cube_totals(stored) == cube_totals(cube)
@@ -0,0 +1,84 @@
+import csv
+
+import numpy as np
+
+from gdd_data import appointments
+from gdd_data.appointments import STATUSES, TIMINGS, load_export, merge, read_export
+
+STATUS_HEADER = ['Division', 'Animal', 'Owner', 'Appointment Date/Time'] + [t.title() for t in TIMINGS]
+
+
+def status_row(division, animal, owner, start, **seconds):
+    timings = {t: 0 for t in TIMINGS}
+    timings.update({k.replace('_', ' '): v for k, v in seconds.items()})
+    return [division, animal, owner, start] + [timings[t] for t in TIMINGS]
+
+
+def write_csv(path, rows):
+    with open(path, 'w', newline='') as f:
+        csv.writer(f).writerows(rows)
+    return str(path)
+
+
+def status_export(tmp_path, stamp, *rows):
+    return write_csv(tmp_path / f"Appointment Status-{stamp}.csv", [STATUS_HEADER, *rows])
+
+
+def type_export(tmp_path, stamp, *rows):
+    return write_csv(tmp_path / f"Appointment Type-{stamp}.csv",
+                     [['Type', 'Count', 'Average Time(Mins)', 'Total Time(Mins)'], *rows])
+
+
+def test_status_export_is_normalized_in_chunks(tmp_path):
+    path = status_export(
+        tmp_path, '2026-03-04-13-59-02',
+        status_row('Green Dog - Venice', 'Rex', 'Doe, Jane', '2026-02-02 09:00:00', complete=5,
+                   time_to_complete=1800),
+        status_row('Green Dog - Venice', 'Bo', 'Roe, Ann', '02/03/2026 10:30', in_consultation=60),
+        status_row('Green Dog - Van Nuys', 'Max', 'Poe, Al', '2026-02-04 11:15:00', confirmed=1),
+        status_row('', '', 'TOTAL', '', complete=9),
+    )
+    meta, columns, vocab = read_export(path, chunk_size=1)
+    assert meta['kind'] == 'status' and meta['exported'] == '2026-03-04'
+    assert vocab['division'] == ['Green Dog - Venice', 'Green Dog - Van Nuys']
+    assert [STATUSES[s] for s in columns['status']] == ['completed', 'in_progress', 'confirmed']
+    assert columns['start'].astype(str).tolist() == ['2026-02-02T09:00', '2026-03-02T10:30', '2026-02-04T11:15']
+
+
+def test_type_export_takes_its_location_from_the_facility_row(tmp_path):
+    path = type_export(tmp_path, '2026-03-04-14-04-00',
+                       ['Venice - Green Dog Facility', '40', '30', '1200'],
+                       ['Imaging', '33', '28', '945'],
+                       ['Available Slots', '12', '0', '0'],
+                       ['Totals', '85', '0', '0'])
+    meta, columns, vocab = read_export(path)
+    assert meta['location'] == 'Venice' and meta['report_start'] == '2026-03-04'
+    assert vocab['type'] == ['Imaging']
+    assert columns['count'].tolist() == [33] and columns['total_mins'].tolist() == [945]
+
+
+def test_cached_export_matches_a_fresh_read(tmp_path):
+    path = status_export(tmp_path, '2026-03-04-13-59-02',
+                         status_row('Green Dog - Venice', 'Rex', 'Doe, Jane', '2026-02-02 09:00:00'))
+    first = load_export(path)
+    cached = load_export(path)
+    assert not first.cached and cached.cached
+    assert cached.meta == first.meta and cached.vocab == first.vocab
+    for name, values in first.columns.items():
+        assert np.array_equal(cached.columns[name], values)
+
+
+def test_merge_keeps_the_newest_export_of_each_appointment(tmp_path):
+    rex = ('Green Dog - Venice', 'Rex', 'Doe, Jane', '2026-02-02 09:00:00')
+    older = status_export(tmp_path, '2026-02-23-12-21-35', status_row(*rex, confirmed=1),
+                          status_row('Green Dog - Venice', 'Bo', 'Roe, Ann', '2026-02-01 08:00:00'))
+    newer = status_export(tmp_path, '2026-03-04-13-59-02', status_row(*rex, complete=1))
+    exports = appointments.load_exports([newer, older])
+    assert [e.path for e in exports] == [older, newer]
+
+    columns, vocab, superseded = merge(exports, 'status')
+    animals = np.array(vocab['animal'], dtype=object)[columns['animal']]
+    statuses = dict(zip(animals, (STATUSES[s] for s in columns['status'])))
+    assert statuses == {'Rex': 'completed', 'Bo': 'scheduled'}
+    assert superseded == {newer: 0, older: 1}
+    assert set(columns['location']) == {'Venice'}
@@ -0,0 +1,22 @@
+import pytest
+
+from gdd_data.changeset import ChangesetWriter, read_changeset
+
+
+def test_changeset_round_trip_keeps_updated_at(tmp_path):
+    path = tmp_path / 'plan.jsonl'
+    writer = ChangesetWriter(path, stages=['area'], ruleset='r1')
+    writer.add('id-1', 'Venice Dogs', {'area': 'Westside & Coastal'}, '2026-01-02T03:04:05+00:00')
+    writer.close()
+
+    header, changes = read_changeset(path)
+    assert header['stages'] == ['area'] and header['ruleset'] == 'r1'
+    assert changes == [{'id': 'id-1', 'name': 'Venice Dogs', 'updated_at': '2026-01-02T03:04:05+00:00',
+                        'set': {'area': 'Westside & Coastal'}}]
+
+
+def test_old_changeset_versions_are_rejected(tmp_path):
+    path = tmp_path / 'plan.jsonl'
+    path.write_text('{"changeset": 1}\n{"id": "a", "name": "A", "set": {}}\n')
+    with pytest.raises(ValueError, match='re-run plan'):
+        read_changeset(path)
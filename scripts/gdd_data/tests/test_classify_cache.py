@@ -0,0 +1,101 @@
+import sqlite3
+
+from gdd_data.classify_cache import ClassificationCache, ruleset_hash
+
+
+def rules_v1(name):
+    return 'groomer' if 'groom' in name else None
+
+
+def rules_v2(name):
+    return 'groomer' if 'grooming' in name else None
+
+
+def test_lookup_computes_once(tmp_path):
+    calls = []
+
+    def compute(name):
+        calls.append(name)
+        return name.upper()
+
+    with ClassificationCache('r1', path=tmp_path / 'c.sqlite') as cache:
+        assert cache.lookup('type', ('Venice Dogs',), compute) == 'VENICE DOGS'
+        assert cache.lookup('type', ('venice dogs',), compute) == 'VENICE DOGS'
+        assert (cache.hits, cache.misses) == (1, 1)
+    assert calls == ['Venice Dogs']
+
+
+def test_none_is_a_cached_result(tmp_path):
+    with ClassificationCache('r1', path=tmp_path / 'c.sqlite') as cache:
+        cache.lookup('area', ('x',), lambda name: None)
+        assert cache.lookup('area', ('x',), lambda name: 'South Bay') is None
+
+
+def test_entries_survive_reopen_and_ruleset_change_wipes_them(tmp_path):
+    path = tmp_path / 'c.sqlite'
+    with ClassificationCache('r1', path=path) as cache:
+        cache.put('k', 'v')
+    with ClassificationCache('r1', path=path) as cache:
+        assert cache.get('k') == 'v'
+    with ClassificationCache('r2', path=path) as cache:
+        assert cache.get('k') is None
+
+
+def test_ruleset_hash_tracks_tables_and_function_bodies():
+    base = ruleset_hash({'a': 1}, (rules_v1,))
+    assert base == ruleset_hash({'a': 1}, (rules_v1,))
+    assert base != ruleset_hash({'a': 2}, (rules_v1,))
+    assert base != ruleset_hash({'a': 1}, (rules_v2,))
+
+
+def test_writes_are_committed_as_they_happen(tmp_path):
+    path = tmp_path / 'c.sqlite'
+    cache = ClassificationCache('r1', path=path)
+    try:
+        cache.put('k', 'v')
+        cache.get('k')
+        # A second connection sees the entry and can write while the first is open
+        conn = sqlite3.connect(path, timeout=1)
+        assert conn.execute("SELECT value FROM entries WHERE key = 'k'").fetchone() == ('"v"',)
+        conn.execute("UPDATE entries SET last_used = 0")
+        conn.commit()
+        conn.close()
+    finally:
+        cache.close()
+
+
+def test_two_caches_share_one_file(tmp_path):
+    path = tmp_path / 'c.sqlite'
+    with ClassificationCache('r1', path=path) as first:
+        first.put('a', 1)
+        first.get('a')
+        with ClassificationCache('r1', path=path) as second:
+            second.put('b', 2)
+            assert second.get('a') == 1
+        assert first.get('b') == 2
+
+
+def test_replacing_a_key_does_not_count_towards_eviction(tmp_path):
+    with ClassificationCache('r1', path=tmp_path / 'c.sqlite', max_entries=10) as cache:
+        for i in range(5):
+            cache.put('k', i)
+        assert cache._count == 1
+        for i in range(10):
+            cache.put(f'k{i}', i)
+        # 11 distinct keys: the least recently used ones go, down to 90% of the bound
+        assert cache._count == 9
+        assert cache.get('k9') == 9
+
+
+def test_only_free_text_inputs_are_case_folded(tmp_path):
+    def compute(name, partner_type, services, notes, category):
+        return partner_type
+
+    with ClassificationCache('r1', path=tmp_path / 'c.sqlite') as cache:
+        assert cache.lookup('type', ('Venice Dogs', 'Groomer', None, None, None), compute) == 'Groomer'
+        # partner_type is returned as is, so a type differing only by case is another entry
+        assert cache.lookup('type', ('VENICE DOGS', 'groomer', None, None, None), compute) == 'groomer'
+        assert cache.lookup('type', ('venice dogs', 'Groomer', None, None, None), compute) == 'Groomer'
+        assert (cache.hits, cache.misses) == (1, 2)
+    make_key = ClassificationCache.make_key
+    assert make_key('area', 'Venice', '1 Main St, Venice') == make_key('area', 'VENICE', '1 MAIN ST, VENICE')
@@ -0,0 +1,56 @@
+import importlib
+import json
+import os
+import pkgutil
+import subprocess
+import sys
+
+import pytest
+
+import gdd_data
+from gdd_data.cli import COMMANDS, build_parser
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(gdd_data.__file__))
+
+
+def run_python(code, tmp_path):
+    """Run `code` in a fresh interpreter with no Supabase env and an unused cache dir."""
+    env = {k: v for k, v in os.environ.items() if not k.startswith(('SUPABASE_', 'DATABASE_URL'))}
+    env['GDD_CACHE_DIR'] = str(tmp_path / 'cache')
+    out = subprocess.run([sys.executable, '-c', code], cwd=SCRIPTS_DIR, env=env,
+                         capture_output=True, text=True, check=True)
+    return out.stdout
+
+
+def test_cli_imports_no_command_modules(tmp_path):
+    loaded = json.loads(run_python(
+        "import json, sys, gdd_data.cli; print(json.dumps(sorted(sys.modules)))", tmp_path))
+    assert [m for m in loaded if m.startswith('gdd_data.')] == ['gdd_data.cli']
+    assert not {'numpy', 'openpyxl', 'psycopg'} & set(loaded)
+
+
+def test_help_runs_without_env(tmp_path):
+    out = run_python("from gdd_data.cli import main\n"
+                     "try:\n    main(['--help'])\nexcept SystemExit:\n    pass", tmp_path)
+    assert 'parse-contacts' in out and 'watch' in out
+    assert not (tmp_path / 'cache').exists()
+
+
+def test_importing_every_module_has_no_side_effects(tmp_path):
+    names = [m.name for m in pkgutil.iter_modules(gdd_data.__path__) if m.name not in ('tests', '__main__')]
+    run_python("import importlib\n"
+               f"for name in {names!r}:\n"
+               "    importlib.import_module('gdd_data.' + name)", tmp_path)
+    # Nothing read the env or created cache directories at import time
+    assert not (tmp_path / 'cache').exists()
+
+
+@pytest.mark.parametrize('name', sorted(COMMANDS))
+def test_every_command_resolves(name):
+    module, _, function = COMMANDS[name][0].partition(':')
+    assert callable(getattr(importlib.import_module(module), function or 'run'))
+
+
+def test_fixed_arguments_reach_the_command():
+    args = build_parser().parse_args(['area'])
+    assert args.module == 'gdd_data.partners' and args.stage == 'area'
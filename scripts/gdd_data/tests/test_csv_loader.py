@@ -0,0 +1,103 @@
+import io
+import urllib.error
+
+import pytest
+
+from gdd_data import csv_loader
+from gdd_data.csv_loader import SPECS, LoadSpec, Loader, coerce_column, import_key, load, read_batches
+
+
+def test_coercions():
+    assert coerce_column(['1,200', 'N/A', ' 7.0 ', 'x'], 'int') == [1200, None, 7, None]
+    assert coerce_column(['$1,234.50', ''], 'number') == [1234.5, None]
+    assert coerce_column(['2025-03-04T10:00', '3/4/25', '12/31/2024', 'soon'], 'date') == [
+        '2025-03-04', '2025-03-04', '2024-12-31', None]
+    assert coerce_column(['4.2M', '110k', '1 million', '7,248'], 'count') == [
+        4_200_000, 110_000, 1_000_000, 7248]
+    assert coerce_column(['@dog_mom https://x', 'instagram.com/pup/', 'Ann@Mail.com'], 'handle') == [
+        'dog_mom', 'pup', 'Ann@Mail.com']
+    assert coerce_column(['Ann@Mail.com', 'see notes'], 'email') == ['ann@mail.com', None]
+
+
+def test_import_key_normalizes_case_and_spacing():
+    assert import_key('  Venice  Dog Park', '2025-01-01') == import_key('venice dog park', '2025-01-01')
+
+
+SPEC = LoadSpec('partners.csv', 'marketing_partners',
+                columns={'name': 'business', 'contact_email': ('email', 'email'), 'notes': 'notes'},
+                key=('name',), fixed={'source': 'test'}, skip={'business': {'Rescues'}})
+
+
+def write_csv(tmp_path, text):
+    path = tmp_path / 'partners.csv'
+    path.write_text(text)
+    return path
+
+
+def test_read_batches_skips_section_and_keyless_rows(tmp_path):
+    path = write_csv(tmp_path, "business,email,notes\n"
+                               "Rescues,,\n"
+                               "Paws,INFO@PAWS.COM,\n"
+                               ",nobody@x.com,no name\n"
+                               "Tails,,short row\n"
+                               "Fins\n")
+    batches = list(read_batches(path, SPEC, batch_size=2))
+    # Rows read per batch include the skipped ones
+    assert [n for n, _ in batches] == [3, 2]
+    records = [r for _, rs in batches for r in rs]
+    assert [(r['name'], r['contact_email'], r['notes']) for r in records] == [
+        ('Paws', 'info@paws.com', None), ('Tails', None, 'short row'), ('Fins', None, None)]
+    assert records[0]['source'] == 'test' and records[0]['import_key'] == 'paws'
+
+
+def test_missing_columns_are_reported(tmp_path):
+    path = write_csv(tmp_path, "business,notes\nPaws,\n")
+    with pytest.raises(ValueError, match='email'):
+        list(read_batches(path, SPEC, 10))
+
+
+class FakeSupabase:
+    def __init__(self, fail=()):
+        self.fail = list(fail)
+        self.posts = []
+
+    def request(self, method, path, data=None, headers=None):
+        if self.fail:
+            raise self.fail.pop(0)
+        if any(r.get('notes') == 'rejected' for r in data):
+            raise urllib.error.HTTPError(path, 400, 'bad row', {}, io.BytesIO(b'{}'))
+        self.posts.append((path, data))
+
+
+def test_nulls_never_overwrite_and_duplicates_merge():
+    client = FakeSupabase()
+    loaded = Loader(client, 'marketing_partners').upsert([
+        {'import_key': 'paws', 'name': 'Paws', 'notes': 'first', 'contact_email': None},
+        {'import_key': 'paws', 'name': 'Paws', 'notes': None, 'contact_email': 'a@paws.com'},
+        {'import_key': 'tails', 'name': 'Tails', 'notes': None, 'contact_email': None},
+    ])
+    assert loaded == 2
+    # One upsert per set of filled columns; no row sends a NULL
+    assert sorted(sorted(row) for _, rows in client.posts for row in rows) == [
+        ['contact_email', 'import_key', 'name', 'notes'], ['import_key', 'name']]
+    assert all(path == 'marketing_partners?on_conflict=import_key' for path, _ in client.posts)
+
+
+def test_rejected_rows_are_isolated_and_transient_errors_retried(monkeypatch):
+    monkeypatch.setattr(csv_loader.time, 'sleep', lambda s: None)
+    client = FakeSupabase(fail=[urllib.error.HTTPError('x', 503, 'busy', {}, io.BytesIO(b''))])
+    loader = Loader(client, 'marketing_partners')
+    rows = [{'import_key': f'p{i}', 'notes': 'rejected' if i == 2 else 'ok'} for i in range(5)]
+    assert loader.upsert(rows) == 4
+    assert loader.rejected == 1
+
+
+def test_dry_run_counts_valid_rows(tmp_path):
+    path = write_csv(tmp_path, "business,email,notes\nPaws,,\npaws,,dupe\n,,\n")
+    stats = load(SPEC, path)
+    assert (stats['read'], stats['loaded'], stats['skipped']) == (3, 1, 1)
+
+
+def test_specs_reference_their_key_columns():
+    for name, spec in SPECS.items():
+        assert set(spec.key) <= set(spec.columns), name
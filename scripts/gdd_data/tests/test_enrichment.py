@@ -0,0 +1,69 @@
+from gdd_data.enrichment import ChainProvider, EnrichmentProvider, Enricher, LocalProvider
+from gdd_data.partners import lookup_batch
+from gdd_data.records import Partner
+
+
+class RemoteProvider(EnrichmentProvider):
+    name = 'remote'
+
+    def __init__(self):
+        self.looked_up = []
+
+    def lookup(self, name):
+        self.looked_up.append(name)
+        return {'website': f"https://{name.lower().replace(' ', '')}.com"}
+
+
+class CountingBucket:
+    def __init__(self):
+        self.taken = 0
+
+    def acquire(self):
+        self.taken += 1
+
+
+class MemoryCache:
+    def __init__(self):
+        self.values = {}
+
+    def get(self, provider, name):
+        return self.values.get((provider, name))
+
+    def put(self, provider, name, value):
+        self.values[provider, name] = value
+
+    def close(self):
+        pass
+
+
+def chain_enricher():
+    remote = RemoteProvider()
+    enricher = Enricher(ChainProvider([LocalProvider({'Venice Dogs': {'address': '1 Main St'}}), remote]),
+                        cache=MemoryCache())
+    enricher.bucket = CountingBucket()
+    return enricher, remote
+
+
+def test_local_answers_take_no_rate_limit_token():
+    enricher, remote = chain_enricher()
+    assert enricher.lookup('venice dogs') == {'address': '1 Main St'}
+    assert enricher.bucket.taken == 0 and enricher.calls == 0
+    assert enricher.lookup('Ocean Paws') == {'website': 'https://oceanpaws.com'}
+    assert enricher.bucket.taken == 1 and remote.looked_up == ['Ocean Paws']
+
+
+def test_only_partners_with_something_to_fill_are_looked_up():
+    enricher, remote = chain_enricher()
+    complete = dict.fromkeys(('website', 'address', 'instagram_handle', 'facebook_url',
+                              'tiktok_handle', 'youtube_url'), 'x')
+    partners = [Partner.from_row({'id': '1', 'name': 'Complete Co', 'area': 'South Bay', **complete}),
+                Partner.from_row({'id': '2', 'name': 'Blank Website', **{**complete, 'website': ''}}),
+                Partner.from_row({'id': '3', 'name': 'No Area', 'address': None})]
+    lookup_batch(partners, ['enrich', 'area'], enricher, None)
+    assert sorted(remote.looked_up) == ['Blank Website', 'No Area']
+
+    # The area stage alone only looks up partners that lack both an area and an address
+    remote.looked_up.clear()
+    lookup_batch([Partner.from_row({'id': '4', 'name': 'Has Address', 'address': '2 Main St'}),
+                  Partner.from_row({'id': '5', 'name': 'Nothing Yet'})], ['area'], enricher, None)
+    assert remote.looked_up == ['Nothing Yet']
@@ -0,0 +1,85 @@
+from gdd_data.geo import OUT_OF_AREA, get_resolver
+from gdd_data.rules import ZONE_NEIGHBORHOODS, determine_area
+
+# Approximate centre of every ZONE_NEIGHBORHOODS entry
+NEIGHBORHOOD_POINTS = {
+    'santa monica': (34.0195, -118.4912), 'venice': (33.9850, -118.4695),
+    'marina del rey': (33.9803, -118.4517), 'culver city': (34.0211, -118.3965),
+    'beverly hills': (34.0736, -118.4004), 'westwood': (34.0635, -118.4455),
+    'malibu': (34.0259, -118.7798), 'pacific palisades': (34.0481, -118.5265),
+    'brentwood': (34.0520, -118.4732), 'mar vista': (34.0020, -118.4300),
+    'west la': (34.0453, -118.4430), 'west los angeles': (34.0453, -118.4430),
+    'rancho park': (34.0440, -118.4150), 'westchester': (33.9597, -118.3970),
+    'playa del rey': (33.9570, -118.4410), 'playa vista': (33.9740, -118.4230),
+    'del rey': (33.9930, -118.4220), 'ocean park': (34.0040, -118.4800),
+    'sawtelle': (34.0390, -118.4470),
+    'studio city': (34.1486, -118.3965), 'sherman oaks': (34.1508, -118.4490),
+    'encino': (34.1592, -118.5012), 'tarzana': (34.1508, -118.5531),
+    'woodland hills': (34.1683, -118.6059), 'burbank': (34.1808, -118.3090),
+    'toluca lake': (34.1520, -118.3530), 'universal city': (34.1381, -118.3534),
+    'valley village': (34.1650, -118.3965), 'westlake village': (34.1459, -118.8053),
+    'calabasas': (34.1575, -118.6384), 'agoura hills': (34.1533, -118.7617),
+    'hidden hills': (34.1603, -118.6523), 'lake sherwood': (34.1394, -118.8712),
+    'northridge': (34.2283, -118.5368), 'chatsworth': (34.2572, -118.6012),
+    'granada hills': (34.2647, -118.5232), 'porter ranch': (34.2819, -118.5537),
+    'van nuys': (34.1867, -118.4490), 'reseda': (34.2011, -118.5365),
+    'canoga park': (34.2011, -118.5981), 'north hollywood': (34.1870, -118.3813),
+    'sun valley': (34.2175, -118.3704), 'sylmar': (34.3078, -118.4492),
+    'mission hills': (34.2572, -118.4673), 'panorama city': (34.2250, -118.4490),
+    'winnetka': (34.2133, -118.5710), 'north hills': (34.2361, -118.4848),
+    'santa clarita': (34.3917, -118.5426), 'valencia': (34.4436, -118.6090),
+    'pacoima': (34.2625, -118.4270), 'san fernando': (34.2819, -118.4390),
+    'lake balboa': (34.1950, -118.4998), 'arleta': (34.2414, -118.4320),
+    'valley glen': (34.1890, -118.4120),
+    'dtla': (34.0407, -118.2468), 'downtown': (34.0407, -118.2468),
+    'silver lake': (34.0869, -118.2702), 'echo park': (34.0782, -118.2606),
+    'hollywood': (34.0928, -118.3287), 'west hollywood': (34.0900, -118.3617),
+    'los feliz': (34.1063, -118.2848), 'eagle rock': (34.1392, -118.2117),
+    'boyle heights': (34.0339, -118.2054), 'hancock park': (34.0735, -118.3384),
+    'melrose': (34.0837, -118.3450), 'koreatown': (34.0618, -118.3004),
+    'mid-wilshire': (34.0625, -118.3467), 'larchmont': (34.0780, -118.3230),
+    'atwater village': (34.1166, -118.2563), 'glassell park': (34.1166, -118.2320),
+    'highland park': (34.1117, -118.1923), 'mid city': (34.0441, -118.3540),
+    'fairfax': (34.0789, -118.3617),
+    'el segundo': (33.9192, -118.4165), 'manhattan beach': (33.8847, -118.4109),
+    'torrance': (33.8358, -118.3406), 'redondo beach': (33.8492, -118.3884),
+    'hawthorne': (33.9164, -118.3526), 'inglewood': (33.9617, -118.3531),
+    'gardena': (33.8883, -118.3090), 'long beach': (33.7701, -118.1937),
+    'cerritos': (33.8583, -118.0648), 'hermosa beach': (33.8622, -118.3995),
+    'lawndale': (33.8872, -118.3526), 'carson': (33.8314, -118.2820),
+    'compton': (33.8958, -118.2201), 'lax': (33.9416, -118.4085),
+    'south la': (33.9890, -118.2910),
+    'pasadena': (34.1478, -118.1445), 'glendale': (34.1425, -118.2551),
+    'arcadia': (34.1397, -118.0353), 'alhambra': (34.0953, -118.1270),
+    'monterey park': (34.0625, -118.1228), 'san marino': (34.1214, -118.1065),
+    'san gabriel': (34.0961, -118.1058), 'la canada': (34.2067, -118.2001),
+    'azusa': (34.1336, -117.9076), 'covina': (34.0900, -117.8903),
+    'monrovia': (34.1442, -118.0019),
+}
+
+
+def test_every_neighborhood_has_a_point():
+    listed = {n for neighborhoods in ZONE_NEIGHBORHOODS.values() for n in neighborhoods}
+    assert listed == set(NEIGHBORHOOD_POINTS)
+
+
+def test_neighborhoods_fall_inside_their_own_zone():
+    resolver = get_resolver()
+    wrong = {}
+    for zone, neighborhoods in ZONE_NEIGHBORHOODS.items():
+        for n in neighborhoods:
+            area = resolver.resolve(*NEIGHBORHOOD_POINTS[n])
+            if area != zone:
+                wrong[n] = (zone, area)
+    assert wrong == {}
+
+
+def test_polygons_agree_with_the_out_of_area_rule():
+    resolver = get_resolver()
+    for name, point in {'thousand oaks': (34.1706, -118.8376), 'simi valley': (34.2694, -118.7815)}.items():
+        assert determine_area(name, None, None, None) == OUT_OF_AREA
+        assert resolver.resolve(*point) == OUT_OF_AREA, name
+
+
+def test_points_beyond_the_zones_and_missing_points():
+    assert get_resolver().resolve_many([(36.17, -115.14), None, (None, -118.4)]) == [OUT_OF_AREA, None, None]
@@ -0,0 +1,70 @@
+import io
+import json
+
+import pytest
+
+from gdd_data import geocode
+from gdd_data.cli import build_parser
+from gdd_data.geocode import GeocodeCache, Geocoder, GoogleGeocoder, NominatimGeocoder, normalize_address
+
+FOUND = {'status': 'OK', 'results': [{'geometry': {'location': {'lat': 33.99, 'lng': -118.47}},
+                                      'formatted_address': '1 Main St, Venice, CA', 'place_id': 'abc'}]}
+
+
+@pytest.fixture
+def google(monkeypatch):
+    """A GoogleGeocoder whose API answers from `responses` {address: payload}; counts requests."""
+    backend = GoogleGeocoder(api_key='test')
+    backend.responses = {}
+    backend.requests = []
+
+    def urlopen(url, timeout=None):
+        address = geocode.urllib.parse.parse_qs(url.split('?', 1)[1])['address'][0]
+        backend.requests.append(address)
+        return io.BytesIO(json.dumps(backend.responses[address]).encode('utf-8'))
+
+    monkeypatch.setattr(geocode.urllib.request, 'urlopen', urlopen)
+    return backend
+
+
+def geocoder(backend, tmp_path):
+    return Geocoder(backend, cache=GeocodeCache(str(tmp_path / 'geocode.sqlite')), rate=1000)
+
+
+def test_normalize_address():
+    assert normalize_address(' 1 Main Street, Venice, CA, USA ') == normalize_address('1 main st., venice, ca')
+
+
+def test_results_and_zero_results_are_cached(google, tmp_path):
+    google.responses = {'1 Main St, Venice': FOUND, 'Nowhere Rd': {'status': 'ZERO_RESULTS', 'results': []}}
+    g = geocoder(google, tmp_path)
+    first = g.geocode_many(['1 Main St, Venice', '1 Main Street, Venice', 'Nowhere Rd'])
+    assert first[normalize_address('1 Main St, Venice')]['place_id'] == 'abc'
+    assert first[normalize_address('Nowhere Rd')] is None
+    assert g.geocode_many(['1 Main St, Venice', 'Nowhere Rd']) == first
+    assert sorted(google.requests) == ['1 Main St, Venice', 'Nowhere Rd']
+    g.close()
+
+
+@pytest.mark.parametrize('status', ['OVER_QUERY_LIMIT', 'REQUEST_DENIED', 'UNKNOWN_ERROR'])
+def test_failed_requests_are_retried_next_run(google, tmp_path, status):
+    google.responses = {'1 Main St, Venice': {'status': status, 'error_message': 'nope'}}
+    g = geocoder(google, tmp_path)
+    assert g.geocode_many(['1 Main St, Venice']) == {}
+    assert g.errors == 1
+    g.close()
+
+    google.responses = {'1 Main St, Venice': FOUND}
+    g = geocoder(google, tmp_path)
+    assert g.geocode_many(['1 Main St, Venice'])[normalize_address('1 Main St, Venice')]['lat'] == 33.99
+    assert google.requests == ['1 Main St, Venice'] * 2
+    g.close()
+
+
+def test_rate_defaults_to_the_backend_limit(tmp_path):
+    cache = GeocodeCache(str(tmp_path / 'geocode.sqlite'))
+    assert Geocoder(NominatimGeocoder(), cache=cache).bucket.rate == 1.0
+    assert Geocoder(GoogleGeocoder(api_key='test'), cache=cache).bucket.rate == 50.0
+    assert Geocoder(NominatimGeocoder(), cache=cache, rate=20).bucket.rate == 20
+    args = build_parser().parse_args(['area', '--geocode', 'google', '--geocode-rate', '10'])
+    assert args.geocode_rate == 10.0
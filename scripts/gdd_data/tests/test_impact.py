@@ -0,0 +1,109 @@
+import pytest
+
+from gdd_data.classify_cache import ClassificationCache
+from gdd_data.impact import RULES_PATH, PartnerIndex, evaluate, impact, load_rules, rule_diff
+from gdd_data.partners import classify_partner
+from gdd_data.records import Partner
+from gdd_data.service import Classifier
+
+ROWS = [
+    {'id': '1', 'name': 'DJ Mike', 'partner_type': 'other'},
+    {'id': '2', 'name': 'Party Animals', 'partner_type': 'other'},
+    {'id': '3', 'name': 'Music Together Venice', 'partner_type': 'other'},
+    {'id': '4', 'name': 'Venice Dog Groomers', 'partner_type': 'groomer'},
+]
+
+
+@pytest.fixture(scope='module')
+def rules_source():
+    with open(RULES_PATH) as f:
+        return f.read()
+
+
+def edited(tmp_path, source, old, new):
+    assert source.count(old) == 1
+    path = tmp_path / 'rules.py'
+    path.write_text(source.replace(old, new))
+    return load_rules(str(path))
+
+
+def test_unchanged_rules_have_an_empty_diff(tmp_path, rules_source):
+    old = load_rules(RULES_PATH)
+    diff = rule_diff(old, edited(tmp_path, rules_source, '# Entertainment detection', '# Entertainment'))
+    assert not diff['all'] and not diff['keywords'] and not diff['names']
+
+
+def test_keyword_edit_only_re_evaluates_partners_containing_it(tmp_path, rules_source):
+    old = load_rules(RULES_PATH)
+    new = edited(tmp_path, rules_source, "'dj', 'entertainment', 'music',", "'dj', 'entertainment', 'musician',")
+    diff, candidates, changed = impact(old, new, ROWS, PartnerIndex(ROWS))
+    assert not diff['all']
+    assert diff['keywords'] == {'music', 'musician'}
+    assert candidates == 1
+    assert [(row['name'], delta['partner_type'][0]) for row, delta in changed] == [
+        ('Music Together Venice', 'entertainment')]
+
+
+def test_changed_result_label_re_evaluates_every_partner(tmp_path, rules_source):
+    old = load_rules(RULES_PATH)
+    new = edited(tmp_path, rules_source, "        return 'entertainment'", "        return 'events'")
+    diff, candidates, changed = impact(old, new, ROWS, PartnerIndex(ROWS))
+    assert diff['all']
+    assert 'events' not in diff['keywords']
+    assert candidates == len(ROWS)
+    assert {row['name']: delta['partner_type'] for row, delta in changed} == {
+        'DJ Mike': ('entertainment', 'events'),
+        'Party Animals': ('entertainment', 'events'),
+        'Music Together Venice': ('entertainment', 'events'),
+    }
+
+
+def test_partner_index_substring_lookup():
+    index = PartnerIndex(ROWS)
+    assert index.containing('groom') == {3}
+    assert index.containing('dj') == {0}
+    assert index.named('  venice dog GROOMERS') == {3}
+    assert index.names_within('the dj mike show') == {0}
+
+
+def test_keyword_moved_to_another_list_re_evaluates_partners_containing_it(tmp_path, rules_source):
+    old = load_rules(RULES_PATH)
+    source = rules_source.replace("'blog', 'podcast', 'studio',", "'blog', 'studio',")
+    new = edited(tmp_path, source, "'paparazzi', 'animation', 'party']",
+                 "'paparazzi', 'animation', 'party', 'podcast']")
+    rows = ROWS + [{'id': '5', 'name': 'Pawcast Podcast', 'partner_type': 'other'}]
+    diff, candidates, changed = impact(old, new, rows, PartnerIndex(rows))
+    assert not diff['all']
+    assert diff['keywords'] == {'podcast'}
+    assert "categorize_partner: ~ 'podcast' (moved to another rule)" in diff['changes']
+    assert candidates == 1
+    assert [(row['name'], delta['partner_type']) for row, delta in changed] == [
+        ('Pawcast Podcast', ('media', 'entertainment'))]
+
+
+def test_located_partners_keep_their_zone_polygon_area(tmp_path, rules_source):
+    old = load_rules(RULES_PATH)
+    new = edited(tmp_path, rules_source, "'santa monica', 'venice', 'marina del rey',",
+                 "'santa monica', 'marina del rey',")
+    rows = [
+        # A Venice name, but coordinates in Sherman Oaks: the polygon decides either way
+        {'id': '1', 'name': 'Venice Pup Club', 'partner_type': 'daycare_boarding',
+         'latitude': 34.151, 'longitude': -118.449},
+        {'id': '2', 'name': 'Venice Pup Walkers', 'partner_type': 'other'},
+    ]
+    diff, candidates, changed = impact(old, new, rows, PartnerIndex(rows))
+    assert candidates == 2
+    assert [(row['name'], delta['area'][0]) for row, delta in changed] == [
+        ('Venice Pup Walkers', 'Westside & Coastal')]
+
+
+def test_partners_service_and_impact_share_one_chain(tmp_path):
+    row = {'id': '1', 'name': 'Venice Pup Club', 'latitude': 34.151, 'longitude': -118.449}
+    expected = {'partner_type': 'daycare_boarding', 'area': 'South Valley'}
+    assert evaluate(load_rules(RULES_PATH), Partner.from_row(row), 'South Valley') == expected
+    assert Classifier().classify_many([row]) == [expected]
+    with ClassificationCache('r1', path=tmp_path / 'c.sqlite') as cache:
+        updates, _ = classify_partner(Partner.from_row(row), ['categorize', 'area'], cache,
+                                      {'enrichment': {}, 'geocoded': {}, 'geo_areas': {'1': 'South Valley'}},
+                                      dict.fromkeys(('categorized', 'areas'), 0))
+    assert updates == expected
@@ -0,0 +1,38 @@
+import pytest
+
+from gdd_data.journal import RunJournal
+
+
+def test_resume_picks_up_applied_rows_and_checkpoint(tmp_path):
+    path = tmp_path / 'j.jsonl'
+    journal = RunJournal(path, 'partners', ['area'])
+    journal.record_applied('a')
+    journal.record_checkpoint('b')
+    journal.record_applied('c')
+    journal.close()
+    # A crash mid-write leaves a torn last line
+    with open(path, 'a') as f:
+        f.write('{"appl')
+
+    resumed = RunJournal(path, 'partners', ['area'], resume=True)
+    assert resumed.resumed and not resumed.finished
+    assert resumed.checkpoint == 'b'
+    assert resumed.is_applied('a') and resumed.is_applied('c')
+    resumed.finish()
+    resumed.close()
+    assert RunJournal(path, 'partners', ['area'], resume=True).finished
+
+
+def test_resume_refuses_another_jobs_journal(tmp_path):
+    path = tmp_path / 'j.jsonl'
+    RunJournal(path, 'partners', ['area']).close()
+    with pytest.raises(ValueError):
+        RunJournal(path, 'partners', ['categorize'], resume=True)
+
+
+def test_without_resume_the_journal_starts_over(tmp_path):
+    path = tmp_path / 'j.jsonl'
+    journal = RunJournal(path, 'partners', ['area'])
+    journal.record_checkpoint('b')
+    journal.close()
+    assert RunJournal(path, 'partners', ['area']).checkpoint is None
@@ -0,0 +1,57 @@
+from gdd_data.med_contacts import diff_contacts, fingerprint, generate_delta_sql, import_keys
+from gdd_data.records import MedContact
+
+ZOETIS = MedContact('Zoetis', 'Pharmacy', contact_name='Ann', account_number='1234')
+IDEXX = MedContact('Idexx', 'Lab', contact_name='Bob')
+VETCONNECT = [MedContact('VetConnect Plus', 'Lab', login_user_id=user) for user in ('gdd1', 'gdd2')]
+
+
+def baseline(contacts):
+    return dict(zip(import_keys(contacts), map(fingerprint, contacts)))
+
+
+def test_import_keys_are_stable_and_distinct():
+    contacts = [ZOETIS, IDEXX] + VETCONNECT
+    keys = import_keys(contacts)
+    assert len(set(keys)) == 4
+    # Order and non-identity fields don't change a record's key
+    moved = [MedContact('Idexx', 'Lab', contact_name='Bob', notes='new rep')] + [ZOETIS] + VETCONNECT
+    assert import_keys(moved)[:2] == [keys[1], keys[0]]
+    # Exact duplicates are told apart by occurrence
+    assert len(set(import_keys([IDEXX, IDEXX]))) == 2
+
+
+def test_diff_finds_inserted_updated_and_removed():
+    previous = baseline([ZOETIS, IDEXX, VETCONNECT[0]])
+    changed = MedContact('Zoetis', 'Pharmacy', contact_name='Ann', account_number='1234',
+                         contact_phone='555-0100')
+    inserted, updated, removed = diff_contacts(previous, [changed, VETCONNECT[0], VETCONNECT[1]])
+    zoetis_key, idexx_key, _ = previous
+    assert [c for _, c in inserted] == [VETCONNECT[1]]
+    assert updated == [(zoetis_key, changed)]
+    assert removed == [idexx_key]
+    assert diff_contacts(previous, [ZOETIS, IDEXX, VETCONNECT[0]]) == ([], [], [])
+
+
+def test_delta_sql_updates_and_deletes_by_import_key():
+    previous = baseline([ZOETIS, IDEXX])
+    changed = MedContact('Zoetis', 'Pharmacy', contact_name='Ann', account_number='1234',
+                         notes="O'Brien's line")
+    inserted, updated, removed = diff_contacts(previous, [changed, VETCONNECT[0]])
+    zoetis_key, idexx_key = previous
+    sql = generate_delta_sql(inserted, updated, removed).splitlines()
+
+    assert '1 inserted, 1 updated, 1 removed' in sql[1]
+    assert f"DELETE FROM public.med_contacts WHERE import_key IN ('{idexx_key}');" in sql
+    (update,) = [line for line in sql if line.startswith('UPDATE')]
+    assert update.startswith("UPDATE public.med_contacts SET vendor_name = 'Zoetis', category = 'Pharmacy', ")
+    assert "notes = 'O''Brien''s line'" in update and 'login_password = NULL' in update
+    assert update.endswith(f"updated_at = now() WHERE import_key = '{zoetis_key}';")
+    insert = sql[sql.index('VALUES') + 1]
+    assert insert.startswith("('VetConnect Plus', 'Lab', ")
+    assert insert.endswith(f"'{inserted[0][0]}', true)")
+
+
+def test_empty_delta_has_no_statements():
+    sql = generate_delta_sql([], [], [])
+    assert 'DELETE' not in sql and 'UPDATE' not in sql and 'INSERT' not in sql
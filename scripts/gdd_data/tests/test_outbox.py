@@ -0,0 +1,155 @@
+import io
+import urllib.error
+
+import pytest
+
+from gdd_data import outbox as outbox_module
+from gdd_data.outbox import BULK_FUNCTION, Outbox
+from gdd_data.records import Partner
+
+
+def http_error(code):
+    return urllib.error.HTTPError('http://supabase/rest/v1/x', code, 'error', {}, io.BytesIO(b'{}'))
+
+
+class FakeSupabase:
+    """Applies bulk updates whose updated_at still matches `rows`; `fail` queues errors to raise."""
+
+    def __init__(self, rows, bulk=True):
+        self.rows = rows
+        self.bulk = bulk
+        self.fail = []
+        self.calls = []
+
+    def request(self, method, path, data=None, headers=None):
+        self.calls.append((method, path, data))
+        if self.fail:
+            raise self.fail.pop(0)
+        if path == f"rpc/{BULK_FUNCTION}":
+            if not self.bulk:
+                raise http_error(404)
+            applied = []
+            for change in data['changes']:
+                row = self.rows.get(change['id'])
+                if 'bad' in change['fields']:
+                    raise http_error(400)
+                if row and row['updated_at'] == change['updated_at']:
+                    row.update(change['fields'])
+                    applied.append(change['id'])
+            return applied
+        # Fallback PATCH: marketing_partners?select=id&id=eq.<id>&updated_at=eq.<stamp>
+        query = dict(part.split('=', 1) for part in path.split('?', 1)[1].split('&'))
+        pid, stamp = query['id'][3:], query['updated_at'][3:]
+        row = self.rows.get(pid)
+        if row and row['updated_at'] == stamp:
+            row.update(data)
+            return [{'id': pid}]
+        return []
+
+
+def partner(pid, updated_at='t1'):
+    return Partner.from_row({'id': pid, 'name': f"Partner {pid}", 'updated_at': updated_at})
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(outbox_module, 'BACKOFF_BASE', 0.01)
+
+
+def test_batch_goes_out_in_one_conditional_call(tmp_path):
+    client = FakeSupabase({'a': {'updated_at': 't1'}, 'b': {'updated_at': 't1'}})
+    box = Outbox(client, tmp_path / 'o.sqlite')
+    box.put_many([(partner('a'), {'area': 'South Bay'}, ['area']),
+                  (partner('b'), {'area': 'Westside & Coastal'}, ['area'])])
+    status = box.close(5)
+    assert status['done'] == 2 and status['pending'] == 0
+    assert client.rows['a']['area'] == 'South Bay'
+    assert [path for _, path, _ in client.calls] == [f"rpc/{BULK_FUNCTION}"]
+    assert client.calls[0][2]['changes'][0] == {'id': 'a', 'updated_at': 't1', 'fields': {'area': 'South Bay'}}
+
+
+def test_partner_edited_meanwhile_is_reclassified(tmp_path):
+    client = FakeSupabase({'a': {'updated_at': 't2'}})
+
+    def on_stale(pid):
+        return partner(pid, 't2'), {'area': 'South Valley'}, ['area']
+
+    box = Outbox(client, tmp_path / 'o.sqlite', on_stale=on_stale)
+    box.put_many([(partner('a', 't1'), {'area': 'South Bay'}, ['area'])])
+    status = box.close(5)
+    assert status['reclassified'] == 1 and status['done'] == 1
+    assert client.rows['a']['area'] == 'South Valley'
+
+
+def test_without_on_stale_an_edited_partner_is_left_alone(tmp_path):
+    client = FakeSupabase({'a': {'updated_at': 't2', 'area': 'Manual'}})
+    box = Outbox(client, tmp_path / 'o.sqlite')
+    box.put_many([(partner('a', 't1'), {'area': 'South Bay'}, ['area'])])
+    assert box.close(5)['stale'] == 1
+    assert client.rows['a']['area'] == 'Manual'
+
+
+def test_transient_errors_are_retried(tmp_path):
+    client = FakeSupabase({'a': {'updated_at': 't1'}})
+    client.fail = [http_error(503), ConnectionResetError()]
+    box = Outbox(client, tmp_path / 'o.sqlite')
+    box.put_many([(partner('a'), {'area': 'South Bay'}, ['area'])])
+    status = box.close(5)
+    assert status['retries'] == 2 and status['done'] == 1
+
+
+def test_rejected_change_is_isolated_from_its_batch(tmp_path):
+    client = FakeSupabase({'a': {'updated_at': 't1'}, 'b': {'updated_at': 't1'}})
+    box = Outbox(client, tmp_path / 'o.sqlite')
+    box.put_many([(partner('a'), {'bad': 1}, ['bad']),
+                  (partner('b'), {'area': 'South Bay'}, ['area'])])
+    status = box.close(5)
+    assert status['failed'] == 1 and status['done'] == 1
+    assert client.rows['b']['area'] == 'South Bay'
+
+
+def test_falls_back_to_conditional_patches(tmp_path):
+    client = FakeSupabase({'a': {'updated_at': 't1'}, 'b': {'updated_at': 't2'}}, bulk=False)
+    box = Outbox(client, tmp_path / 'o.sqlite')
+    box.put_many([(partner('a'), {'area': 'South Bay'}, ['area']),
+                  (partner('b'), {'area': 'South Bay'}, ['area'])])
+    status = box.close(5)
+    assert status['done'] == 1 and status['stale'] == 1
+    assert 'area' not in client.rows['b']
+
+
+def test_patch_failure_part_way_only_resends_the_rest(tmp_path):
+    class FlakyPatches(FakeSupabase):
+        patches = 0
+
+        def request(self, method, path, data=None, headers=None):
+            if method == 'PATCH':
+                self.patches += 1
+                if self.patches == 2:
+                    self.calls.append((method, path, data))
+                    raise ConnectionResetError('connection reset')
+            return super().request(method, path, data, headers)
+
+    client = FlakyPatches({pid: {'updated_at': 't1'} for pid in 'abc'}, bulk=False)
+    box = Outbox(client, tmp_path / 'o.sqlite', on_stale=lambda pid: pytest.fail(f"{pid} seen as stale"))
+    box.put_many([(partner(pid), {'area': 'South Bay'}, ['area']) for pid in 'abc'])
+    status = box.close(5)
+    assert status['done'] == 3 and not status.get('stale') and not status.get('reclassified')
+    patched = [path.split('id=eq.')[1][0] for method, path, _ in client.calls if method == 'PATCH']
+    assert sorted(patched) == ['a', 'b', 'b', 'c']
+
+
+def test_unsent_changes_survive_for_the_next_run(tmp_path, monkeypatch):
+    monkeypatch.setattr(outbox_module, 'BACKOFF_BASE', 60.0)
+    path = tmp_path / 'o.sqlite'
+    down = FakeSupabase({'a': {'updated_at': 't1'}})
+    down.fail = [ConnectionRefusedError()]
+    box = Outbox(down, path)
+    box.put_many([(partner('a'), {'area': 'South Bay'}, ['area'])])
+    assert box.close(0.5)['pending'] == 1
+
+    up = FakeSupabase(down.rows)
+    box = Outbox(up, path)
+    assert box.carried == 1
+    assert box.close(5)['done'] == 1
+    assert up.rows['a']['area'] == 'South Bay'
@@ -0,0 +1,69 @@
+import os
+import shutil
+
+import openpyxl
+import pytest
+
+from gdd_data import parse_cache
+from gdd_data.parse_cache import parse_workbook
+
+CALLS = []
+
+
+def first_column(ws):
+    CALLS.append(ws.title)
+    return [row[0] for row in ws.iter_rows(values_only=True)]
+
+
+@pytest.fixture
+def workbook(tmp_path, monkeypatch):
+    monkeypatch.setattr(parse_cache, 'PARSED_DIR', str(tmp_path / 'parsed'))
+    CALLS.clear()
+    wb = openpyxl.Workbook()
+    wb.active.title = 'Contacts'
+    wb.active.append(['Zoetis'])
+    wb.create_sheet('Updated').append(['Idexx'])
+    path = tmp_path / 'contacts.xlsx'
+    wb.save(path)
+    return path
+
+
+PARSERS = {'Contacts': first_column, 'Updated': first_column}
+
+
+def test_second_parse_is_served_from_the_cache(workbook, tmp_path):
+    results, cached = parse_workbook(workbook, PARSERS, version=1)
+    assert results == {'Contacts': ['Zoetis'], 'Updated': ['Idexx']} and cached == set()
+    assert CALLS == ['Contacts', 'Updated']
+
+    assert parse_workbook(workbook, PARSERS, version=1) == (results, {'Contacts', 'Updated'})
+    # A byte-identical copy under another name hits the same entries
+    copy = shutil.copy(workbook, tmp_path / 'copy.xlsx')
+    assert parse_workbook(copy, PARSERS, version=1)[1] == {'Contacts', 'Updated'}
+    assert len(CALLS) == 2
+
+
+def test_version_bump_and_no_cache_parse_again(workbook):
+    parse_workbook(workbook, PARSERS, version=1)
+    assert parse_workbook(workbook, PARSERS, version=2)[1] == set()
+    assert parse_workbook(workbook, PARSERS, version=2, use_cache=False)[1] == set()
+    assert len(CALLS) == 6
+
+
+def test_only_missing_sheets_are_parsed(workbook):
+    parse_workbook(workbook, {'Contacts': first_column}, version=1)
+    results, cached = parse_workbook(workbook, PARSERS, version=1)
+    assert cached == {'Contacts'} and results['Updated'] == ['Idexx']
+    assert CALLS == ['Contacts', 'Updated']
+
+
+def test_torn_cache_file_is_parsed_again(workbook):
+    parse_workbook(workbook, PARSERS, version=1)
+    for name in os.listdir(parse_cache.PARSED_DIR):
+        path = os.path.join(parse_cache.PARSED_DIR, name)
+        with open(path, 'r+b') as f:
+            f.truncate(os.path.getsize(path) // 2)
+    results, cached = parse_workbook(workbook, PARSERS, version=1)
+    assert cached == set() and results['Contacts'] == ['Zoetis']
+    # ... and the entries were rewritten whole
+    assert parse_workbook(workbook, PARSERS, version=1)[1] == {'Contacts', 'Updated'}
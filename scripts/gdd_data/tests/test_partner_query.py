@@ -0,0 +1,62 @@
+import urllib.parse
+
+from gdd_data.partners import STAGES, partner_query
+from gdd_data.postgrest import PostgrestClient, build_query
+
+
+class RecordingClient(PostgrestClient):
+    """Serves `rows` (sorted by id) and records each request path and Range."""
+
+    def __init__(self, rows):
+        super().__init__('https://example.supabase.co', 'key')
+        self.rows = sorted(rows, key=lambda r: r['id'])
+        self.requests = []
+
+    def request(self, method, path, data=None, headers=None):
+        self.requests.append((path, headers['Range']))
+        query = urllib.parse.parse_qs(path.partition('?')[2])
+        after = next((v[len('gt.'):] for v in query.get('id', ()) if v.startswith('gt.')), '')
+        start, end = map(int, headers['Range'].split('-'))
+        return [r for r in self.rows if r['id'] > after][:end - start + 1]
+
+
+def test_build_query_pushes_filters_down():
+    query = build_query(['id', 'name'], ['area=is.null', 'name=ilike.*dog park*'], order='id')
+    assert query == 'select=id,name&area=is.null&name=ilike.*dog%20park*&order=id'
+
+
+def test_single_stage_selects_only_its_columns_and_pushes_its_filters():
+    columns, filters = partner_query(['area'])
+    assert set(columns) == {'id', 'updated_at'} | set(STAGES['area']['columns'])
+    assert columns[0] == 'id' and 'website' not in columns
+    assert filters == ('area=is.null',)
+
+
+def test_several_stages_read_the_union_without_filters():
+    columns, filters = partner_query(['categorize', 'enrich'])
+    assert {'partner_type', 'website', 'tiktok_handle'} <= set(columns)
+    assert 'latitude' not in columns
+    assert filters == ()
+
+
+def test_categorize_filter_keeps_fixed_names_whatever_their_type():
+    (categorize,) = partner_query(['categorize'])[1]
+    assert categorize.startswith('or=(partner_type.is.null,partner_type.not.in.(')
+    assert 'name.ilike."*' in categorize
+
+
+def test_select_pages_walks_keyset_pages():
+    client = RecordingClient([{'id': f"{i:02d}"} for i in range(5)])
+    pages = list(client.select_pages('marketing_partners', ['id'], ['area=is.null'], page_size=2))
+    assert [[r['id'] for r in page] for page in pages] == [['00', '01'], ['02', '03'], ['04']]
+    paths = [path for path, _ in client.requests]
+    assert paths[0] == 'marketing_partners?select=id&area=is.null&order=id'
+    assert paths[1].endswith('&id=gt.01&order=id') and paths[2].endswith('&id=gt.03&order=id')
+    # Every page starts at offset 0; the key filter does the paging
+    assert {rng for _, rng in client.requests} == {'0-1'}
+
+
+def test_select_pages_resumes_after_a_checkpoint():
+    client = RecordingClient([{'id': f"{i:02d}"} for i in range(4)])
+    pages = list(client.select_pages('marketing_partners', ['id'], page_size=3, after='01'))
+    assert pages == [[{'id': '02'}, {'id': '03'}]]
@@ -0,0 +1,48 @@
+import threading
+
+import pytest
+
+from gdd_data.pipeline import Pipeline
+
+
+def test_stages_run_in_order_and_drop_none():
+    pipeline = Pipeline(range(6), [('double', lambda x: x * 2),
+                                   ('odd', lambda x: x if x % 4 else None)])
+    assert list(pipeline) == [2, 6, 10]
+    assert [(name, batches) for name, batches, _ in pipeline.timings()] == [
+        ('fetch', 6), ('double', 6), ('odd', 6)]
+
+
+def test_stage_error_is_raised_to_the_caller():
+    def boom(x):
+        if x == 3:
+            raise ValueError('bad batch')
+        return x
+
+    with pytest.raises(ValueError, match='bad batch'):
+        Pipeline(range(10), [('boom', boom)]).run()
+
+
+def test_source_error_is_raised_to_the_caller():
+    def source():
+        yield 1
+        raise ConnectionError('fetch failed')
+
+    with pytest.raises(ConnectionError):
+        Pipeline(source(), [('id', lambda x: x)]).run()
+
+
+def test_stages_overlap():
+    # The first stage can only finish batch 2 once the second stage has started on batch 1
+    second_started = threading.Event()
+
+    def first(x):
+        if x == 2:
+            assert second_started.wait(5)
+        return x
+
+    def second(x):
+        second_started.set()
+        return x
+
+    assert list(Pipeline(range(3), [('first', first), ('second', second)])) == [0, 1, 2]
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from gdd_data.clinic_proximity import territory_query
+from gdd_data.proximity import PointIndex, haversine_miles, nearest_clinics
+
+# Around Los Angeles
+rng = np.random.default_rng(7)
+LAT = rng.uniform(33.7, 34.4, 2000)
+LNG = rng.uniform(-118.7, -117.9, 2000)
+CLINIC_LAT = np.array([33.99, 34.15, 33.85, 34.07])
+CLINIC_LNG = np.array([-118.47, -118.45, -118.39, -118.26])
+
+
+def test_haversine_miles():
+    # Venice to downtown LA is about 14 miles
+    assert haversine_miles(33.985, -118.469, 34.052, -118.244) == pytest.approx(13.7, abs=0.3)
+    assert haversine_miles(34.0, -118.0, 34.0, -118.0) == 0
+
+
+def test_nearest_clinics_matches_brute_force_across_batches():
+    idx, miles = nearest_clinics(LAT, LNG, CLINIC_LAT, CLINIC_LNG, k=2, batch_size=300)
+    d = haversine_miles(LAT[:, None], LNG[:, None], CLINIC_LAT[None, :], CLINIC_LNG[None, :])
+    expected = np.argsort(d, axis=1)[:, :2]
+    assert idx.shape == miles.shape == (len(LAT), 2)
+    assert np.array_equal(idx, expected)
+    assert np.allclose(miles, np.take_along_axis(d, expected, axis=1))
+
+
+def test_nearest_clinics_caps_k_at_the_clinic_count():
+    idx, miles = nearest_clinics(LAT[:5], LNG[:5], CLINIC_LAT, CLINIC_LNG, k=10)
+    assert idx.shape == (5, 4)
+    assert (np.diff(miles, axis=1) >= 0).all()
+
+
+@pytest.mark.parametrize('miles', [0.5, 3, 12])
+def test_point_index_radius_matches_brute_force(miles):
+    index = PointIndex(LAT, LNG, leaf_size=16)
+    idx, dist = index.query_radius(34.0, -118.4, miles)
+    all_dist = haversine_miles(34.0, -118.4, LAT, LNG)
+    assert set(idx.tolist()) == set(np.flatnonzero(all_dist <= miles).tolist())
+    assert np.allclose(dist, all_dist[idx]) and (np.diff(dist) >= 0).all()
+
+
+def test_empty_point_index():
+    idx, dist = PointIndex([], []).query_radius(34.0, -118.4, 5)
+    assert len(idx) == len(dist) == 0
+
+
+def test_territory_query_lists_partners_without_a_name(capsys):
+    clinics = [{'name': 'Green Dog - Venice', 'code': 'VEN', 'latitude': 33.985, 'longitude': -118.4695}]
+    partners = [{'name': None, 'partner_type': 'groomer'}, {'name': 'Venice Pups', 'area': 'Westside & Coastal'}]
+    territory_query(clinics, partners, [33.986, 33.99], [-118.47, -118.46], 'ven', 3, None)
+    out = capsys.readouterr().out
+    assert 'groomer' in out and 'Venice Pups' in out and '2 partners' in out
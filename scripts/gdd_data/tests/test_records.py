@@ -0,0 +1,41 @@
+import json
+
+import pytest
+
+from gdd_data.records import PARTNER_FIELDS, Area, MedContact, Partner, PartnerType, intern_value
+
+
+def test_partner_from_row_interns_known_values():
+    p = Partner.from_row({'id': 'a', 'name': None, 'partner_type': 'groomer', 'area': 'South Bay',
+                          'latitude': '34.01', 'longitude': -118.45, 'category': 'Pets'})
+    assert p.name == ''
+    assert p.partner_type is PartnerType.GROOMER and p.area is Area.SOUTH_BAY
+    assert (p.latitude, p.longitude) == (34.01, -118.45)
+    assert p.updated_at is None and p.address is None
+
+    # Values outside the enums are kept as shared strings
+    q = Partner.from_row({'id': 'b', 'partner_type': 'podcast network', 'category': 'Pets'})
+    assert q.partner_type == 'podcast network' and not isinstance(q.partner_type, PartnerType)
+    assert q.category is p.category
+
+
+def test_partner_is_slotted_and_covers_every_column():
+    p = Partner.from_row({'id': 'a'})
+    with pytest.raises(AttributeError):
+        p.unknown = 1
+    assert PARTNER_FIELDS[0] == 'id' and 'updated_at' in PARTNER_FIELDS
+
+
+def test_enum_values_format_and_encode_as_plain_strings():
+    assert f"{Area.WESTSIDE_COASTAL}" == 'Westside & Coastal'
+    assert str(PartnerType.MEDIA) == 'media'
+    assert json.dumps({'area': Area.SOUTH_VALLEY}) == '{"area": "South Valley"}'
+    assert intern_value(None, Area) is None
+
+
+def test_med_contact_interns_repeated_columns():
+    a = MedContact(''.join(['Zoe', 'tis']), 'Pharmacy', order_method='Portal')
+    b = MedContact('Zoetis', ''.join(['Pharm', 'acy']), order_method=''.join(['Por', 'tal']))
+    assert a.vendor_name is b.vendor_name and a.category is b.category
+    assert a.order_method is b.order_method
+    assert a.to_dict()['sub_label'] is None
@@ -0,0 +1,78 @@
+import sys
+
+import numpy as np
+import pytest
+
+from gdd_data import referrer_revenue
+from gdd_data.referrer_revenue import NameIndex, partner_stats, read_exports, rollup
+
+PARTNERS = [
+    {'id': 'p1', 'name': 'VCA Animal Hospital - West LA'},
+    {'id': 'p2', 'name': 'Brentwood Pet Clinic'},
+    {'id': 'p3', 'name': 'Dr. Kim Sunset Veterinary'},
+]
+
+
+def test_name_index_fallbacks():
+    index = NameIndex(PARTNERS)
+    assert index.match('brentwood  pet clinic')['id'] == 'p2'
+    assert index.match('VCA Animal Hospital West LA')['id'] == 'p1'
+    assert index.match('Brentwood Pet Clinic Inc')['id'] == 'p2'
+    assert index.match('Sunset Kim Vets')['id'] == 'p3'
+    assert index.match('The Veterinary Group') is None
+
+
+def test_rollup_per_group():
+    codes = np.array([0, 1, 0, 0])
+    amount = np.array([10.0, 5.0, 2.5, 1.0])
+    date = np.array(['2025-01-02', '2025-03-01', '2025-02-01', 'NaT'], dtype='datetime64[D]')
+    division = np.array(['Venice', 'Van Nuys', 'Sherman Oaks', 'Venice'], dtype=object)
+    referrals, revenue, last, divisions = rollup(codes, 3, amount, date, division)
+    assert referrals.tolist() == [3, 1, 0]
+    assert revenue.tolist() == [13.5, 5.0, 0.0]
+    assert str(last[0]) == '2025-02-01' and np.isnat(last[2])
+    assert divisions == [['Sherman Oaks', 'Venice'], ['Van Nuys'], []]
+
+
+def rows(*detail):
+    clinic, division, amount, date = zip(*detail)
+    return {'clinic': np.array(clinic, dtype=object), 'division': np.array(division, dtype=object),
+            'amount': np.array(amount), 'date': np.array(date, dtype='datetime64[D]')}
+
+
+def test_partner_stats_merges_clinic_spellings_and_keeps_new_clinics():
+    entries, unmatched = partner_stats(rows(
+        ('Brentwood Pet Clinic', 'Venice', 100.0, '2025-01-01'),
+        ('BRENTWOOD PET CLINIC', 'Venice', 50.0, '2025-02-01'),
+        ('Ocean Paws', 'Venice', 20.0, '2025-01-15'),
+    ), NameIndex(PARTNERS))
+    by_name = {e['name']: e for e in entries}
+    assert by_name['Brentwood Pet Clinic'] == {
+        'id': 'p2', 'name': 'Brentwood Pet Clinic', 'referrals': 2, 'revenue': 150.0,
+        'last_referral_date': '2025-02-01', 'divisions': ['Venice']}
+    assert by_name['Ocean Paws']['id'] is None
+    assert unmatched == ['Ocean Paws']
+
+
+def test_overlapping_exports_are_deduplicated(monkeypatch):
+    def detail(*keys):
+        return {'clinic': np.array([k[1] for k in keys], dtype=object),
+                'division': np.array(['Venice'] * len(keys), dtype=object),
+                'amount': np.array([k[2] for k in keys]),
+                'date': np.array(['2025-01-01'] * len(keys), dtype='datetime64[D]'),
+                'key': list(keys)}
+
+    exports = {'a.xls': detail(('d1', 'A', 1.0), ('d2', 'B', 2.0)),
+               'b.xls': detail(('d2', 'B', 2.0), ('d3', 'C', 3.0)),
+               'empty.xls': None}
+    monkeypatch.setattr(referrer_revenue, 'read_export', exports.get)
+    combined, stats = read_exports(['a.xls', 'b.xls', 'empty.xls'])
+    assert combined['clinic'].tolist() == ['A', 'B', 'C']
+    assert stats == [('a.xls', 2, 0), ('b.xls', 2, 1), ('empty.xls', 0, 0)]
+
+
+def test_missing_xlrd_fails_with_install_hint(monkeypatch, capsys):
+    monkeypatch.setitem(sys.modules, 'xlrd', None)
+    with pytest.raises(SystemExit):
+        referrer_revenue.read_export('Referrer Revenue-2026-03-04.xls')
+    assert 'pip install xlrd' in capsys.readouterr().err
@@ -0,0 +1,10 @@
+from gdd_data.service import Classifier
+
+
+def test_memo_keeps_partner_type_case():
+    classifier = Classifier()
+    results = classifier.classify_many([{'name': 'Happy Tails', 'partner_type': 'Rescue'},
+                                        {'name': 'Happy Tails', 'partner_type': 'rescue'},
+                                        {'name': ' happy tails ', 'partner_type': 'rescue'}])
+    assert [r['partner_type'] for r in results] == ['Rescue', 'rescue', 'rescue']
+    assert len(classifier.memo) == 2
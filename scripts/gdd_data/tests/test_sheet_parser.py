@@ -0,0 +1,91 @@
+import os
+
+import openpyxl
+
+from gdd_data.med_contacts import WORKBOOK, parse_contacts_sheet, parse_updated_sheet
+from gdd_data.sheet_parser import SheetSchema, parse_sheet
+
+REPO_ROOT = os.path.join(os.path.dirname(__file__), '..', '..', '..')
+
+
+def sheet(*rows):
+    ws = openpyxl.Workbook().active
+    for row in rows:
+        ws.append(list(row))
+    return ws
+
+
+def test_sections_vendors_and_sub_entries():
+    schema = SheetSchema(
+        columns={'vendor': 0, 'contact': 1},
+        key='vendor',
+        entry=('contact',),
+        build=lambda row, state: (state.section, state.vendor, row['contact'], state.sub_entry),
+        header_unless=('contact',),
+        is_header=str.isupper,
+        default_section='General',
+    )
+    ws = sheet(('Vendor', 'Contact'),
+               ('Acme', 'Ann'),
+               (None, 'Bob'),
+               ('LAB', None),
+               ('Idexx', ' Cy '),
+               ('Zoetis', None))
+    assert parse_sheet(ws, schema) == [
+        ('General', 'Acme', 'Ann', False),
+        ('General', 'Acme', 'Bob', True),
+        ('LAB', 'Idexx', 'Cy', False),
+    ]
+
+
+def test_contacts_sheet():
+    ws = sheet(('Vendor', 'Forms', 'Misc Info', 'Contact', 'Email', 'Phone', 'Account #', 'Website'),
+               ('PHARMACY', None, None, None, None, None, None, None),
+               ('Covetrus', None, None, 'Dana', 'dana@covetrus.com', None, 1234.0, None),
+               (None, None, None, 'Sherman Oaks Rep', None, None, None, None),
+               (None, None, None, 'Eve', None, '555-0100', None, 'N/A'))
+    contacts = parse_contacts_sheet(ws)
+    assert [(c.vendor_name, c.category, c.contact_name, c.sub_label) for c in contacts] == [
+        ('Covetrus', 'PHARMACY', 'Dana', None),
+        ('Covetrus', 'PHARMACY', 'Sherman Oaks Rep', 'Sherman Oaks Rep'),
+        ('Covetrus', 'PHARMACY', 'Eve', None),
+    ]
+    assert contacts[0].account_number == '1234'
+    assert contacts[2].website is None
+
+
+def test_updated_sheet_drops_retired_sections():
+    header = ('VENDOR', 'INFO') + (None,) * 10 + ('CONTACT NAME',)
+    ws = sheet(header,
+               header,
+               ('Chewy', 'autoship') + (None,) * 10 + ('Fay',),
+               ('OLD - NO LONGER USING',),
+               ('Gone Inc', 'old login'),
+               ('CE ONLY (BILLING)',),
+               ('VetCE', 'billing'))
+    contacts = parse_updated_sheet(ws)
+    assert [(c.vendor_name, c.sub_label, c.contact_name) for c in contacts] == [
+        ('Chewy', 'autoship', 'Fay'),
+        ('VetCE', 'billing', None),
+    ]
+
+
+def test_retired_section_of_the_real_updated_sheet():
+    # Rows 82-94: "OLD - NO LONGER USING" (five PetDX accounts), then "CE ONLY (BILLING)"
+    path = os.path.join(REPO_ROOT, WORKBOOK)
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws = wb['Updated Contacts Feb 2026']
+        assert ws.cell(82, 1).value.startswith('OLD - NO LONGER USING')
+        assert ws.cell(91, 1).value.strip() == 'CE ONLY (BILLING)'
+        contacts = parse_updated_sheet(ws)
+    finally:
+        wb.close()
+
+    vendors = {c.vendor_name for c in contacts}
+    assert not any(v.startswith('PetDX') for v in vendors)
+    assert not {'10327', '10239', '10328', '10326', 'PETDX-C152'} & {c.account_number for c in contacts}
+    # Entries after the next section header are kept again
+    assert {'Brasseler (login only for payments????)', 'US Bank Copier'} <= vendors
+    assert any(c.vendor_name == 'Auburn STAT PET TRAVEL Deija'
+               and c.sub_label == 'TO MAKE PAYMENTS & DOWNLOAD INVOICES OR STATEMENTS' for c in contacts)
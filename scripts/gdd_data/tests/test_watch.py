@@ -0,0 +1,132 @@
+import urllib.error
+
+import pytest
+
+from gdd_data import watch
+from gdd_data.records import Partner
+from gdd_data.watch import Worker, collect_batch, guarded
+
+from .test_outbox import FakeSupabase, http_error
+
+PARTNER_A = '0b4a3a4e-8f33-4c1e-9b57-1d2a5f0e6c11'
+PARTNER_B = '7d0c2f9e-3a61-4b8e-a2d4-5c9e8f1b0a22'
+
+
+class FakeReceive:
+    """receive(timeout, limit) serving scripted notification bursts, recording each call."""
+
+    def __init__(self, *bursts):
+        self.bursts = list(bursts)
+        self.calls = []
+
+    def __call__(self, timeout, limit):
+        self.calls.append((timeout, limit))
+        return self.bursts.pop(0)[:limit] if self.bursts else []
+
+
+class WatchedSupabase(FakeSupabase):
+    def __init__(self, rows):
+        super().__init__({pid: {'updated_at': row['updated_at']} for pid, row in rows.items()})
+        self.source = rows
+        self.selects = []
+
+    def select(self, table, columns, filters=(), order=None, offset=0, limit=1000):
+        self.selects.append(filters)
+        ids = filters[0][len('id=in.('):-1].split(',')
+        return [dict(self.source[i], id=i) for i in ids if i in self.source][:limit]
+
+
+@pytest.fixture
+def worker(tmp_path, monkeypatch):
+    monkeypatch.setattr(watch, 'outbox_path', lambda name: tmp_path / f"{name}.sqlite")
+
+    def make(rows):
+        return Worker(WatchedSupabase(rows))
+    return make
+
+
+def test_batch_collects_a_burst_within_the_window():
+    receive = FakeReceive(['a'], ['b', 'a'], ['c'])
+    assert collect_batch(receive, window=1.0, max_batch=10) == {'a', 'b', 'c'}
+    assert receive.calls[0] == (5.0, 10)
+    assert all(0 < timeout <= 1.0 for timeout, _ in receive.calls[1:])
+
+
+def test_batch_stops_at_max_batch():
+    receive = FakeReceive(['a', 'b'], ['c', 'd', 'e'], ['f'])
+    assert collect_batch(receive, window=1.0, max_batch=3) == {'a', 'b', 'c'}
+    assert receive.calls[1][1] == 1 and len(receive.calls) == 2
+
+
+def test_idle_timeout_returns_nothing():
+    receive = FakeReceive()
+    assert collect_batch(receive, window=1.0, max_batch=10, idle_timeout=0.01) == set()
+    assert len(receive.calls) == 1
+
+
+def test_worker_classifies_and_queues_changed_rows(worker):
+    w = worker({'a': {'updated_at': 't1'}, 'b': {'updated_at': 't1'}})
+    w.process_rows([
+        Partner.from_row({'id': 'a', 'name': 'Happy Paws Grooming', 'updated_at': 't1',
+                          'address': '1200 Abbot Kinney Blvd, Venice, CA 90291'}),
+        # Already typed and placed: nothing to write
+        Partner.from_row({'id': 'b', 'name': 'Bark Rescue', 'partner_type': 'rescue',
+                          'area': 'South Bay', 'updated_at': 't1'}),
+    ])
+    w.close(5)
+    assert w.stats['processed'] == 2 and w.stats['queued'] == 1 and w.stats['updated'] == 1
+    assert w.client.rows['a'] == {'updated_at': 't1', 'partner_type': 'groomer',
+                                  'area': 'Westside & Coastal'}
+    assert w.client.rows['b'] == {'updated_at': 't1'}
+
+
+def test_worker_fetches_notified_ids_in_one_select(worker):
+    w = worker({PARTNER_A: {'name': 'Happy Paws Grooming', 'updated_at': 't1'},
+                PARTNER_B: {'name': 'Bark Rescue', 'partner_type': 'rescue', 'updated_at': 't1'}})
+    w.process({PARTNER_B, PARTNER_A, 'not-a-uuid; drop table'})
+    w.close(5)
+    assert w.client.selects == [[f"id=in.({PARTNER_A},{PARTNER_B})"]]
+    assert w.stats['processed'] == 2
+    assert w.client.rows[PARTNER_A]['partner_type'] == 'groomer'
+
+
+def test_transient_errors_retry_the_batch(monkeypatch, capsys):
+    sleeps = []
+    monkeypatch.setattr(watch.time, 'sleep', sleeps.append)
+    attempts = []
+
+    def action():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise http_error(503) if len(attempts) == 1 else urllib.error.URLError('timed out')
+        return 'done'
+
+    assert guarded(action, 'batch of 2') == 'done'
+    assert len(attempts) == 3 and sleeps == [1, 2]
+    assert 'retrying in 1s' in capsys.readouterr().err
+
+
+def test_other_errors_skip_the_batch_without_stopping(monkeypatch, capsys):
+    monkeypatch.setattr(watch.time, 'sleep', lambda s: pytest.fail('no retry expected'))
+
+    def action():
+        raise http_error(400)
+
+    assert guarded(action, 'batch of 2') is None
+    assert 'batch of 2 failed, skipped: HTTPError' in capsys.readouterr().err
+
+
+def test_notification_after_an_enriched_address_changes_nothing(worker):
+    w = worker({'a': {'updated_at': 't1'}})
+    w.process_rows([Partner.from_row({'id': 'a', 'name': 'Bark N Bitches', 'partner_type': 'pet_retail',
+                                      'updated_at': 't1'})])
+    w.outbox.close(5)
+    written = w.client.rows['a']
+    assert written['address'] == '2406 Hyperion Ave, Los Angeles, CA 90027' and written['area']
+
+    # The address write notifies again; the re-read row needs nothing more
+    w.outbox = watch.Outbox(w.client, watch.outbox_path('watch'))
+    w.process_rows([Partner.from_row(dict(written, id='a', name='Bark N Bitches',
+                                          partner_type='pet_retail'))])
+    w.close(5)
+    assert w.stats['processed'] == 2 and w.stats['queued'] == 1
@@ -0,0 +1,32 @@
+import pytest
+
+from gdd_data.zipcodes import OUT_OF_AREA, extract_zip, zip_area
+
+
+@pytest.mark.parametrize('address, expected', [
+    ('1200 Abbot Kinney Blvd, Venice, CA 90291', ('CA', '90291')),
+    ('1200 Abbot Kinney Blvd, Venice, Ca. 90291-1234', ('CA', '90291')),
+    ('Sherman Oaks 91423', (None, '91423')),
+    ('12 Main St 90048 Suite 5', (None, None)),
+    ('', (None, None)),
+    (None, (None, None)),
+])
+def test_extract_zip(address, expected):
+    assert extract_zip(address) == expected
+
+
+@pytest.mark.parametrize('address, area', [
+    ('1200 Abbot Kinney Blvd, Venice, CA 90291', 'Westside & Coastal'),
+    ('Ventura Blvd, Sherman Oaks, CA 91423', 'South Valley'),
+    ('Pasadena 91101, USA', 'San Gabriel Valley'),
+    ('PCH, Redondo Beach, CA 90277', 'South Bay'),
+    # California outside LA County, and other states
+    ('Gaslamp, San Diego, CA 92101', OUT_OF_AREA),
+    ('Ventura, CA 93001', OUT_OF_AREA),
+    ('Las Vegas, NV 89101', OUT_OF_AREA),
+    # 935xx is partly LA County (Lancaster/Palmdale): left to the other rules
+    ('Lancaster, CA 93599', None),
+    ('No zip here, Los Angeles', None),
+])
+def test_zip_area(address, area):
+    assert zip_area(address) == area
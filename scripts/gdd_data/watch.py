@@ -0,0 +1,176 @@
+"""
+Change-driven partner classification
+====================================
+`gdd-data watch` is a long-running worker: it LISTENs on the
+'marketing_partner_changes' channel (migration 290 notifies with the partner
+id on insert and on edits to classification inputs) and categorizes, enriches
+and assigns areas to those partners within about a second.
+
+Rules, the classification cache, the enrichment provider and the zone
+polygons are loaded once at startup and stay warm. Bursts (an import, a bulk
+edit in the UI) are micro-batched: after the first notification the worker
+keeps collecting ids for --window seconds (or until --max-batch) and handles
+them with one fetch. Supabase errors never stop the worker: transient ones
+(timeouts, 5xx, dropped connections) are retried with backoff, anything else
+is logged and that batch skipped.
+
+Enrichment can fill in an address, which is also a trigger column (a new
+address may mean a new area), so those writes notify once more. The second
+pass is a no-op: blanks are already filled and the area was assigned from
+the same address in the first pass, so nothing is written and nothing loops.
+
+Needs DATABASE_URL (a direct Postgres connection; any local Postgres works
+for testing) plus the usual SUPABASE_URL/SUPABASE_SERVICE_ROLE_KEY for reads
+and writes, and psycopg 3.2+ (`pip install "psycopg[binary]"`).
+"""
+
+import re
+import sys
+import time
+
+from gdd_data.classify_cache import ClassificationCache
+from gdd_data.config import database_url, supabase_client
+from gdd_data.enrichment import Enricher, load_provider
+from gdd_data.geo import get_resolver
+from gdd_data.outbox import Outbox, outbox_path
+from gdd_data.partners import STAGES, classify_partner, lookup_batch, partner_query, reclassifier
+from gdd_data.postgrest import transient
+from gdd_data.records import Partner
+from gdd_data.rules import KNOWN_BUSINESS_DATA, classification_ruleset
+
+CHANNEL = 'marketing_partner_changes'
+_UUID_RE = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.IGNORECASE)
+
+
+def collect_batch(receive, window, max_batch, idle_timeout=5.0):
+    """
+    Block for the first notification, then gather more for up to `window`
+    seconds. `receive(timeout, limit)` returns a list of payloads (possibly
+    empty on timeout). Returns the set of ids (empty after an idle timeout).
+    """
+    ids = set(receive(idle_timeout, max_batch))
+    if not ids:
+        return ids
+    deadline = time.monotonic() + window
+    while len(ids) < max_batch:
+        left = deadline - time.monotonic()
+        if left <= 0:
+            break
+        ids.update(receive(left, max_batch - len(ids)))
+    return ids
+
+
+def guarded(action, what, max_backoff=60):
+    """
+    Run one batch's `action()`. Transient errors are retried with backoff
+    until they clear; any other error is logged and the batch skipped, so one
+    bad batch never stops the worker.
+    """
+    backoff = 1
+    while True:
+        try:
+            return action()
+        except Exception as e:
+            if not transient(e):
+                print(f"  ❌ {what} failed, skipped: {type(e).__name__}: {e}", file=sys.stderr)
+                return None
+            print(f"  ⚠️ {what} failed ({e}); retrying in {backoff}s", file=sys.stderr)
+            time.sleep(backoff)
+            backoff = min(backoff * 2, max_backoff)
+
+
+class Worker:
+    """Warm classification state shared by every batch."""
+
+    def __init__(self, client, provider='local', rate=5.0):
+        self.client = client
+        self.stages = list(STAGES)
+        self.columns, _ = partner_query(self.stages)
+        self.cache = ClassificationCache(classification_ruleset())
+        self.enricher = Enricher(load_provider(provider, KNOWN_BUSINESS_DATA), rate=rate)
+        get_resolver()
+        # Writes are queued durably and flushed in the background, so a slow
+        # Supabase never holds up the next batch
+        self.outbox = Outbox(client, outbox_path('watch'), on_stale=reclassifier(
+            client, self.columns, self.stages, self.cache, self.enricher, None))
+        self.stats = dict.fromkeys(('batches', 'processed', 'queued', 'categorized', 'enriched',
+                                    'areas'), 0)
+
+    def process(self, ids):
+        ids = sorted(i for i in ids if _UUID_RE.match(i))
+        if not ids:
+            return
+        start = time.perf_counter()
+        rows = self.client.select('marketing_partners', self.columns, [f"id=in.({','.join(ids)})"],
+                                  limit=len(ids))
+        self.process_rows([Partner.from_row(r) for r in rows])
+        print(f"  ⚡ batch of {len(ids)} handled in {1000 * (time.perf_counter() - start):.0f} ms")
+
+    def process_rows(self, partners):
+        self.stats['batches'] += 1
+        batch = lookup_batch(partners, self.stages, self.enricher, None)
+        queued = []
+        for p in partners:
+            self.stats['processed'] += 1
+            updates, changes = classify_partner(p, self.stages, self.cache, batch, self.stats)
+            if updates:
+                queued.append((p, updates, changes))
+        self.outbox.put_many(queued)
+        self.stats['queued'] += len(queued)
+
+    def catch_up(self):
+        """Classify area-less partners changed while no worker was listening."""
+        for rows in self.client.select_pages('marketing_partners', self.columns, ['area=is.null'],
+                                             page_size=500):
+            self.process_rows([Partner.from_row(r) for r in rows])
+
+    def close(self, flush_timeout=30):
+        """Flush what is queued (up to `flush_timeout` s), then release the warm state."""
+        outbox = self.outbox.close(flush_timeout)
+        self.stats.update(updated=outbox.get('done', 0), failed=outbox.get('failed', 0),
+                          pending=outbox['pending'])
+        self.cache.close()
+        self.enricher.close()
+
+
+def run(args):
+    try:
+        import psycopg
+    except ImportError:
+        print('❌ watch needs psycopg 3.2+: pip install "psycopg[binary]"', file=sys.stderr)
+        sys.exit(1)
+
+    dsn = database_url()
+    worker = Worker(supabase_client(), args.provider, args.rate)
+    print(f"👂 Rules loaded ({classification_ruleset()[:12]}); catching up on area-less partners...")
+    guarded(worker.catch_up, 'catch-up')
+
+    backoff = 1
+    try:
+        while True:
+            try:
+                with psycopg.connect(dsn, autocommit=True) as conn:
+                    conn.execute(f"LISTEN {CHANNEL}")
+                    print(f"👂 Listening on {CHANNEL} (window {args.window:g}s, max batch {args.max_batch})")
+                    backoff = 1
+
+                    def receive(timeout, limit):
+                        return [n.payload for n in conn.notifies(timeout=timeout, stop_after=limit)]
+
+                    while True:
+                        ids = collect_batch(receive, args.window, args.max_batch)
+                        if ids:
+                            guarded(lambda: worker.process(ids), f"batch of {len(ids)}")
+            except psycopg.OperationalError as e:
+                # Notifications sent while disconnected are lost; catch up after reconnecting
+                print(f"  ⚠️ Connection lost ({e}); reconnecting in {backoff}s", file=sys.stderr)
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 60)
+                guarded(worker.catch_up, 'catch-up')
+    except KeyboardInterrupt:
+        pass
+    finally:
+        worker.close()
+        s = worker.stats
+        print(f"\n  {s['batches']} batches, {s['processed']} partners, {s['updated']} updated, "
+              f"{s['failed']} failed, {s['pending']} still queued")
@@ -0,0 +1,66 @@
+"""
+ZIP code → area zone lookup
+===========================
+Most partner addresses end in "..., CA 90048". Pulling the ZIP out with one
+precompiled regex and looking it up in data/la_zip_zones.json resolves the
+common case (including addresses that only say "Los Angeles") without scanning
+neighborhood names.
+"""
+
+import json
+import os
+import re
+
+ZIP_ZONES_JSON = os.path.join(os.path.dirname(__file__), 'data', 'la_zip_zones.json')
+OUT_OF_AREA = 'Online/Remote/Out of Area'
+
+# "..., CA 90048" / ", CA 90048-1234" (the comma keeps "Main St 90048" out) ...
+_STATE_ZIP_RE = re.compile(r',\s*([a-z]{2})\.?\s+(\d{5})(?:-\d{4})?\b', re.IGNORECASE)
+# ... or a bare ZIP closing the address
+_TRAILING_ZIP_RE = re.compile(r'\b(\d{5})(?:-\d{4})?\s*(?:,?\s*(?:usa|united states))?\s*$',
+                              re.IGNORECASE)
+
+# 3-digit ZIP prefixes in California but outside LA County (SD, OC, Inland
+# Empire, Ventura and everything north)
+_OUT_OF_AREA_PREFIXES = frozenset(
+    ['919', '920', '921', '922', '923', '924', '925', '926', '927', '928']
+    + [str(p) for p in range(930, 962) if p != 935]
+)
+
+
+def _load_zip_zones(path=ZIP_ZONES_JSON):
+    with open(path) as f:
+        by_zone = json.load(f)
+    return {z: zone for zone, zips in by_zone.items() for z in zips}
+
+
+ZIP_ZONES = _load_zip_zones()
+
+
+def extract_zip(address):
+    """Return (state, zip) from the end of an address; state is None for a bare ZIP."""
+    if not address:
+        return None, None
+    matches = _STATE_ZIP_RE.findall(address)
+    if matches:
+        state, zip_code = matches[-1]
+        return state.upper(), zip_code
+    m = _TRAILING_ZIP_RE.search(address)
+    if m:
+        return None, m.group(1)
+    return None, None
+
+
+def zip_area(address):
+    """Area zone implied by the address ZIP, or None if there is no usable ZIP."""
+    state, zip_code = extract_zip(address)
+    if not zip_code:
+        return None
+    if state and state != 'CA':
+        return OUT_OF_AREA
+    zone = ZIP_ZONES.get(zip_code)
+    if zone:
+        return zone
+    if zip_code[:3] in _OUT_OF_AREA_PREFIXES:
+        return OUT_OF_AREA
+    return None
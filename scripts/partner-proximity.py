@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""
+Marketing partners nearest clinic & territory queries.
+Kept for existing callers; equivalent to `scripts/gdd-data proximity`.
+"""
+
+import sys
+
+from gdd_data.cli import main
+
+if __name__ == '__main__':
+    main(['proximity'] + sys.argv[1:])
@@ -0,0 +1,23 @@
+/**
+ * Suggest partner_type and area for a marketing partner being created/edited.
+ *
+ * POST /api/marketing/classify-partner
+ * Body: { name, services_provided?, notes?, category?, address?, proximity_to_location?, latitude?, longitude? }
+ * Returns: { partner_type, area } — both null when the classifier service
+ * (PARTNER_CLASSIFIER_URL, see scripts/gdd-data serve) is not available.
+ */
+import type { PartnerClassificationInput } from '../../utils/partnerClassifier'
+// Shared utils auto-imported from server/utils/:
+// requireRole, MARKETING_ROLES, classifyPartner
+
+export default defineEventHandler(async (event) => {
+  await requireRole(event, MARKETING_ROLES)
+
+  const body = await readBody<PartnerClassificationInput>(event)
+  if (!body?.name || typeof body.name !== 'string') {
+    throw createError({ statusCode: 400, message: 'name is required' })
+  }
+
+  const result = await classifyPartner(body)
+  return result ?? { partner_type: null, area: null }
+})
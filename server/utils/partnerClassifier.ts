@@ -0,0 +1,55 @@
+/**
+ * Partner Classifier — Server Utility
+ * ====================================
+ * Client for the local classification service (`scripts/gdd-data serve`),
+ * which runs the same categorize/area rules as the partner data scripts.
+ * Use it to pre-fill partner_type and area when a marketing partner is
+ * created, instead of waiting for the next batch run.
+ *
+ * Configure with PARTNER_CLASSIFIER_URL (e.g. http://127.0.0.1:8787).
+ * Unconfigured or unreachable → returns null; callers keep whatever the
+ * user entered and the worker/batch job classifies the row later.
+ */
+
+import { logger } from './logger'
+
+const TIMEOUT_MS = 1500
+
+export interface PartnerClassificationInput {
+  name: string
+  partner_type?: string | null
+  services_provided?: string | null
+  notes?: string | null
+  category?: string | null
+  address?: string | null
+  proximity_to_location?: string | null
+  latitude?: number | null
+  longitude?: number | null
+}
+
+export interface PartnerClassification {
+  partner_type: string | null
+  area: string | null
+}
+
+function baseUrl(): string | null {
+  const url = (useRuntimeConfig() as any).partnerClassifierUrl as string | undefined
+  return url ? url.replace(/\/$/, '') : null
+}
+
+/** Classify one partner; null when the service is not configured or fails. */
+export async function classifyPartner(input: PartnerClassificationInput): Promise<PartnerClassification | null> {
+  const base = baseUrl()
+  if (!base) return null
+  try {
+    return await $fetch<PartnerClassification>(`${base}/classify`, {
+      method: 'POST',
+      body: input,
+      timeout: TIMEOUT_MS,
+    })
+  } catch (err) {
+    logger.error('Partner classification failed', err as Error, 'partner-classifier')
+    return null
+  }
+}
+
@@ -0,0 +1,22 @@
+-- ============================================
+-- Migration 288: Marketing partner coordinates
+-- ============================================
+-- Adds latitude/longitude to marketing_partners (same shape as
+-- referral_partners in 279) so scripts/batch-geocode.ts can geocode them
+-- and scripts/partner-categorize-enrich.py can assign areas from the
+-- zone polygons instead of neighborhood substrings.
+
+ALTER TABLE public.marketing_partners
+  ADD COLUMN IF NOT EXISTS latitude NUMERIC,
+  ADD COLUMN IF NOT EXISTS longitude NUMERIC,
+  ADD COLUMN IF NOT EXISTS place_id TEXT,
+  ADD COLUMN IF NOT EXISTS geocoded_address TEXT;
+
+COMMENT ON COLUMN public.marketing_partners.latitude IS 'Google Maps latitude coordinate';
+COMMENT ON COLUMN public.marketing_partners.longitude IS 'Google Maps longitude coordinate';
+COMMENT ON COLUMN public.marketing_partners.place_id IS 'Google Places API place_id';
+COMMENT ON COLUMN public.marketing_partners.geocoded_address IS 'Formatted address returned by Google Geocoding API';
+
+CREATE INDEX IF NOT EXISTS idx_marketing_partners_coords
+  ON public.marketing_partners (latitude, longitude)
+  WHERE latitude IS NOT NULL;
@@ -0,0 +1,16 @@
+-- ============================================
+-- Migration 289: Nearest clinic for marketing partners
+-- ============================================
+-- Written by scripts/partner-proximity.py from partner coordinates (288)
+-- and clinic coordinates on locations (279). Lets territory planning
+-- filter partners by clinic and distance without recomputing.
+
+ALTER TABLE public.marketing_partners
+  ADD COLUMN IF NOT EXISTS nearest_location_id UUID REFERENCES public.locations(id) ON DELETE SET NULL,
+  ADD COLUMN IF NOT EXISTS nearest_location_miles NUMERIC(6,2);
+
+COMMENT ON COLUMN public.marketing_partners.nearest_location_id IS 'Closest clinic (locations.id) by great-circle distance';
+COMMENT ON COLUMN public.marketing_partners.nearest_location_miles IS 'Great-circle distance in miles to nearest_location_id';
+
+CREATE INDEX IF NOT EXISTS idx_marketing_partners_nearest_location
+  ON public.marketing_partners (nearest_location_id, nearest_location_miles);
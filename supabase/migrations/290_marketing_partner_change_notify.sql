@@ -0,0 +1,52 @@
+-- ============================================
+-- Migration 290: Notify on marketing partner changes
+-- ============================================
+-- Partners added or edited from the UI stay uncategorized/area-less until
+-- the classification job runs again. This trigger publishes the id of every
+-- inserted partner, and of every partner whose classification inputs
+-- changed, on the 'marketing_partner_changes' channel; the long-running
+-- `scripts/gdd-data watch` worker LISTENs there and classifies them within
+-- about a second.
+--
+-- partner_type, area and the website/social fields the worker writes are not
+-- inputs, so those writes do not notify again; clearing area does, to ask
+-- for a fresh assignment. address is both: a new address may mean a new
+-- area, so an address filled in by enrichment notifies once more. The worker
+-- then finds nothing left to change (the area was assigned from that same
+-- address) and writes nothing, so it does not loop.
+
+CREATE OR REPLACE FUNCTION notify_marketing_partner_change()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  PERFORM pg_notify('marketing_partner_changes', NEW.id::text);
+  RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_notify_marketing_partner_insert ON public.marketing_partners;
+DROP TRIGGER IF EXISTS trg_notify_marketing_partner_update ON public.marketing_partners;
+
+CREATE TRIGGER trg_notify_marketing_partner_insert
+  AFTER INSERT
+  ON public.marketing_partners
+  FOR EACH ROW
+  EXECUTE FUNCTION notify_marketing_partner_change();
+
+CREATE TRIGGER trg_notify_marketing_partner_update
+  AFTER UPDATE OF name, services_provided, notes, category, address, proximity_to_location, area
+  ON public.marketing_partners
+  FOR EACH ROW
+  WHEN (
+    OLD.name IS DISTINCT FROM NEW.name
+    OR OLD.services_provided IS DISTINCT FROM NEW.services_provided
+    OR OLD.notes IS DISTINCT FROM NEW.notes
+    OR OLD.category IS DISTINCT FROM NEW.category
+    OR OLD.address IS DISTINCT FROM NEW.address
+    OR OLD.proximity_to_location IS DISTINCT FROM NEW.proximity_to_location
+    OR (OLD.area IS NOT NULL AND NEW.area IS NULL)
+  )
+  EXECUTE FUNCTION notify_marketing_partner_change();
+
+COMMENT ON FUNCTION notify_marketing_partner_change() IS 'pg_notify(marketing_partner_changes, id) for partners that need (re)classification';
@@ -0,0 +1,46 @@
+-- ============================================
+-- Migration 291: Bulk conditional marketing partner updates
+-- ============================================
+-- The partner scripts queue their writes in a local outbox
+-- (scripts/gdd_data/outbox.py) and flush them in batches. Each change only
+-- applies if the row's updated_at is still the value it was computed from,
+-- so one PATCH per identical payload cannot express a batch. This function
+-- applies a whole batch in one statement:
+--
+--   SELECT * FROM apply_marketing_partner_updates('[
+--     {"id": "...", "updated_at": "...", "fields": {"area": "South Bay"}}
+--   ]');
+--
+-- Only the columns the scripts write are accepted; a column is changed only
+-- if its key is present in "fields". Returns the ids that were updated; ids
+-- missing from the result changed since they were read (or were deleted).
+
+CREATE OR REPLACE FUNCTION apply_marketing_partner_updates(changes jsonb)
+RETURNS SETOF uuid
+LANGUAGE sql
+SET search_path = public
+AS $$
+  UPDATE public.marketing_partners m SET
+    partner_type     = CASE WHEN c.fields ? 'partner_type'
+                            THEN (c.fields->>'partner_type')::marketing_partner_type ELSE m.partner_type END,
+    area             = CASE WHEN c.fields ? 'area' THEN c.fields->>'area' ELSE m.area END,
+    website          = CASE WHEN c.fields ? 'website' THEN c.fields->>'website' ELSE m.website END,
+    address          = CASE WHEN c.fields ? 'address' THEN c.fields->>'address' ELSE m.address END,
+    instagram_handle = CASE WHEN c.fields ? 'instagram_handle' THEN c.fields->>'instagram_handle' ELSE m.instagram_handle END,
+    facebook_url     = CASE WHEN c.fields ? 'facebook_url' THEN c.fields->>'facebook_url' ELSE m.facebook_url END,
+    tiktok_handle    = CASE WHEN c.fields ? 'tiktok_handle' THEN c.fields->>'tiktok_handle' ELSE m.tiktok_handle END,
+    youtube_url      = CASE WHEN c.fields ? 'youtube_url' THEN c.fields->>'youtube_url' ELSE m.youtube_url END,
+    latitude         = CASE WHEN c.fields ? 'latitude' THEN (c.fields->>'latitude')::numeric ELSE m.latitude END,
+    longitude        = CASE WHEN c.fields ? 'longitude' THEN (c.fields->>'longitude')::numeric ELSE m.longitude END,
+    place_id         = CASE WHEN c.fields ? 'place_id' THEN c.fields->>'place_id' ELSE m.place_id END,
+    geocoded_address = CASE WHEN c.fields ? 'geocoded_address' THEN c.fields->>'geocoded_address' ELSE m.geocoded_address END
+  FROM jsonb_to_recordset(changes) AS c(id uuid, updated_at timestamptz, fields jsonb)
+  WHERE m.id = c.id
+    AND m.updated_at IS NOT DISTINCT FROM c.updated_at
+  RETURNING m.id;
+$$;
+
+REVOKE EXECUTE ON FUNCTION apply_marketing_partner_updates(jsonb) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION apply_marketing_partner_updates(jsonb) TO service_role;
+
+COMMENT ON FUNCTION apply_marketing_partner_updates(jsonb) IS 'Apply a batch of marketing partner changes, each only if updated_at still matches; returns updated ids';
@@ -0,0 +1,23 @@
+-- ============================================
+-- Migration 292: Stable import key on med_contacts
+-- ============================================
+-- `scripts/gdd-data parse-contacts --delta` no longer regenerates the full
+-- seed for each new vendor workbook. It fingerprints every parsed record by
+-- vendor + contact + account and emits a delta migration with only the
+-- inserted, updated and removed rows. Those statements find their rows by
+-- import_key, because the data-quality fixes (20260303000006) rewrite
+-- contact columns in place, so the parsed values no longer match the rows.
+--
+-- Rows from the original seed get their key from the first delta migration
+-- (it backfills them by vendor/category/account/login/sub_label, which the
+-- fixes leave untouched). Rows added by hand keep a NULL key and are never
+-- touched by imports.
+
+ALTER TABLE public.med_contacts
+  ADD COLUMN IF NOT EXISTS import_key TEXT;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_med_contacts_import_key
+  ON public.med_contacts(import_key)
+  WHERE import_key IS NOT NULL;
+
+COMMENT ON COLUMN public.med_contacts.import_key IS 'Fingerprint of vendor + contact + account from the Med Contacts workbook import (NULL for manual rows)';
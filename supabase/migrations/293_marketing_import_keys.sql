@@ -0,0 +1,65 @@
+-- ============================================
+-- Migration 293: Import keys for the marketing CSV loader
+-- ============================================
+-- `scripts/gdd-data load` bulk-upserts the CSVs in data/marketing/parsed
+-- (on_conflict=import_key), so re-running a load updates rows in place
+-- instead of duplicating them. The key is the row's natural key,
+-- lowercased and whitespace-collapsed:
+--
+--   marketing_partners      name
+--   marketing_influencers   contact_name
+--   marketing_inventory     item_name
+--   marketing_events        name|event_date
+--
+-- Rows imported earlier by the TypeScript scripts get their key here, so the
+-- first load merges into them. Where several existing rows share a key only
+-- the oldest gets it; the others (and rows added in the app) keep a NULL key
+-- and are never touched by loads. NULLs do not conflict, so the unique index
+-- is not partial (PostgREST's on_conflict cannot target a partial index).
+
+CREATE OR REPLACE FUNCTION public.marketing_import_key(value text)
+RETURNS text
+LANGUAGE sql
+IMMUTABLE
+AS $$
+  SELECT lower(regexp_replace(btrim(value), '\s+', ' ', 'g'));
+$$;
+
+ALTER TABLE public.marketing_partners ADD COLUMN IF NOT EXISTS import_key TEXT;
+ALTER TABLE public.marketing_influencers ADD COLUMN IF NOT EXISTS import_key TEXT;
+ALTER TABLE public.marketing_inventory ADD COLUMN IF NOT EXISTS import_key TEXT;
+ALTER TABLE public.marketing_events ADD COLUMN IF NOT EXISTS import_key TEXT;
+
+UPDATE public.marketing_partners t SET import_key = k.key
+FROM (SELECT id, marketing_import_key(name) AS key,
+             row_number() OVER (PARTITION BY marketing_import_key(name) ORDER BY created_at, id) AS n
+      FROM public.marketing_partners) k
+WHERE t.id = k.id AND k.n = 1 AND t.import_key IS NULL;
+
+UPDATE public.marketing_influencers t SET import_key = k.key
+FROM (SELECT id, marketing_import_key(contact_name) AS key,
+             row_number() OVER (PARTITION BY marketing_import_key(contact_name) ORDER BY created_at, id) AS n
+      FROM public.marketing_influencers) k
+WHERE t.id = k.id AND k.n = 1 AND t.import_key IS NULL;
+
+UPDATE public.marketing_inventory t SET import_key = k.key
+FROM (SELECT id, marketing_import_key(item_name) AS key,
+             row_number() OVER (PARTITION BY marketing_import_key(item_name) ORDER BY created_at, id) AS n
+      FROM public.marketing_inventory) k
+WHERE t.id = k.id AND k.n = 1 AND t.import_key IS NULL;
+
+UPDATE public.marketing_events t SET import_key = k.key
+FROM (SELECT id, marketing_import_key(name) || '|' || event_date AS key,
+             row_number() OVER (PARTITION BY marketing_import_key(name), event_date ORDER BY created_at, id) AS n
+      FROM public.marketing_events) k
+WHERE t.id = k.id AND k.n = 1 AND t.import_key IS NULL;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_marketing_partners_import_key ON public.marketing_partners(import_key);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_marketing_influencers_import_key ON public.marketing_influencers(import_key);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_marketing_inventory_import_key ON public.marketing_inventory(import_key);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_marketing_events_import_key ON public.marketing_events(import_key);
+
+COMMENT ON COLUMN public.marketing_partners.import_key IS 'Normalized name; upsert key for gdd-data load (NULL for rows added in the app)';
+COMMENT ON COLUMN public.marketing_influencers.import_key IS 'Normalized contact_name; upsert key for gdd-data load (NULL for rows added in the app)';
+COMMENT ON COLUMN public.marketing_inventory.import_key IS 'Normalized item_name; upsert key for gdd-data load (NULL for rows added in the app)';
+COMMENT ON COLUMN public.marketing_events.import_key IS 'Normalized name|event_date; upsert key for gdd-data load (NULL for rows added in the app)';
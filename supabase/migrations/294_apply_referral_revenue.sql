@@ -0,0 +1,208 @@
+-- ============================================
+-- Migration 294: Bulk referral revenue import
+-- ============================================
+-- `scripts/gdd-data referrer-revenue` aggregates the EzyVet "Referrer
+-- Revenue" exports (data/Appointments/Referrer Revenue-*.xls) per referral
+-- partner and sends the whole result in one call:
+--
+--   SELECT apply_referral_revenue('[
+--     {"id": "...", "referrals": 12, "revenue": 3456.78,
+--      "last_referral_date": "2026-02-20", "divisions": ["Green Dog - Venice (BU)"]},
+--     {"id": null, "name": "New Clinic", "referrals": 1, ...}
+--   ]');
+--
+-- The exports cover all time, so like scripts/populate-referral-stats.mjs
+-- this replaces the stats wholesale: listed partners get their totals,
+-- entries without an id are created as new partners, and every other
+-- partner's stats are cleared. Tier, priority and relationship health are
+-- then recalculated, all in one transaction.
+--
+-- recalculate_partner_metrics() cannot be used for that last step: since
+-- migration 285 it first re-derives the totals from
+-- referral_revenue_line_items, which would overwrite the imported totals
+-- (and zero the partners created here, which have no ledger rows). Its
+-- bucket steps are split out into recalculate_partner_tiers(), which both
+-- functions call; recalculate_partner_metrics() behaves as before.
+
+CREATE OR REPLACE FUNCTION recalculate_partner_tiers()
+RETURNS void
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+  -- Step 1: Tier (revenue quintiles)
+  WITH tier_calc AS (
+    SELECT id, NTILE(5) OVER (ORDER BY COALESCE(total_revenue_all_time, 0) DESC) AS tier_bucket
+    FROM referral_partners
+  )
+  UPDATE referral_partners rp
+  SET tier = CASE tc.tier_bucket
+    WHEN 1 THEN 'Platinum'
+    WHEN 2 THEN 'Gold'
+    WHEN 3 THEN 'Silver'
+    WHEN 4 THEN 'Bronze'
+    WHEN 5 THEN 'Coal'
+  END
+  FROM tier_calc tc
+  WHERE rp.id = tc.id;
+
+  -- Step 2: Priority (referral-count quartiles)
+  WITH priority_calc AS (
+    SELECT id, NTILE(4) OVER (ORDER BY COALESCE(total_referrals_all_time, 0) DESC) AS priority_bucket
+    FROM referral_partners
+  )
+  UPDATE referral_partners rp
+  SET priority = CASE pc.priority_bucket
+    WHEN 1 THEN 'Very High'
+    WHEN 2 THEN 'High'
+    WHEN 3 THEN 'Medium'
+    WHEN 4 THEN 'Low'
+  END
+  FROM priority_calc pc
+  WHERE rp.id = pc.id;
+
+  -- Step 3: Visit tier and expected cadence
+  WITH visit_tier_calc AS (
+    SELECT id,
+      NTILE(3) OVER (
+        ORDER BY (COALESCE(total_revenue_all_time, 0) + COALESCE(total_referrals_all_time, 0) * 100) DESC
+      ) AS visit_bucket
+    FROM referral_partners
+  )
+  UPDATE referral_partners rp
+  SET
+    visit_tier = CASE vtc.visit_bucket WHEN 1 THEN 'High' WHEN 2 THEN 'Medium' WHEN 3 THEN 'Low' END,
+    expected_visit_frequency_days = CASE vtc.visit_bucket WHEN 1 THEN 60 WHEN 2 THEN 120 WHEN 3 THEN 180 END
+  FROM visit_tier_calc vtc
+  WHERE rp.id = vtc.id;
+
+  -- Step 4: Days since last visit + overdue
+  UPDATE referral_partners
+  SET
+    days_since_last_visit = CASE
+      WHEN last_visit_date IS NOT NULL THEN EXTRACT(DAY FROM (NOW() - last_visit_date::timestamp))::integer
+      ELSE NULL
+    END,
+    visit_overdue = CASE
+      WHEN last_visit_date IS NULL THEN TRUE
+      WHEN EXTRACT(DAY FROM (NOW() - last_visit_date::timestamp)) > COALESCE(expected_visit_frequency_days, 120) THEN TRUE
+      ELSE FALSE
+    END;
+
+  -- Step 5: Relationship health & status
+  UPDATE referral_partners
+  SET
+    relationship_health = (
+      CASE tier
+        WHEN 'Platinum' THEN 40 WHEN 'Gold' THEN 32 WHEN 'Silver' THEN 24
+        WHEN 'Bronze' THEN 16 WHEN 'Coal' THEN 8 ELSE 0
+      END
+      +
+      CASE priority
+        WHEN 'Very High' THEN 30 WHEN 'High' THEN 22 WHEN 'Medium' THEN 15 WHEN 'Low' THEN 8 ELSE 0
+      END
+      +
+      CASE
+        WHEN last_visit_date IS NULL THEN 0
+        WHEN days_since_last_visit <= COALESCE(expected_visit_frequency_days, 120) * 0.5 THEN 30
+        WHEN days_since_last_visit <= COALESCE(expected_visit_frequency_days, 120) THEN 20
+        WHEN days_since_last_visit <= COALESCE(expected_visit_frequency_days, 120) * 1.5 THEN 10
+        ELSE 0
+      END
+    ),
+    relationship_status = CASE
+      WHEN relationship_health >= 80 THEN 'Excellent'
+      WHEN relationship_health >= 60 THEN 'Good'
+      WHEN relationship_health >= 40 THEN 'Fair'
+      WHEN relationship_health >= 20 THEN 'Needs Attention'
+      ELSE 'At Risk'
+    END,
+    needs_followup = CASE
+      WHEN visit_overdue = TRUE THEN TRUE
+      WHEN relationship_health < 40 THEN TRUE
+      ELSE needs_followup
+    END;
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION recalculate_partner_tiers() FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION recalculate_partner_tiers() TO service_role;
+
+COMMENT ON FUNCTION recalculate_partner_tiers() IS 'Redistributes tier/priority/visit-tier and relationship health from the current partner totals (no ledger recompute)';
+
+CREATE OR REPLACE FUNCTION recalculate_partner_metrics()
+RETURNS SETOF referral_partners
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+  -- Step 0: Re-derive totals from the line-item ledger so every downstream
+  -- bucket calculation reflects the canonical source of truth.
+  PERFORM public.recompute_referral_partner_totals();
+
+  -- Steps 1-5: tier, priority, visit tier, overdue, relationship health
+  PERFORM recalculate_partner_tiers();
+
+  RETURN QUERY SELECT * FROM referral_partners ORDER BY name;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION apply_referral_revenue(stats jsonb)
+RETURNS jsonb
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  n_updated integer;
+  n_inserted integer;
+  n_cleared integer;
+BEGIN
+  CREATE TEMP TABLE _referral_revenue ON COMMIT DROP AS
+  SELECT * FROM jsonb_to_recordset(stats) AS s(
+    id uuid, name text, referrals integer, revenue numeric,
+    last_referral_date date, divisions text[]);
+
+  UPDATE referral_partners rp SET
+    total_referrals_all_time = s.referrals,
+    total_revenue_all_time = round(s.revenue, 2),
+    last_referral_date = s.last_referral_date,
+    referral_divisions = s.divisions,
+    last_sync_date = now(),
+    last_data_source = 'csv_upload'
+  FROM _referral_revenue s
+  WHERE rp.id = s.id;
+  GET DIAGNOSTICS n_updated = ROW_COUNT;
+
+  UPDATE referral_partners rp SET
+    total_referrals_all_time = 0,
+    total_revenue_all_time = 0,
+    last_referral_date = NULL,
+    referral_divisions = '{}',
+    last_sync_date = now(),
+    last_data_source = NULL
+  WHERE NOT EXISTS (SELECT 1 FROM _referral_revenue s WHERE s.id = rp.id)
+    AND (COALESCE(rp.total_referrals_all_time, 0) <> 0 OR COALESCE(rp.total_revenue_all_time, 0) <> 0);
+  GET DIAGNOSTICS n_cleared = ROW_COUNT;
+
+  INSERT INTO referral_partners (name, status, total_referrals_all_time, total_revenue_all_time,
+                                 last_referral_date, referral_divisions, last_sync_date, last_data_source)
+  SELECT s.name, 'active', s.referrals, round(s.revenue, 2), s.last_referral_date, s.divisions,
+         now(), 'csv_upload'
+  FROM _referral_revenue s
+  WHERE s.id IS NULL;
+  GET DIAGNOSTICS n_inserted = ROW_COUNT;
+
+  -- Not recalculate_partner_metrics(): its ledger recompute would overwrite these totals
+  PERFORM recalculate_partner_tiers();
+
+  RETURN jsonb_build_object('updated', n_updated, 'inserted', n_inserted, 'cleared', n_cleared);
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION apply_referral_revenue(jsonb) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION apply_referral_revenue(jsonb) TO service_role;
+
+COMMENT ON FUNCTION apply_referral_revenue(jsonb) IS 'Replace referral partner revenue stats from the Referrer Revenue exports in one call, then recalculate partner tiers';
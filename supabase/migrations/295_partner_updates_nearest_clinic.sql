@@ -0,0 +1,43 @@
+-- ============================================
+-- Migration 295: Nearest clinic in bulk partner updates
+-- ============================================
+-- `scripts/gdd-data proximity` writes nearest_location_id /
+-- nearest_location_miles (289) for every geocoded partner. It now queues
+-- them through the partner outbox like the other partner scripts, so
+-- apply_marketing_partner_updates() (291) learns those two columns.
+-- Unknown keys in "fields" are ignored, so this must be applied before the
+-- script is run against a database.
+
+CREATE OR REPLACE FUNCTION apply_marketing_partner_updates(changes jsonb)
+RETURNS SETOF uuid
+LANGUAGE sql
+SET search_path = public
+AS $$
+  UPDATE public.marketing_partners m SET
+    partner_type     = CASE WHEN c.fields ? 'partner_type'
+                            THEN (c.fields->>'partner_type')::marketing_partner_type ELSE m.partner_type END,
+    area             = CASE WHEN c.fields ? 'area' THEN c.fields->>'area' ELSE m.area END,
+    website          = CASE WHEN c.fields ? 'website' THEN c.fields->>'website' ELSE m.website END,
+    address          = CASE WHEN c.fields ? 'address' THEN c.fields->>'address' ELSE m.address END,
+    instagram_handle = CASE WHEN c.fields ? 'instagram_handle' THEN c.fields->>'instagram_handle' ELSE m.instagram_handle END,
+    facebook_url     = CASE WHEN c.fields ? 'facebook_url' THEN c.fields->>'facebook_url' ELSE m.facebook_url END,
+    tiktok_handle    = CASE WHEN c.fields ? 'tiktok_handle' THEN c.fields->>'tiktok_handle' ELSE m.tiktok_handle END,
+    youtube_url      = CASE WHEN c.fields ? 'youtube_url' THEN c.fields->>'youtube_url' ELSE m.youtube_url END,
+    latitude         = CASE WHEN c.fields ? 'latitude' THEN (c.fields->>'latitude')::numeric ELSE m.latitude END,
+    longitude        = CASE WHEN c.fields ? 'longitude' THEN (c.fields->>'longitude')::numeric ELSE m.longitude END,
+    place_id         = CASE WHEN c.fields ? 'place_id' THEN c.fields->>'place_id' ELSE m.place_id END,
+    geocoded_address = CASE WHEN c.fields ? 'geocoded_address' THEN c.fields->>'geocoded_address' ELSE m.geocoded_address END,
+    nearest_location_id    = CASE WHEN c.fields ? 'nearest_location_id'
+                                  THEN (c.fields->>'nearest_location_id')::uuid ELSE m.nearest_location_id END,
+    nearest_location_miles = CASE WHEN c.fields ? 'nearest_location_miles'
+                                  THEN (c.fields->>'nearest_location_miles')::numeric ELSE m.nearest_location_miles END
+  FROM jsonb_to_recordset(changes) AS c(id uuid, updated_at timestamptz, fields jsonb)
+  WHERE m.id = c.id
+    AND m.updated_at IS NOT DISTINCT FROM c.updated_at
+  RETURNING m.id;
+$$;
+
+REVOKE EXECUTE ON FUNCTION apply_marketing_partner_updates(jsonb) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION apply_marketing_partner_updates(jsonb) TO service_role;
+
+COMMENT ON FUNCTION apply_marketing_partner_updates(jsonb) IS 'Apply a batch of marketing partner changes (incl. nearest clinic), each only if updated_at still matches; returns updated ids';